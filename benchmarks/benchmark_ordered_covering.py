@@ -0,0 +1,101 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Reports the time taken to minimise synthetic routing tables by Ordered
+Covering, how many entries are left and whether that fits in a router.
+
+Run as::
+
+    python benchmarks/benchmark_ordered_covering.py [n_entries] ...
+
+Sizes default to 1,000 up to 100,000 entries; each table is given at most
+60 seconds.
+"""
+import random
+import sys
+import time
+from spinn_utilities.config_holder import set_config
+from spinn_machine import MulticastRoutingEntry, MulticastRoutingTable, Router
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.data import MachineDataView
+from spinn_machine.ordered_covering import minimise_table
+
+DEFAULT_SIZES = [1000, 10000, 30000, 100000]
+TIME_LIMIT = 60.0
+N_ROUTES = 8
+
+
+def random_table(rand: random.Random, n_entries: int, n_routes: int,
+                 x: int = 0, y: int = 0) -> MulticastRoutingTable:
+    """
+    Makes an orthogonal table like those made for populations of vertices;
+    each vertex has a block of 16 keys, the vertices of a population have
+    consecutive blocks and mostly share a route.
+
+    Also used by the unit tests of Ordered Covering.
+
+    :param ~random.Random rand:
+    :param int n_entries:
+    :param int n_routes: The number of different routes, each to one link
+        or processor
+    :param int x: The x-coordinate of the chip of the table
+    :param int y: The y-coordinate of the chip of the table
+    :rtype: MulticastRoutingTable
+    """
+    entries = []
+    vertex = 0
+    while len(entries) < n_entries:
+        size = min(rand.choice([8, 16, 32, 64]), n_entries - len(entries))
+        route = 1 << rand.randrange(n_routes)
+        for block in range(vertex, vertex + size):
+            vertex_route = route
+            if rand.random() < 0.05:
+                vertex_route = 1 << rand.randrange(n_routes)
+            entries.append(MulticastRoutingEntry(
+                block << 4, 0xFFFFFFF0, spinnaker_route=vertex_route))
+        # Populations start on a multiple of 64 vertices
+        vertex = (vertex + size + 63) // 64 * 64
+    rand.shuffle(entries)
+    return MulticastRoutingTable(x, y, entries)
+
+
+def benchmark(n_entries: int):
+    """
+    Minimises a synthetic table and prints the entries before and after,
+    how long it took and whether the result fits in a router.
+
+    :param int n_entries:
+    """
+    router = Router(
+        [], MachineDataView.get_machine_version().n_router_entries)
+    table = random_table(random.Random(0), n_entries, N_ROUTES)
+    start = time.perf_counter()
+    minimised = minimise_table(table, time_limit=TIME_LIMIT)
+    elapsed = time.perf_counter() - start
+    fits = "fits" if minimised.fits(router) else "does not fit"
+    print(f"{len(table):>8} entries -> {len(minimised):>8} entries "
+          f"{elapsed:8.3f} s, {fits} in "
+          f"{router.n_available_multicast_entries}")
+
+
+def main(args):
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    sizes = [int(arg) for arg in args] if args else DEFAULT_SIZES
+    for n_entries in sizes:
+        benchmark(n_entries)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
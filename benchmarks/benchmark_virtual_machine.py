@@ -0,0 +1,81 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Reports the time and peak memory taken to build virtual machines.
+
+Run as::
+
+    python benchmarks/benchmark_virtual_machine.py [--no-gc] [width height] ...
+
+Sizes default to a single board up to the 1,000,000 core machine.
+With ``--no-gc`` the garbage collector is disabled while the benchmark runs,
+to show how much of the time is spent collecting.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from spinn_utilities.config_holder import set_config
+from spinn_machine import virtual_machine
+from spinn_machine.config_setup import unittest_setup
+
+DEFAULT_SIZES = [(8, 8), (48, 48), (96, 96), (240, 240)]
+
+
+def benchmark(width: int, height: int, **kwargs):
+    """
+    Builds a virtual machine and prints how long it took and the peak
+    memory used.
+
+    The time and memory are measured by separate builds as tracing the
+    memory slows the build down.
+
+    :param int width:
+    :param int height:
+    :param kwargs: Passed on to virtual_machine
+    """
+    start = time.perf_counter()
+    machine = virtual_machine(width, height, validate=False, **kwargs)
+    elapsed = time.perf_counter() - start
+    del machine
+
+    tracemalloc.start()
+    machine = virtual_machine(width, height, validate=False, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    options = ",".join(key for key, value in kwargs.items() if value)
+    print(f"{width:>4} x {height:<4} {options:<8} {machine.n_chips:>7} chips "
+          f"{machine.total_cores:>8} cores {elapsed:8.3f} s "
+          f"{peak / 1024 / 1024:9.1f} MiB peak")
+
+
+def main(args):
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    if "--no-gc" in args:
+        args = [arg for arg in args if arg != "--no-gc"]
+        gc.disable()
+    if args:
+        values = [int(arg) for arg in args]
+        sizes = list(zip(values[::2], values[1::2]))
+    else:
+        sizes = DEFAULT_SIZES
+    for width, height in sizes:
+        benchmark(width, height)
+        benchmark(width, height, dense=True)
+        benchmark(width, height, lazy=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -77,18 +77,26 @@ from spinn_machine._version import __version_month__  # NOQA
 from spinn_machine._version import __version_year__  # NOQA
 
 from .chip import Chip
+from .compact_router import CompactRouter
 from .core_subset import CoreSubset
 from .core_subsets import CoreSubsets
+from .core_subsets_bitmap import CoreSubsetsBitmap
 from .frozen_core_subsets import FrozenCoreSubsets
+from .frozen_multicast_routing_table import FrozenMulticastRoutingTable
 from .link import Link
 from .machine import Machine
 from .multicast_routing_entry import MulticastRoutingEntry
+from .multicast_routing_table import (
+    MulticastRoutingTable, MulticastRoutingTables)
 from .router import Router
 from .spinnaker_triad_geometry import SpiNNakerTriadGeometry
 from .virtual_machine import virtual_machine
 from .fixed_route_entry import FixedRouteEntry
 
 
-__all__ = ["Chip", "CoreSubset", "CoreSubsets", "FixedRouteEntry",
-           "FrozenCoreSubsets", "Link", "Machine", "MulticastRoutingEntry",
-           "Router", "SpiNNakerTriadGeometry", "virtual_machine"]
+__all__ = ["Chip", "CompactRouter", "CoreSubset", "CoreSubsets",
+           "CoreSubsetsBitmap", "FixedRouteEntry", "FrozenCoreSubsets",
+           "FrozenMulticastRoutingTable", "Link", "Machine",
+           "MulticastRoutingEntry", "MulticastRoutingTable",
+           "MulticastRoutingTables", "Router", "SpiNNakerTriadGeometry",
+           "virtual_machine"]
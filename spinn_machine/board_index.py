@@ -0,0 +1,191 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Callable, Dict, Iterable, Set
+from spinn_utilities.typing.coords import XY
+
+
+class _Board(object):
+    """
+    What is known about one board of a machine.
+    """
+
+    __slots__ = (
+        # The potential (x, y)s of the board with no chip
+        "down",
+        # The total number of processors of the chips on the board
+        "n_cores",
+        # The (x, y) of every potential chip on the board
+        "potential",
+        # The total SDRAM of the chips on the board
+        "sdram",
+        # The (x, y)s of the chips on the board in the order added
+        "xys")
+
+    def __init__(self, potential: Set[XY]):
+        self.down = set(potential)
+        self.n_cores = 0
+        self.potential = potential
+        self.sdram = 0
+        self.xys: Dict[XY, None] = dict()
+
+
+class BoardIndex(object):
+    """
+    The chips of a machine grouped by board, kept up to date as chips are
+    added and removed so board level questions are answered without
+    looking at every chip.
+
+    A chip is on the board of its nearest Ethernet chip.
+    Chips that are not at one of the potential positions of that board,
+    as given by :py:meth:`~spinn_machine.Machine.get_xys_by_ethernet`,
+    are not indexed.
+    """
+
+    __slots__ = (
+        # The boards by the (x, y) of their Ethernet chip
+        "_boards",
+        # The machine's get_xys_by_ethernet
+        "_get_xys_by_ethernet",
+        # The Ethernet (x, y) of each potential (x, y) of the boards
+        # whose Ethernet chip exists
+        "_ethernet_of")
+
+    def __init__(
+            self, get_xys_by_ethernet: Callable[[int, int], Iterable[XY]]):
+        """
+        :param get_xys_by_ethernet:
+            The machine's
+            :py:meth:`~spinn_machine.Machine.get_xys_by_ethernet`
+        """
+        self._boards: Dict[XY, _Board] = dict()
+        self._get_xys_by_ethernet = get_xys_by_ethernet
+        self._ethernet_of: Dict[XY, XY] = dict()
+
+    def _new_board(self, ethernet: XY) -> _Board:
+        board = _Board(set(self._get_xys_by_ethernet(*ethernet)))
+        self._boards[ethernet] = board
+        return board
+
+    def add(self, xy: XY, ethernet: XY, n_cores: int, sdram: int):
+        """
+        Record that a chip has been added.
+
+        :param tuple(int,int) xy: The (x, y) of the chip
+        :param tuple(int,int) ethernet: The (x, y) of its nearest Ethernet
+        :param int n_cores: The number of processors of the chip
+        :param int sdram: The SDRAM of the chip
+        """
+        board = self._boards.get(ethernet)
+        if board is None:
+            board = self._new_board(ethernet)
+        if xy not in board.potential:
+            return
+        board.xys[xy] = None
+        board.down.discard(xy)
+        board.n_cores += n_cores
+        board.sdram += sdram
+        if xy == ethernet:
+            for board_xy in board.potential:
+                self._ethernet_of[board_xy] = ethernet
+
+    def remove(self, xy: XY, ethernet: XY, n_cores: int, sdram: int):
+        """
+        Record that a chip has been removed.
+
+        :param tuple(int,int) xy: The (x, y) of the chip
+        :param tuple(int,int) ethernet: The (x, y) of its nearest Ethernet
+        :param int n_cores: The number of processors of the chip
+        :param int sdram: The SDRAM of the chip
+        """
+        board = self._boards.get(ethernet)
+        if board is None or xy not in board.xys:
+            return
+        del board.xys[xy]
+        board.down.add(xy)
+        board.n_cores -= n_cores
+        board.sdram -= sdram
+        if xy == ethernet:
+            for board_xy in board.potential:
+                if self._ethernet_of.get(board_xy) == ethernet:
+                    del self._ethernet_of[board_xy]
+
+    def existing_xys(self, ethernet: XY) -> Iterable[XY]:
+        """
+        The (x, y)s of the chips on a board, in the order they were added.
+
+        A copy is returned so chips can be removed while going through it.
+
+        :param tuple(int,int) ethernet: The (x, y) of the Ethernet chip
+        :rtype: tuple(tuple(int,int))
+        """
+        board = self._boards.get(ethernet)
+        if board is None:
+            return ()
+        return tuple(board.xys)
+
+    def down_xys(self, ethernet: XY) -> Iterable[XY]:
+        """
+        The potential (x, y)s of a board that have no chip.
+
+        A copy is returned so chips can be added or removed while going
+        through it.
+
+        :param tuple(int,int) ethernet: The (x, y) of the Ethernet chip
+        :rtype: tuple(tuple(int,int))
+        """
+        board = self._boards.get(ethernet)
+        if board is None:
+            return tuple(self._get_xys_by_ethernet(*ethernet))
+        return tuple(board.down)
+
+    def n_chips(self, ethernet: XY) -> int:
+        """
+        The number of chips on a board.
+
+        :param tuple(int,int) ethernet: The (x, y) of the Ethernet chip
+        :rtype: int
+        """
+        board = self._boards.get(ethernet)
+        return 0 if board is None else len(board.xys)
+
+    def n_cores(self, ethernet: XY) -> int:
+        """
+        The total number of processors of the chips on a board.
+
+        :param tuple(int,int) ethernet: The (x, y) of the Ethernet chip
+        :rtype: int
+        """
+        board = self._boards.get(ethernet)
+        return 0 if board is None else board.n_cores
+
+    def sdram(self, ethernet: XY) -> int:
+        """
+        The total SDRAM of the chips on a board.
+
+        :param tuple(int,int) ethernet: The (x, y) of the Ethernet chip
+        :rtype: int
+        """
+        board = self._boards.get(ethernet)
+        return 0 if board is None else board.sdram
+
+    def is_on_board(self, xy: XY) -> bool:
+        """
+        Determine if an (x, y) is a potential position of a board whose
+        Ethernet chip exists.
+
+        :param tuple(int,int) xy:
+        :rtype: bool
+        """
+        return xy in self._ethernet_of
@@ -0,0 +1,156 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Dict, List, Mapping, Optional, Tuple
+from spinn_utilities.typing.coords import XY
+from .machine import Machine
+from .router import Router
+
+_Key = Tuple[Tuple[XY, int], ...]
+
+
+class BoardTemplate(object):
+    """
+    The layout of a standard board, worked out once and shared by all the
+    boards of a machine.
+
+    Chips are indexed in the order of the ``chip_core_map`` the template is
+    built from, which is also the order
+    :py:meth:`~spinn_machine.Machine.get_xy_cores_by_ethernet` yields them.
+
+    For each chip and link the template records which chip of the same
+    board the link goes to, so only links that leave the board need to be
+    worked out using :py:meth:`~spinn_machine.Machine.xy_over_link`.
+    """
+
+    __slots__ = (
+        # The local index of each local (x, y)
+        "_index",
+        # The local (x, y) of each chip
+        "_local_xys",
+        # The typical number of cores of each chip
+        "_n_cores",
+        # For each chip the local index of the chip over each link,
+        # or -1 if the link leaves the board
+        "_neighbours")
+
+    # Templates already built keyed by the chip core map contents
+    _TEMPLATES: Dict[_Key, BoardTemplate] = dict()
+
+    def __init__(self, chip_core_map: Mapping[XY, int]):
+        """
+        :param dict((int, int), int) chip_core_map:
+            map of the local (x, y) of each chip on a board to its
+            typical number of cores
+        """
+        self._local_xys: List[XY] = list(chip_core_map.keys())
+        self._n_cores: List[int] = list(chip_core_map.values())
+        self._index: Dict[XY, int] = {
+            xy: index for index, xy in enumerate(self._local_xys)}
+        self._neighbours: List[Tuple[int, ...]] = [
+            tuple(self._index.get((x + add_x, y + add_y), -1)
+                  for add_x, add_y in Machine.LINK_ADD_TABLE)
+            for (x, y) in self._local_xys]
+
+    @classmethod
+    def for_chip_core_map(
+            cls, chip_core_map: Mapping[XY, int]) -> BoardTemplate:
+        """
+        Get the (possibly shared) template for a chip core map.
+
+        :param dict((int, int), int) chip_core_map:
+        :rtype: BoardTemplate
+        """
+        key = tuple(chip_core_map.items())
+        template = cls._TEMPLATES.get(key)
+        if template is None:
+            template = BoardTemplate(chip_core_map)
+            cls._TEMPLATES[key] = template
+        return template
+
+    def __len__(self) -> int:
+        """
+        The number of chips on the board.
+
+        :rtype: int
+        """
+        return len(self._local_xys)
+
+    @property
+    def local_xys(self) -> List[XY]:
+        """
+        The local (x, y) of each chip on the board, in index order.
+
+        :rtype: list(tuple(int,int))
+        """
+        return self._local_xys
+
+    @property
+    def n_cores(self) -> List[int]:
+        """
+        The typical number of cores of each chip, in index order.
+
+        :rtype: list(int)
+        """
+        return self._n_cores
+
+    def local_index(self, local_x: int, local_y: int) -> Optional[int]:
+        """
+        Get the index of a chip from its local coordinates.
+
+        :param int local_x:
+        :param int local_y:
+        :return: The index or None if there is no such chip on a board
+        :rtype: int or None
+        """
+        return self._index.get((local_x, local_y))
+
+    def board_xys(self, machine: Machine, ethernet_x: int,
+                  ethernet_y: int) -> List[XY]:
+        """
+        The global (x, y) of each chip of a board, in index order.
+
+        :param Machine machine: The machine the board is part of
+        :param int ethernet_x: The x of the Ethernet chip of the board
+        :param int ethernet_y: The y of the Ethernet chip of the board
+        :rtype: list(tuple(int,int))
+        """
+        return [xy for xy, _ in machine.get_xy_cores_by_ethernet(
+            ethernet_x, ethernet_y)]
+
+    def link_destinations(
+            self, machine: Machine, board_xys: List[XY], index: int
+            ) -> List[XY]:
+        """
+        Get the global (x, y) reached over each link of a chip.
+
+        Links to chips on the same board are looked up in board_xys;
+        only links leaving the board are computed by the machine.
+
+        :param Machine machine: The machine the board is part of
+        :param list(tuple(int,int)) board_xys:
+            The result of :py:meth:`board_xys` for the board
+        :param int index: The index of the chip on the board
+        :return: The destination of each link ID in turn
+        :rtype: list(tuple(int,int))
+        """
+        x, y = board_xys[index]
+        destinations: List[XY] = []
+        for link_id in range(Router.MAX_LINKS_PER_ROUTER):
+            neighbour = self._neighbours[index][link_id]
+            if neighbour >= 0:
+                destinations.append(board_xys[neighbour])
+            else:
+                destinations.append(machine.xy_over_link(x, y, link_id))
+        return destinations
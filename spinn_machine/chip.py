@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import (Collection, Iterable, Iterator, Optional, Tuple)
+from typing import (Collection, Dict, Iterable, Iterator, Optional, Tuple)
 
 from spinn_utilities.ordered_set import OrderedSet
 from spinn_utilities.typing.coords import XY
@@ -29,6 +29,9 @@ class Chip(XY):
     # tag 0 is reserved for stuff like IO STD
     _IPTAG_IDS = OrderedSet(range(1, 8))
 
+    # Processor id tuples shared by all chips with the same range of ids
+    _PROCESSOR_RANGES: Dict[Tuple[int, int], Tuple[int, ...]] = dict()
+
     def __new__(cls, x: int, y: int, n_processors: int, router: Router,
                 sdram: int, nearest_ethernet_x: int, nearest_ethernet_y: int,
                 ip_address: Optional[str] = None,
@@ -80,10 +83,10 @@ class Chip(XY):
             ``processor_id``
         """
         # X and Y set by new
-        self._scamp_processors = tuple(range(
-                    MachineDataView.get_machine_version().n_scamp_cores))
+        n_monitors = MachineDataView.get_machine_version().n_scamp_cores
+        self._scamp_processors = self.__processor_range(0, n_monitors)
         self._placable_processors = self.__generate_processors(
-            n_processors, down_cores)
+            n_monitors, n_processors, down_cores)
         self._router = router
         self._sdram = sdram
         self._ip_address = ip_address
@@ -98,12 +101,19 @@ class Chip(XY):
         self._parent_link = parent_link
         self._v_to_p_map = v_to_p_map
 
+    @classmethod
+    def __processor_range(cls, start: int, stop: int) -> Tuple[int, ...]:
+        processors = cls._PROCESSOR_RANGES.get((start, stop))
+        if processors is None:
+            processors = tuple(range(start, stop))
+            cls._PROCESSOR_RANGES[start, stop] = processors
+        return processors
+
     def __generate_processors(
-            self, n_processors: int,
+            self, n_monitors: int, n_processors: int,
             down_cores: Optional[Collection[int]]) -> Tuple[int, ...]:
-        n_monitors = MachineDataView.get_machine_version().n_scamp_cores
-        if down_cores is None:
-            return tuple(range(n_monitors, n_processors))
+        if not down_cores:
+            return self.__processor_range(n_monitors, n_processors)
         else:
             processors = list()
             for i in range(n_monitors):
@@ -0,0 +1,147 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Callable, Dict, Iterator, Optional, Tuple
+from spinn_utilities.overrides import overrides
+from spinn_utilities.typing.coords import XY
+from .exceptions import (
+    SpinnMachineAlreadyExistsException, SpinnMachineException)
+from .link import Link
+from .router import LINK_MASK_COUNTS, Router
+
+
+class CompactRouter(Router):
+    """
+    A router that only holds a bit for each link, and creates the
+    :py:class:`Link` objects when asked for them.
+
+    Adding a link makes it hold the links as a :py:class:`Router` does.
+    """
+
+    __slots__ = (
+        # Bit n set if link n exists, while compact
+        "_link_mask",
+        # The x-coordinate of the chip of the router
+        "_source_x",
+        # The y-coordinate of the chip of the router
+        "_source_y",
+        # Function to get the (x, y) over a link, or None once not compact
+        "_xy_over_link")
+
+    def __init__(
+            self, source_x: int, source_y: int, link_mask: int,
+            n_available_multicast_entries: int,
+            xy_over_link: Callable[[int, int, int], XY]):
+        """
+        :param int source_x: The x-coordinate of the chip of the router
+        :param int source_y: The y-coordinate of the chip of the router
+        :param int link_mask: Bit n is set if link n exists
+        :param int n_available_multicast_entries:
+            The number of entries available in the routing table
+        :param xy_over_link: Function to get the destination of a link,
+            normally :py:meth:`~spinn_machine.Machine.xy_over_link`
+        """
+        super().__init__([], n_available_multicast_entries)
+        self._link_mask = link_mask
+        self._source_x = source_x
+        self._source_y = source_y
+        self._xy_over_link: Optional[
+            Callable[[int, int, int], XY]] = xy_over_link
+
+    @property
+    @overrides(Router.is_compact)
+    def is_compact(self) -> bool:
+        return self._xy_over_link is not None
+
+    @property
+    @overrides(Router.link_mask)
+    def link_mask(self) -> int:
+        if self._xy_over_link is None:
+            return super().link_mask
+        return self._link_mask
+
+    def _make_link(self, link_id: int) -> Link:
+        assert self._xy_over_link is not None
+        destination_x, destination_y = self._xy_over_link(
+            self._source_x, self._source_y, link_id)
+        return Link(self._source_x, self._source_y, link_id,
+                    destination_x, destination_y)
+
+    def _link_dict(self) -> Dict[int, Link]:
+        if self._xy_over_link is None:
+            return self._links
+        return {
+            link_id: self._make_link(link_id)
+            for link_id in range(Router.MAX_LINKS_PER_ROUTER)
+            if (self._link_mask >> link_id) & 1}
+
+    @overrides(Router.add_link)
+    def add_link(self, link: Link):
+        if self._xy_over_link is not None:
+            if self.is_link(link.source_link_id):
+                raise SpinnMachineAlreadyExistsException(
+                    "link", str(link.source_link_id))
+            self._links = self._link_dict()
+            self._xy_over_link = None
+        super().add_link(link)
+
+    @overrides(Router.remove_link)
+    def remove_link(self, source_link_id: int) -> Link:
+        if self._xy_over_link is None:
+            return super().remove_link(source_link_id)
+        link = self.get_link(source_link_id)
+        if link is None:
+            raise SpinnMachineException(
+                f"There is no link {source_link_id} to remove")
+        self._link_mask &= ~(1 << source_link_id)
+        return link
+
+    @overrides(Router.is_link)
+    def is_link(self, source_link_id: int) -> bool:
+        if self._xy_over_link is None:
+            return super().is_link(source_link_id)
+        return (0 <= source_link_id < Router.MAX_LINKS_PER_ROUTER and
+                (self._link_mask >> source_link_id) & 1 == 1)
+
+    @overrides(Router.get_link)
+    def get_link(self, source_link_id: int) -> Optional[Link]:
+        if self._xy_over_link is None:
+            return super().get_link(source_link_id)
+        if self.is_link(source_link_id):
+            return self._make_link(source_link_id)
+        return None
+
+    @overrides(Router.get_destination)
+    def get_destination(self, source_link_id: int) -> Optional[XY]:
+        if self._xy_over_link is None:
+            return super().get_destination(source_link_id)
+        if self.is_link(source_link_id):
+            return self._xy_over_link(
+                self._source_x, self._source_y, source_link_id)
+        return None
+
+    @property
+    @overrides(Router.links)
+    def links(self) -> Iterator[Link]:
+        return iter(self._link_dict().values())
+
+    @overrides(Router.__iter__)
+    def __iter__(self) -> Iterator[Tuple[int, Link]]:
+        return iter(self._link_dict().items())
+
+    @overrides(Router.__len__)
+    def __len__(self) -> int:
+        if self._xy_over_link is None:
+            return super().__len__()
+        return LINK_MASK_COUNTS[self._link_mask]
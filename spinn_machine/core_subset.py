@@ -32,9 +32,7 @@ class CoreSubset(object):
         """
         self._x = x
         self._y = y
-        self._processor_ids: OrderedSet[int] = OrderedSet()
-        for processor_id in processor_ids:
-            self.add_processor(processor_id)
+        self._processor_ids: OrderedSet[int] = OrderedSet(processor_ids)
 
     def add_processor(self, processor_id: int):
         """
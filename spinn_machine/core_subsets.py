@@ -11,7 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Iterable, Iterator, Union
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, Mapping, Union
+import numpy
+from numpy.typing import ArrayLike
 from spinn_utilities.typing.coords import XY, XYP
 from .core_subset import CoreSubset
 
@@ -33,16 +36,78 @@ class CoreSubsets(object):
         for core_subset in core_subsets:
             self.add_core_subset(core_subset)
 
+    @classmethod
+    def from_chip_cores_map(
+            cls, chip_cores: Mapping[XY, Iterable[int]]) -> CoreSubsets:
+        """
+        Create core subsets from the processor IDs of each chip.
+
+        :param chip_cores: The processor IDs by the (x, y) of each chip
+        :type chip_cores: dict(tuple(int,int), iterable(int))
+        :rtype: CoreSubsets
+        """
+        core_subsets = cls()
+        # pylint: disable=protected-access
+        for (x, y), processor_ids in chip_cores.items():
+            core_subset = CoreSubset(x, y, processor_ids)
+            if core_subset:
+                core_subsets._core_subsets[x, y] = core_subset
+        return core_subsets
+
+    @classmethod
+    def from_xyp_arrays(
+            cls, xs: ArrayLike, ys: ArrayLike, ps: ArrayLike) -> CoreSubsets:
+        """
+        Create core subsets from the x, y and processor ID of each core.
+
+        The result is the same as calling :py:meth:`add_processor` for each
+        core in turn, but the cores are grouped by chip with NumPy.
+
+        :param xs: The x of each core
+        :param ys: The y of each core
+        :param ps: The processor ID of each core
+        :rtype: CoreSubsets
+        """
+        x_array = numpy.asarray(xs, dtype=numpy.int64).ravel()
+        y_array = numpy.asarray(ys, dtype=numpy.int64).ravel()
+        p_list = numpy.asarray(ps, dtype=numpy.int64).ravel()
+        if len(x_array) == 0:
+            return cls()
+        # A stable sort keeps the processors of each chip in order
+        order = numpy.lexsort((y_array, x_array))
+        sorted_xs = x_array[order]
+        sorted_ys = y_array[order]
+        starts = numpy.flatnonzero(numpy.concatenate(([True], (
+            sorted_xs[1:] != sorted_xs[:-1]) | (
+            sorted_ys[1:] != sorted_ys[:-1]))))
+        ends = numpy.append(starts[1:], len(order))
+        # Chips are added in the order they first appear
+        by_first = numpy.argsort(order[starts], kind="stable")
+        processors = p_list[order].tolist()
+        chip_xs = x_array[order[starts]].tolist()
+        chip_ys = y_array[order[starts]].tolist()
+        starts_list = starts.tolist()
+        ends_list = ends.tolist()
+        return cls.from_chip_cores_map({
+            (chip_xs[chip], chip_ys[chip]):
+                processors[starts_list[chip]:ends_list[chip]]
+            for chip in by_first.tolist()})
+
     def add_core_subset(self, core_subset: CoreSubset):
         """
         Add a core subset to the set
 
         :param CoreSubset core_subset: The core subset to add
         """
-        x = core_subset.x
-        y = core_subset.y
+        xy = (core_subset.x, core_subset.y)
+        existing = self._core_subsets.get(xy)
+        if existing is None:
+            if core_subset:
+                self._core_subsets[xy] = CoreSubset(
+                    *xy, core_subset.processor_ids)
+            return
         for processor_id in core_subset.processor_ids:
-            self.add_processor(x, y, processor_id)
+            existing.add_processor(processor_id)
 
     def add_core_subsets(self, core_subsets: Iterable[CoreSubset]):
         """
@@ -119,6 +184,27 @@ class CoreSubsets(object):
             return CoreSubset(x, y, [])
         return self._core_subsets[xy]
 
+    def get_n_cores_for_chip(self, x: int, y: int) -> int:
+        """
+        The number of processors in the subset of a chip.
+
+        :param int x: The x-coordinate of a chip
+        :param int y: The y-coordinate of a chip
+        :return: The number of processors, which is 0 if not added
+        :rtype: int
+        """
+        core_subset = self._core_subsets.get((x, y))
+        return 0 if core_subset is None else len(core_subset)
+
+    @property
+    def n_chips(self) -> int:
+        """
+        The number of chips with a subset.
+
+        :rtype: int
+        """
+        return len(self._core_subsets)
+
     def __iter__(self) -> Iterator[CoreSubset]:
         """
         Iterable of core_subsets.
@@ -179,11 +265,12 @@ class CoreSubsets(object):
         :rtype: CoreSubsets
         """
         result = CoreSubsets()
-        for xy in self._core_subsets:
+        # pylint: disable=protected-access
+        for xy, core_subset in self._core_subsets.items():
             if xy in other:
-                subset = self._core_subsets[xy].intersect(other[xy])
+                subset = core_subset.intersect(other[xy])
                 if subset:
-                    result.add_core_subset(subset)
+                    result._core_subsets[xy] = subset
         return result
 
     def values(self) -> Iterable[CoreSubset]:
@@ -0,0 +1,379 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Any, Iterable, Iterator, Tuple, Union
+import numpy
+from numpy.typing import ArrayLike, NDArray
+from spinn_utilities.typing.coords import XY, XYP
+from .core_subset import CoreSubset
+from .core_subsets import CoreSubsets
+from .exceptions import SpinnMachineInvalidParameterException
+
+# The bits of a word of the bitmap
+_WORD_BITS = 64
+
+# One more than the largest x or y that fits in a key
+_COORD_LIMIT = 1 << 31
+
+
+def _bits(words: NDArray[numpy.uint64]) -> NDArray[numpy.uint8]:
+    """
+    The bits of each row of words, with bit p of a row in column p.
+    """
+    as_bytes = words.astype("<u8").view(numpy.uint8).reshape(
+        words.shape[0], words.shape[1] * 8)
+    return numpy.unpackbits(as_bytes, axis=1, bitorder="little")
+
+
+def _popcount(words: NDArray[numpy.uint64]) -> NDArray[numpy.int64]:
+    """
+    The number of bits set in each row of words.
+    """
+    return _bits(words).sum(axis=1, dtype=numpy.int64)
+
+
+def _keys(xs: NDArray, ys: NDArray) -> NDArray[numpy.int64]:
+    """
+    The sort key of each (x, y); sorting by key sorts by x then y.
+
+    Only valid where :py:func:`_valid_coords` is True.
+    """
+    return (xs.astype(numpy.int64) << 32) | ys.astype(numpy.int64)
+
+
+def _valid_coords(xs: NDArray, ys: NDArray) -> NDArray[numpy.bool_]:
+    """
+    Whether each (x, y) fits in a key.
+    """
+    return (xs >= 0) & (xs < _COORD_LIMIT) & (ys >= 0) & (ys < _COORD_LIMIT)
+
+
+class CoreSubsetsBitmap(object):
+    """
+    An immutable group of cores over many chips held as bitmaps, so that
+    set operations over whole machines are done with NumPy.
+
+    Each chip with at least one core has a row of 64 bit words with bit
+    ``p % 64`` of word ``p // 64`` set if processor ``p`` is included.
+    The rows are sorted by (x, y).
+
+    Unlike :py:class:`CoreSubsets` the order in which processors were added
+    is not kept; processors are always given in ascending order.
+    """
+
+    __slots__ = (
+        # The key of the (x, y) of each row, sorted
+        "_keys",
+        # The bitmap of each row, shape (n_chips, n_words)
+        "_words")
+
+    def __init__(self, keys: NDArray[numpy.int64],
+                 words: NDArray[numpy.uint64]):
+        """
+        Use one of the ``from_`` methods rather than calling this directly.
+
+        :param ~numpy.ndarray keys: Sorted distinct keys of the chips
+        :param ~numpy.ndarray words:
+            The bitmap of each chip, with no row all zero
+        """
+        self._keys = keys
+        self._words = words
+        self._keys.flags.writeable = False
+        self._words.flags.writeable = False
+
+    @classmethod
+    def empty(cls, n_words: int = 1) -> CoreSubsetsBitmap:
+        """
+        A bitmap with no cores.
+
+        :param int n_words: The number of 64 bit words per chip
+        :rtype: CoreSubsetsBitmap
+        """
+        return cls(numpy.zeros(0, dtype=numpy.int64),
+                   numpy.zeros((0, n_words), dtype=numpy.uint64))
+
+    @classmethod
+    def from_xyp_arrays(cls, xs: ArrayLike, ys: ArrayLike,
+                        ps: ArrayLike) -> CoreSubsetsBitmap:
+        """
+        Build from one (x, y, processor) per core; repeats are allowed.
+
+        :param xs: The x of each core
+        :param ys: The y of each core
+        :param ps: The processor ID of each core
+        :rtype: CoreSubsetsBitmap
+        :raises SpinnMachineInvalidParameterException:
+            If an x or y is negative or does not fit in 31 bits
+        """
+        x_array = numpy.asarray(xs, dtype=numpy.int64).ravel()
+        y_array = numpy.asarray(ys, dtype=numpy.int64).ravel()
+        p_array = numpy.asarray(ps, dtype=numpy.int64).ravel()
+        if len(p_array) == 0:
+            return cls.empty()
+        if p_array.min() < 0:
+            raise ValueError("Processor IDs must not be negative")
+        valid = _valid_coords(x_array, y_array)
+        if not valid.all():
+            bad = int(numpy.argmin(valid))
+            raise SpinnMachineInvalidParameterException(
+                "xs, ys", f"({x_array[bad]}, {y_array[bad]})",
+                f"Chip coordinates must be between 0 and {_COORD_LIMIT - 1}")
+        n_words = int(p_array.max()) // _WORD_BITS + 1
+        keys, rows = numpy.unique(
+            _keys(x_array, y_array), return_inverse=True)
+        words = numpy.zeros((len(keys), n_words), dtype=numpy.uint64)
+        numpy.bitwise_or.at(
+            words, (rows.ravel(), p_array // _WORD_BITS),
+            numpy.left_shift(
+                numpy.uint64(1), (p_array % _WORD_BITS).astype(numpy.uint64)))
+        return cls(keys, words)
+
+    @classmethod
+    def from_core_subsets(
+            cls, core_subsets: Iterable[CoreSubset]) -> CoreSubsetsBitmap:
+        """
+        Build from a :py:class:`CoreSubsets` or any iterable of
+        :py:class:`CoreSubset`.
+
+        :param iterable(CoreSubset) core_subsets:
+        :rtype: CoreSubsetsBitmap
+        """
+        xs, ys, ps = [], [], []
+        for core_subset in core_subsets:
+            processors = list(core_subset.processor_ids)
+            xs.extend([core_subset.x] * len(processors))
+            ys.extend([core_subset.y] * len(processors))
+            ps.extend(processors)
+        return cls.from_xyp_arrays(xs, ys, ps)
+
+    @property
+    def n_chips(self) -> int:
+        """
+        The number of chips with at least one core included.
+
+        :rtype: int
+        """
+        return len(self._keys)
+
+    @property
+    def chip_coordinates(self) -> Iterator[XY]:
+        """
+        The (x, y) of each chip with at least one core, sorted.
+
+        :rtype: iterable(tuple(int,int))
+        """
+        return zip((self._keys >> 32).tolist(),
+                   (self._keys & 0xFFFFFFFF).tolist())
+
+    def to_xyp_arrays(self) -> Tuple[
+            NDArray[numpy.int64], NDArray[numpy.int64], NDArray[numpy.int64]]:
+        """
+        Get the x, y and processor ID of every core, sorted by x, y and then
+        processor ID.
+
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+        """
+        rows, ps = numpy.nonzero(_bits(self._words))
+        keys = self._keys[rows]
+        return keys >> 32, keys & 0xFFFFFFFF, ps.astype(numpy.int64)
+
+    def to_core_subsets(self) -> CoreSubsets:
+        """
+        Convert to a :py:class:`CoreSubsets`.
+
+        :rtype: CoreSubsets
+        """
+        return CoreSubsets.from_xyp_arrays(*self.to_xyp_arrays())
+
+    def __iter__(self) -> Iterator[CoreSubset]:
+        """
+        A :py:class:`CoreSubset` for each chip with at least one core,
+        sorted by (x, y).
+
+        :rtype: iterable(CoreSubset)
+        """
+        _, _, ps = self.to_xyp_arrays()
+        counts = self.chip_counts().tolist()
+        processors = ps.tolist()
+        start = 0
+        for (x, y), count in zip(self.chip_coordinates, counts):
+            yield CoreSubset(x, y, processors[start:start + count])
+            start += count
+
+    def chip_counts(self) -> NDArray[numpy.int64]:
+        """
+        The number of cores of each chip in the order of
+        :py:attr:`chip_coordinates`.
+
+        :rtype: ~numpy.ndarray
+        """
+        return _popcount(self._words)
+
+    def _aligned(self, other: CoreSubsetsBitmap) -> Tuple[
+            NDArray[numpy.uint64], NDArray[numpy.uint64]]:
+        """
+        The words of this and another with the same number of columns.
+        """
+        n_words = max(self._words.shape[1], other._words.shape[1])
+        return (self._pad(self._words, n_words),
+                self._pad(other._words, n_words))
+
+    @staticmethod
+    def _pad(words: NDArray[numpy.uint64],
+             n_words: int) -> NDArray[numpy.uint64]:
+        if words.shape[1] == n_words:
+            return words
+        return numpy.pad(words, ((0, 0), (0, n_words - words.shape[1])))
+
+    @classmethod
+    def _non_empty(cls, keys: NDArray[numpy.int64],
+                   words: NDArray[numpy.uint64]) -> CoreSubsetsBitmap:
+        keep = words.any(axis=1)
+        return cls(keys[keep], words[keep])
+
+    def union(self, other: CoreSubsetsBitmap) -> CoreSubsetsBitmap:
+        """
+        The cores in this or the other.
+
+        :param CoreSubsetsBitmap other:
+        :rtype: CoreSubsetsBitmap
+        """
+        mine, theirs = self._aligned(other)
+        keys, rows = numpy.unique(
+            numpy.concatenate((self._keys, other._keys)),
+            return_inverse=True)
+        words = numpy.zeros((len(keys), mine.shape[1]), dtype=numpy.uint64)
+        rows = rows.ravel()
+        words[rows[:len(self._keys)]] = mine
+        words[rows[len(self._keys):]] |= theirs
+        return CoreSubsetsBitmap(keys, words)
+
+    def intersect(self, other: CoreSubsetsBitmap) -> CoreSubsetsBitmap:
+        """
+        The cores in both this and the other.
+
+        :param CoreSubsetsBitmap other:
+        :rtype: CoreSubsetsBitmap
+        """
+        mine, theirs = self._aligned(other)
+        keys, mine_rows, their_rows = numpy.intersect1d(
+            self._keys, other._keys, assume_unique=True, return_indices=True)
+        return self._non_empty(keys, mine[mine_rows] & theirs[their_rows])
+
+    def difference(self, other: CoreSubsetsBitmap) -> CoreSubsetsBitmap:
+        """
+        The cores in this but not the other.
+
+        :param CoreSubsetsBitmap other:
+        :rtype: CoreSubsetsBitmap
+        """
+        mine, theirs = self._aligned(other)
+        words = mine.copy()
+        _, mine_rows, their_rows = numpy.intersect1d(
+            self._keys, other._keys, assume_unique=True, return_indices=True)
+        words[mine_rows] &= ~theirs[their_rows]
+        return self._non_empty(self._keys, words)
+
+    def __or__(self, other: CoreSubsetsBitmap) -> CoreSubsetsBitmap:
+        return self.union(other)
+
+    def __and__(self, other: CoreSubsetsBitmap) -> CoreSubsetsBitmap:
+        return self.intersect(other)
+
+    def __sub__(self, other: CoreSubsetsBitmap) -> CoreSubsetsBitmap:
+        return self.difference(other)
+
+    def __len__(self) -> int:
+        """
+        The total number of cores.
+
+        :rtype: int
+        """
+        return int(_popcount(self._words).sum())
+
+    def _row(self, x: int, y: int) -> int:
+        if not (0 <= x < _COORD_LIMIT and 0 <= y < _COORD_LIMIT):
+            return -1
+        key = (x << 32) | y
+        row = int(numpy.searchsorted(self._keys, key))
+        if row < len(self._keys) and self._keys[row] == key:
+            return row
+        return -1
+
+    def __contains__(self, x_y_tuple: Union[XY, XYP]) -> bool:
+        """
+        True if the given coordinates are in the set.
+
+        :param x_y_tuple:
+            Either a 2-tuple of x, y coordinates or a 3-tuple or x, y,
+            processor_id coordinates
+        :type x_y_tuple: tuple(int,int) or tuple(int,int,int)
+        :rtype: bool
+        """
+        row = self._row(x_y_tuple[0], x_y_tuple[1])
+        if row < 0:
+            return False
+        if len(x_y_tuple) == 2:
+            return True
+        word, bit = divmod(x_y_tuple[2], _WORD_BITS)  # type: ignore[misc]
+        if not 0 <= word < self._words.shape[1]:
+            return False
+        return bool((int(self._words[row, word]) >> bit) & 1)
+
+    def contains_cores(self, xs: ArrayLike, ys: ArrayLike,
+                       ps: ArrayLike) -> NDArray[numpy.bool_]:
+        """
+        Determine for many cores at once if each is in the set.
+
+        :param xs: The x of each core
+        :param ys: The y of each core
+        :param ps: The processor ID of each core
+        :return: True for each core that is in the set
+        :rtype: ~numpy.ndarray
+        """
+        x_array = numpy.asarray(xs, dtype=numpy.int64)
+        y_array = numpy.asarray(ys, dtype=numpy.int64)
+        valid = _valid_coords(x_array, y_array)
+        keys = _keys(numpy.where(valid, x_array, 0),
+                     numpy.where(valid, y_array, 0))
+        p_array = numpy.asarray(ps, dtype=numpy.int64)
+        if len(self._keys) == 0:
+            return numpy.zeros(keys.shape, dtype=bool)
+        rows = numpy.minimum(
+            numpy.searchsorted(self._keys, keys), len(self._keys) - 1)
+        word = p_array // _WORD_BITS
+        in_range = (p_array >= 0) & (word < self._words.shape[1])
+        found = (self._keys[rows] == keys) & in_range & valid
+        bits = self._words[rows, numpy.where(in_range, word, 0)] >> (
+            p_array % _WORD_BITS).astype(numpy.uint64)
+        return found & ((bits & numpy.uint64(1)) == 1)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CoreSubsetsBitmap):
+            return False
+        if not numpy.array_equal(self._keys, other._keys):
+            return False
+        mine, theirs = self._aligned(other)
+        return bool(numpy.array_equal(mine, theirs))
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        words = self._words[:, :numpy.flatnonzero(
+            self._words.any(axis=0)).max(initial=-1) + 1]
+        return hash((self._keys.tobytes(), words.tobytes()))
+
+    def __repr__(self) -> str:
+        return f"CoreSubsetsBitmap({list(self)})"
@@ -0,0 +1,196 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import (
+    Any, Dict, Iterator, List, MutableMapping, Optional, Tuple,
+    TYPE_CHECKING)
+from spinn_utilities.typing.coords import XY
+if TYPE_CHECKING:
+    from .chip import Chip
+
+
+class DenseChipStore(MutableMapping[XY, "Chip"]):
+    """
+    A mapping of (x, y) to Chip backed by a flat array of slots.
+
+    The slot of a chip inside the width and height of the machine is
+    ``y * width + x`` so lookups do not need to hash a tuple.
+    A parallel existence bitmap allows existence checks without touching
+    the Chip objects.
+
+    Chips outside of the width and height (for example virtual chips) are
+    kept in a normal dictionary so the full mapping API is preserved.
+
+    Iteration is in slot order followed by any chips outside the machine.
+    """
+
+    __slots__ = (
+        # One byte per slot; 1 if there is a chip in that slot
+        "_exists",
+        # Declared height of the machine
+        "_height",
+        # The number of chips in the slots
+        "_n_chips",
+        # Chips with an (x, y) outside of the width and height
+        "_overflow",
+        # The Chip (or None) for each slot
+        "_slots",
+        # Declared width of the machine
+        "_width")
+
+    def __init__(self, width: int, height: int):
+        """
+        :param int width: The width of the machine
+        :param int height: The height of the machine
+        """
+        self._width = width
+        self._height = height
+        self._slots: List[Optional[Chip]] = [None] * (width * height)
+        self._exists = bytearray(width * height)
+        self._overflow: Dict[XY, Chip] = dict()
+        self._n_chips = 0
+
+    def slot(self, x: int, y: int) -> int:
+        """
+        Get the slot index for an (x, y) coordinate.
+
+        :param int x:
+        :param int y:
+        :return: ``y * width + x`` or -1 if the (x, y) is outside the machine
+        :rtype: int
+        """
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return y * self._width + x
+        return -1
+
+    def chip_at(self, x: int, y: int) -> Optional[Chip]:
+        """
+        Get the chip at (x, y) without building a key tuple.
+
+        :param int x:
+        :param int y:
+        :return: The Chip or None if there is no chip at (x, y)
+        :rtype: Chip or None
+        """
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return self._slots[y * self._width + x]
+        return self._overflow.get((x, y))
+
+    def has_chip(self, x: int, y: int) -> bool:
+        """
+        Determine if there is a chip at (x, y) using the existence bitmap.
+
+        :param int x:
+        :param int y:
+        :rtype: bool
+        """
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return self._exists[y * self._width + x] == 1
+        return (x, y) in self._overflow
+
+    def has_link(self, x: int, y: int, link: int) -> bool:
+        """
+        Determine if there is a chip at (x, y) with the given link.
+
+        :param int x:
+        :param int y:
+        :param int link:
+        :rtype: bool
+        """
+        chip = self.chip_at(x, y)
+        return chip is not None and chip.router.is_link(link)
+
+    @property
+    def existence_bitmap(self) -> memoryview:
+        """
+        A read only view of the existence bitmap indexed by slot.
+
+        :rtype: memoryview
+        """
+        return memoryview(self._exists).toreadonly()
+
+    def __getitem__(self, xy: XY) -> Chip:
+        x, y = xy
+        if 0 <= x < self._width and 0 <= y < self._height:
+            chip = self._slots[y * self._width + x]
+            if chip is None:
+                raise KeyError(xy)
+            return chip
+        return self._overflow[xy]
+
+    def get(self, xy: XY, default: Any = None) -> Any:
+        x, y = xy
+        if 0 <= x < self._width and 0 <= y < self._height:
+            chip = self._slots[y * self._width + x]
+            if chip is None:
+                return default
+            return chip
+        return self._overflow.get(xy, default)
+
+    def __contains__(self, xy: object) -> bool:
+        if not isinstance(xy, tuple) or len(xy) != 2:
+            return False
+        x, y = xy
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return self._exists[y * self._width + x] == 1
+        return xy in self._overflow
+
+    def __setitem__(self, xy: XY, chip: Chip):
+        x, y = xy
+        if 0 <= x < self._width and 0 <= y < self._height:
+            index = y * self._width + x
+            if not self._exists[index]:
+                self._exists[index] = 1
+                self._n_chips += 1
+            self._slots[index] = chip
+        else:
+            self._overflow[(x, y)] = chip
+
+    def __delitem__(self, xy: XY):
+        x, y = xy
+        if 0 <= x < self._width and 0 <= y < self._height:
+            index = y * self._width + x
+            if not self._exists[index]:
+                raise KeyError(xy)
+            self._exists[index] = 0
+            self._slots[index] = None
+            self._n_chips -= 1
+        else:
+            del self._overflow[xy]
+
+    def __iter__(self) -> Iterator[XY]:
+        width = self._width
+        exists = self._exists
+        for index in range(len(exists)):
+            if exists[index]:
+                y, x = divmod(index, width)
+                yield (x, y)
+        yield from self._overflow
+
+    def __len__(self) -> int:
+        return self._n_chips + len(self._overflow)
+
+    def values(self) -> Iterator[Chip]:  # type: ignore[override]
+        for chip in self._slots:
+            if chip is not None:
+                yield chip
+        yield from self._overflow.values()
+
+    def items(self) -> Iterator[Tuple[XY, Chip]]:  # type: ignore[override]
+        width = self._width
+        for index, chip in enumerate(self._slots):
+            if chip is not None:
+                y, x = divmod(index, width)
+                yield (x, y), chip
+        yield from self._overflow.items()
@@ -0,0 +1,169 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+All-pairs hop distances between the (x, y) positions of a Machine.
+
+The full matrix only depends on the version, width, height and wrap of the
+machine so it is memoised on that key and can be persisted as a ``.npy``
+file which is memory-mapped on later runs.
+"""
+from __future__ import annotations
+import os
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+import numpy
+from numpy.typing import NDArray
+from spinn_machine.data import MachineDataView
+if TYPE_CHECKING:
+    from .machine import Machine
+
+_Key = Tuple[int, int, int, str]
+
+#: The full distance matrices already computed in this process
+_MEMO: Dict[_Key, NDArray[numpy.integer]] = dict()
+
+# Maximum number of matrix cells computed in a single batch call
+_BLOCK_CELLS = 1 << 22
+
+
+def clear_distance_matrix_cache() -> None:
+    """
+    Forgets all the distance matrices memoised in this process.
+
+    Files written to a cache directory are not removed.
+    """
+    _MEMO.clear()
+
+
+def _key(machine: Machine) -> _Key:
+    version = MachineDataView.get_machine_version()
+    return (version.number, machine.width, machine.height, machine.wrap)
+
+
+def _file_name(key: _Key) -> str:
+    number, width, height, wrap = key
+    return f"distances_v{number}_{wrap}_{width}x{height}.npy"
+
+
+def _dtype(machine: Machine) -> type:
+    # No shortest vector is longer than width + height
+    if machine.width + machine.height < numpy.iinfo(numpy.uint16).max:
+        return numpy.uint16
+    return numpy.uint32
+
+
+def slot_coordinates(width: int, height: int) -> NDArray[numpy.integer]:
+    """
+    Gets the (x, y) of every slot of a width by height machine.
+
+    :param int width:
+    :param int height:
+    :return: An array of shape (width * height, 2) where row
+        ``y * width + x`` is ``(x, y)``
+    :rtype: ~numpy.ndarray
+    """
+    ys, xs = numpy.divmod(numpy.arange(width * height), width)
+    return numpy.stack((xs, ys), axis=-1)
+
+
+def _fill(machine: Machine, out: NDArray[numpy.integer]) -> None:
+    coords = slot_coordinates(machine.width, machine.height)
+    n_slots = len(coords)
+    block = max(1, _BLOCK_CELLS // max(1, n_slots))
+    for start in range(0, n_slots, block):
+        end = min(start + block, n_slots)
+        out[start:end] = machine.get_vector_lengths(
+            coords[start:end, None, :], coords[None, :, :])
+
+
+def _is_cached(path: str, shape: Tuple[int, int]) -> bool:
+    return (os.path.exists(path) and
+            numpy.load(path, mmap_mode="r").shape == shape)
+
+
+def _save(matrix: NDArray[numpy.integer], cache_dir: str, key: _Key) -> None:
+    path = os.path.join(cache_dir, _file_name(key))
+    if _is_cached(path, matrix.shape):
+        return
+    # Write to a temporary file so a partial file is never picked up
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as temp_file:
+        numpy.save(temp_file, matrix)
+    os.replace(temp_path, path)
+
+
+def _compute(machine: Machine, cache_dir: Optional[str],
+             key: _Key) -> NDArray[numpy.integer]:
+    n_slots = machine.width * machine.height
+    shape = (n_slots, n_slots)
+    dtype = _dtype(machine)
+    if cache_dir is None:
+        matrix: NDArray[numpy.integer] = numpy.empty(shape, dtype=dtype)
+        _fill(machine, matrix)
+        return matrix
+
+    path = os.path.join(cache_dir, _file_name(key))
+    if _is_cached(path, shape):
+        return numpy.load(path, mmap_mode="r")
+
+    # Write to a temporary file so a partial file is never picked up
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    matrix = numpy.lib.format.open_memmap(
+        temp_path, mode="w+", dtype=dtype, shape=shape)
+    _fill(machine, matrix)
+    matrix.flush()
+    del matrix
+    os.replace(temp_path, path)
+    return numpy.load(path, mmap_mode="r")
+
+
+def full_distance_matrix(
+        machine: Machine,
+        cache_dir: Optional[str] = None) -> NDArray[numpy.integer]:
+    """
+    Gets the hop distance between every pair of (x, y) slots of the machine.
+
+    See :py:meth:`~spinn_machine.Machine.distance_matrix`
+
+    :param Machine machine:
+    :param cache_dir: Directory to persist the matrix in or None
+    :type cache_dir: str or None
+    :return: A read-only matrix, shared by all callers
+    :rtype: ~numpy.ndarray
+    """
+    key = _key(machine)
+    matrix = _MEMO.get(key)
+    if matrix is None:
+        matrix = _compute(machine, cache_dir, key)
+        # Every caller gets the same matrix so none may change it
+        matrix.flags.writeable = False
+        _MEMO[key] = matrix
+    elif cache_dir is not None:
+        _save(matrix, cache_dir, key)
+    return matrix
+
+
+def existing_slots(machine: Machine) -> NDArray[numpy.integer]:
+    """
+    The sorted slot indexes (``y * width + x``) of the chips that exist
+    within the width and height of the machine.
+
+    :param Machine machine:
+    :rtype: ~numpy.ndarray
+    """
+    width, height = machine.width, machine.height
+    slots = [y * width + x for (x, y) in machine.chip_coordinates
+             if 0 <= x < width and 0 <= y < height]
+    return numpy.sort(numpy.array(slots, dtype=numpy.int64))
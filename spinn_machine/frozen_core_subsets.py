@@ -11,28 +11,108 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-
-from typing import Dict, Iterable
+from __future__ import annotations
+from typing import (
+    Any, Dict, FrozenSet, Iterable, Iterator, Mapping, Optional, Tuple)
+from weakref import WeakValueDictionary
 from spinn_utilities.typing.coords import XY
 from spinn_utilities.overrides import overrides
 from .core_subset import CoreSubset
 from .core_subsets import CoreSubsets
 
+_Key = FrozenSet[Tuple[XY, FrozenSet[int]]]
+
+# The interned instances by their key, kept while in use elsewhere
+_interned: WeakValueDictionary[_Key, FrozenCoreSubsets] = \
+    WeakValueDictionary()
+
 
 class FrozenCoreSubsets(CoreSubsets):
     """
     Represents a frozen group of CoreSubsets, with a maximum of one per
     SpiNNaker chip.
+
+    The processor IDs of each chip are held as a tuple rather than as a
+    :py:class:`CoreSubset`, which is created when asked for.
+
+    Instances are hashable, and equal if they have the same processors on
+    the same chips whatever the order they were added in.
+    Use :py:meth:`interned` to share one instance between equal groups.
     """
 
+    __slots__ = (
+        # The processor IDs by (x, y) in the order added
+        "_chips",
+        # The hash once worked out
+        "_hash",
+        # The CoreSubset of each (x, y) once asked for
+        "_subsets",
+        # The total number of processors, as they can not change
+        "_n_cores",
+        "__weakref__")
+
     # pylint: disable=super-init-not-called
     def __init__(self, core_subsets: Iterable[CoreSubset] = ()):
-        self._core_subsets: Dict[XY, CoreSubset] = dict()
+        chips: Dict[XY, Dict[int, None]] = dict()
         for core_subset in core_subsets:
-            x = core_subset.x
-            y = core_subset.y
-            for processor_id in core_subset.processor_ids:
-                super().add_processor(x, y, processor_id)
+            processor_ids = chips.setdefault(
+                (core_subset.x, core_subset.y), dict())
+            processor_ids.update(
+                dict.fromkeys(core_subset.processor_ids))
+        self._freeze({xy: ids for xy, ids in chips.items() if ids})
+
+    def _freeze(self, chips: Mapping[XY, Iterable[int]]):
+        self._chips: Dict[XY, Tuple[int, ...]] = dict()
+        n_cores = 0
+        for xy, processor_ids in chips.items():
+            ids = tuple(processor_ids)
+            self._chips[xy] = ids
+            n_cores += len(ids)
+        self._n_cores = n_cores
+        self._hash: Optional[int] = None
+        self._subsets: Optional[Dict[XY, CoreSubset]] = None
+
+    @classmethod
+    @overrides(CoreSubsets.from_chip_cores_map)
+    def from_chip_cores_map(
+            cls, chip_cores: Mapping[XY, Iterable[int]]) -> FrozenCoreSubsets:
+        # Drop repeats but keep the order
+        chips = {xy: dict.fromkeys(processor_ids)
+                 for xy, processor_ids in chip_cores.items()}
+        frozen = cls()
+        frozen._freeze({xy: ids for xy, ids in chips.items() if ids})
+        return frozen
+
+    @classmethod
+    def interned(cls, core_subsets: Iterable[CoreSubset]) -> FrozenCoreSubsets:
+        """
+        Get the shared instance with the same cores as those given.
+
+        The instance is kept for as long as anything else refers to it.
+
+        :param core_subsets:
+            The cores; if already a FrozenCoreSubsets it becomes the shared
+            instance when there is none yet
+        :type core_subsets: iterable(CoreSubset)
+        :rtype: FrozenCoreSubsets
+        """
+        if isinstance(core_subsets, FrozenCoreSubsets):
+            frozen = core_subsets
+        else:
+            frozen = cls(core_subsets)
+        return _interned.setdefault(frozen._key(), frozen)
+
+    def _key(self) -> _Key:
+        return frozenset(
+            (xy, frozenset(ids)) for xy, ids in self._chips.items())
+
+    @property
+    def _core_subsets(self) -> Dict[XY, CoreSubset]:  # type: ignore[override]
+        # Only made if a method of CoreSubsets needs it, then kept
+        if self._subsets is None:
+            self._subsets = {(x, y): CoreSubset(x, y, ids)
+                             for (x, y), ids in self._chips.items()}
+        return self._subsets
 
     @overrides(CoreSubsets.add_core_subset)
     def add_core_subset(self, core_subset: CoreSubset):
@@ -45,3 +125,70 @@ class FrozenCoreSubsets(CoreSubsets):
     @overrides(CoreSubsets.add_processor)
     def add_processor(self, x: int, y: int, processor_id: int):
         raise RuntimeError("This object is immutable")
+
+    @overrides(CoreSubsets.is_chip)
+    def is_chip(self, x: int, y: int) -> bool:
+        return (x, y) in self._chips
+
+    @overrides(CoreSubsets.is_core)
+    def is_core(self, x: int, y: int, processor_id: int) -> bool:
+        return processor_id in self._chips.get((x, y), ())
+
+    @property
+    @overrides(CoreSubsets.core_subsets)
+    def core_subsets(self) -> Iterable[CoreSubset]:
+        return iter(self)
+
+    @overrides(CoreSubsets.get_core_subset_for_chip)
+    def get_core_subset_for_chip(self, x: int, y: int) -> CoreSubset:
+        return CoreSubset(x, y, self._chips.get((x, y), ()))
+
+    @overrides(CoreSubsets.get_n_cores_for_chip)
+    def get_n_cores_for_chip(self, x: int, y: int) -> int:
+        return len(self._chips.get((x, y), ()))
+
+    @property
+    @overrides(CoreSubsets.n_chips)
+    def n_chips(self) -> int:
+        return len(self._chips)
+
+    @overrides(CoreSubsets.__len__)
+    def __len__(self) -> int:
+        return self._n_cores
+
+    @overrides(CoreSubsets.__iter__)
+    def __iter__(self) -> Iterator[CoreSubset]:
+        for (x, y), ids in self._chips.items():
+            yield CoreSubset(x, y, ids)
+
+    @overrides(CoreSubsets.__getitem__)
+    def __getitem__(self, x_y_tuple: XY) -> CoreSubset:
+        return CoreSubset(*x_y_tuple, self._chips[x_y_tuple])
+
+    @overrides(CoreSubsets.__repr__)
+    def __repr__(self) -> str:
+        return "".join(str(xy) for xy in self._chips)
+
+    @overrides(CoreSubsets.values)
+    def values(self) -> Iterable[CoreSubset]:
+        return list(self)
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, FrozenCoreSubsets):
+            return False
+        if (hash(self) != hash(other) or
+                self._n_cores != other._n_cores or
+                self._chips.keys() != other._chips.keys()):
+            return False
+        return all(ids == other._chips[xy] or set(ids) == set(
+            other._chips[xy]) for xy, ids in self._chips.items())
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._key())
+        return self._hash
@@ -0,0 +1,143 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.overrides import overrides
+from .exceptions import SpinnMachineException
+from .multicast_routing_entry import MulticastRoutingEntry
+from .multicast_routing_table import ENTRY_DTYPE, MulticastRoutingTable
+
+
+class FrozenMulticastRoutingTable(MulticastRoutingTable):
+    """
+    A read-only multicast routing table over a buffer of entries as written
+    by :py:meth:`MulticastRoutingTable.to_bytes`.
+
+    The buffer is not copied; the arrays of the table are views of it, so
+    it can be passed on as is, and the
+    :py:class:`~spinn_machine.MulticastRoutingEntry` objects are only made
+    if asked for.
+    The buffer must be read-only, so the entries made from it stay the
+    same as the arrays.
+    No entry is defaultable, and entries with the same key and mask are not
+    looked for.
+    """
+
+    __slots__ = (
+        # The buffer of the entries
+        "_data",
+        # The entries once made
+        "_made_entries",
+        # The entries by (key, mask) once made
+        "_made_key_masks")
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, x: int, y: int, data: Union[bytes, memoryview]):
+        """
+        :param int x: The x-coordinate of the chip
+        :param int y: The y-coordinate of the chip
+        :param data: The entries as written by
+            :py:meth:`MulticastRoutingTable.to_bytes`
+        :type data: bytes or memoryview
+        :raise SpinnMachineException:
+            If the data can be written to or its length is not a whole
+            number of entries
+        """
+        view = memoryview(data)
+        if not view.readonly:
+            raise SpinnMachineException(
+                "The data of a frozen routing table must be read-only; "
+                "pass bytes(data) to copy it")
+        n_bytes = view.nbytes
+        if n_bytes % ENTRY_DTYPE.itemsize:
+            raise SpinnMachineException(
+                f"{n_bytes} bytes is not a whole number of routing entries "
+                f"of {ENTRY_DTYPE.itemsize} bytes")
+        self._x = x
+        self._y = y
+        self._data = data
+        words = numpy.frombuffer(data, dtype=ENTRY_DTYPE)
+        arrays = (words["key"], words["mask"], words["route"])
+        for array in arrays:
+            array.flags.writeable = False
+        self._arrays = arrays
+        self._made_entries: Optional[List[MulticastRoutingEntry]] = None
+        self._made_key_masks: Optional[
+            Dict[Tuple[int, int], MulticastRoutingEntry]] = None
+
+    @property
+    def data(self) -> Union[bytes, memoryview]:
+        """
+        The buffer the table was made from.
+
+        :rtype: bytes or memoryview
+        """
+        return self._data
+
+    @property
+    def _entries(self) -> List[MulticastRoutingEntry]:  # type: ignore
+        if self._made_entries is None:
+            self._made_entries = MulticastRoutingEntry.from_arrays(
+                *self.arrays)
+        return self._made_entries
+
+    @property
+    def _key_masks(self) -> Dict[  # type: ignore
+            Tuple[int, int], MulticastRoutingEntry]:
+        if self._made_key_masks is None:
+            self._made_key_masks = {
+                (entry.routing_entry_key, entry.mask): entry
+                for entry in self._entries}
+        return self._made_key_masks
+
+    @overrides(MulticastRoutingTable.add_multicast_routing_entry)
+    def add_multicast_routing_entry(self, entry: MulticastRoutingEntry):
+        raise RuntimeError("This object is immutable")
+
+    @overrides(MulticastRoutingTable.add_multicast_routing_entries)
+    def add_multicast_routing_entries(
+            self, entries: Iterable[MulticastRoutingEntry]):
+        raise RuntimeError("This object is immutable")
+
+    @property
+    @overrides(MulticastRoutingTable.number_of_entries)
+    def number_of_entries(self) -> int:
+        return len(self)
+
+    @property
+    @overrides(MulticastRoutingTable.number_of_defaultable_entries)
+    def number_of_defaultable_entries(self) -> int:
+        return 0
+
+    @property
+    @overrides(MulticastRoutingTable.defaultable_flags)
+    def defaultable_flags(self) -> NDArray[numpy.bool_]:
+        return numpy.zeros(len(self), dtype=bool)
+
+    @overrides(MulticastRoutingTable.__len__)
+    def __len__(self) -> int:
+        return len(self.arrays[0])
+
+    @overrides(MulticastRoutingTable.get_entry_for_key)
+    def get_entry_for_key(self, key: int) -> Optional[MulticastRoutingEntry]:
+        index = int(self.lookup([key])[0])
+        if index < 0:
+            return None
+        return self._entries[index]
+
+    @overrides(MulticastRoutingTable.to_bytes)
+    def to_bytes(self) -> bytes:
+        return bytes(self._data)
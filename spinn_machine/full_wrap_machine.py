@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from typing import Iterable, Tuple
+import numpy
+from numpy.typing import ArrayLike, NDArray
 from spinn_utilities.overrides import overrides
 from spinn_utilities.typing.coords import XY
 from .machine import Machine
@@ -46,24 +48,6 @@ class FullWrapMachine(Machine):
             yield (((x + ethernet_x) % self._width,
                    (y + ethernet_y) % self._height), n_cores)
 
-    @overrides(Machine.get_existing_xys_by_ethernet)
-    def get_existing_xys_by_ethernet(
-            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
-        for (x, y) in self._chip_core_map:
-            chip_xy = ((x + ethernet_x) % self._width,
-                       (y + ethernet_y) % self._height)
-            if chip_xy in self._chips:
-                yield chip_xy
-
-    @overrides(Machine.get_down_xys_by_ethernet)
-    def get_down_xys_by_ethernet(
-            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
-        for (x, y) in self._chip_core_map:
-            chip_xy = ((x + ethernet_x) % self._width,
-                       (y + ethernet_y) % self._height)
-            if chip_xy not in self._chips:
-                yield chip_xy
-
     @overrides(Machine.xy_over_link)
     def xy_over_link(self, x: int, y: int, link: int) -> XY:
         add_x, add_y = Machine.LINK_ADD_TABLE[link]
@@ -158,6 +142,49 @@ class FullWrapMachine(Machine):
         else:
             return self._minimize_vector(dx, dy)
 
+    def _wrapped_vector_lengths(
+            self, sources: ArrayLike, destinations: ArrayLike) -> Tuple[
+                NDArray[numpy.integer], NDArray[numpy.integer],
+                NDArray[numpy.integer], NDArray[numpy.integer],
+                NDArray[numpy.integer]]:
+        """
+        Gets the four possible wrapped vectors and their lengths.
+
+        :return: lengths (in the same order as checked by get_vector),
+            x_up, x_down, y_right, y_left
+        """
+        x, y = self._vector_deltas(sources, destinations)
+        x_up = x % self._width
+        x_down = x_up - self._width
+        y_right = y % self._height
+        y_left = y_right - self._height
+        lengths = numpy.stack((
+            self._minimized_lengths(x_up, y_right),
+            self._minimized_lengths(x_down, y_right),
+            self._minimized_lengths(x_up, y_left),
+            self._minimized_lengths(x_down, y_left)))
+        return lengths, x_up, x_down, y_right, y_left
+
+    @overrides(Machine.get_vector_lengths)
+    def get_vector_lengths(
+            self, sources: ArrayLike, destinations: ArrayLike
+            ) -> NDArray[numpy.integer]:
+        lengths, _, _, _, _ = self._wrapped_vector_lengths(
+            sources, destinations)
+        return lengths.min(axis=0)
+
+    @overrides(Machine.get_vectors)
+    def get_vectors(
+            self, sources: ArrayLike, destinations: ArrayLike
+            ) -> NDArray[numpy.integer]:
+        lengths, x_up, x_down, y_right, y_left = \
+            self._wrapped_vector_lengths(sources, destinations)
+        # argmin takes the first shortest so ties match get_vector
+        best = lengths.argmin(axis=0)
+        dx = numpy.where(best % 2 == 0, x_up, x_down)
+        dy = numpy.where(best < 2, y_right, y_left)
+        return self._minimize_vectors(dx, dy)
+
     @overrides(Machine.concentric_xys)
     def concentric_xys(self, radius: int, start: XY) -> Iterable[XY]:
         # Aliases for convenience
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from typing import Iterable, Tuple
+import numpy
+from numpy.typing import ArrayLike, NDArray
 from spinn_utilities.overrides import overrides
 from spinn_utilities.typing.coords import XY
 from .machine import Machine
@@ -46,24 +48,6 @@ class HorizontalWrapMachine(Machine):
         for (x, y), n_cores in self._chip_core_map.items():
             yield ((x + ethernet_x) % self._width, (y + ethernet_y)), n_cores
 
-    @overrides(Machine.get_existing_xys_by_ethernet)
-    def get_existing_xys_by_ethernet(
-            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
-        for (x, y) in self._chip_core_map:
-            chip_xy = ((x + ethernet_x) % self._width,
-                       (y + ethernet_y))
-            if chip_xy in self._chips:
-                yield chip_xy
-
-    @overrides(Machine.get_down_xys_by_ethernet)
-    def get_down_xys_by_ethernet(
-            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
-        for (x, y) in self._chip_core_map:
-            chip_xy = ((x + ethernet_x) % self._width,
-                       (y + ethernet_y))
-            if chip_xy not in self._chips:
-                yield chip_xy
-
     @overrides(Machine.xy_over_link)
     def xy_over_link(self, x: int, y: int, link: int) -> XY:
         add_x, add_y = Machine.LINK_ADD_TABLE[link]
@@ -146,6 +130,40 @@ class HorizontalWrapMachine(Machine):
         else:
             return self._minimize_vector(x_left, y)
 
+    def _wrapped_vector_lengths(
+            self, sources: ArrayLike, destinations: ArrayLike) -> Tuple[
+                NDArray[numpy.integer], NDArray[numpy.integer],
+                NDArray[numpy.integer], NDArray[numpy.integer],
+                NDArray[numpy.integer]]:
+        """
+        Gets the two possible wrapped vectors and their lengths.
+
+        :return: len_right, len_left, x_right, x_left, y
+        """
+        x, y = self._vector_deltas(sources, destinations)
+        x_right = x % self._width
+        x_left = x_right - self._width
+        len_right = self._minimized_lengths(x_right, y)
+        len_left = self._minimized_lengths(x_left, y)
+        return len_right, len_left, x_right, x_left, y
+
+    @overrides(Machine.get_vector_lengths)
+    def get_vector_lengths(
+            self, sources: ArrayLike, destinations: ArrayLike
+            ) -> NDArray[numpy.integer]:
+        len_right, len_left, _, _, _ = self._wrapped_vector_lengths(
+            sources, destinations)
+        return numpy.minimum(len_right, len_left)
+
+    @overrides(Machine.get_vectors)
+    def get_vectors(
+            self, sources: ArrayLike, destinations: ArrayLike
+            ) -> NDArray[numpy.integer]:
+        len_right, len_left, x_right, x_left, y = \
+            self._wrapped_vector_lengths(sources, destinations)
+        return self._minimize_vectors(
+            numpy.where(len_right < len_left, x_right, x_left), y)
+
     @overrides(Machine.concentric_xys)
     def concentric_xys(self, radius: int, start: XY) -> Iterable[XY]:
         # Aliases for convenience
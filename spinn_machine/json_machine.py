@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
 import logging
 import json
-from typing import NamedTuple, Union
+from typing import Dict, List, NamedTuple, Optional, TextIO, Tuple, Union
 from spinn_utilities.log import FormatAdapter
+from spinn_utilities.typing.coords import XY
 from spinn_utilities.typing.json import JsonArray, JsonObject, JsonValue
 from spinn_machine.data import MachineDataView
+from .board_template import BoardTemplate
 from .chip import Chip
 from .router import Router
 from .link import Link
@@ -73,39 +76,226 @@ def _obj(value: JsonValue) -> JsonObject:
         f"unsupported value type for object field: {type(value)}")
 
 
-def machine_from_json(j_machine: Union[JsonObject, str]) -> Machine:
+def machine_from_json(j_machine: Union[JsonObject, str],
+                      dense: bool = False, lazy: bool = False) -> Machine:
     """
     Generate a model of a machine from a JSON description of that machine.
 
+    A path is read with :py:func:`machine_from_json_stream` so the whole
+    document is never held in memory.
+
     :param j_machine: JSON description of the machine
     :type j_machine: dict in format returned by json.load or a
         str representing a path to the JSON file
+    :param bool dense:
+        if True the machine will hold its chips in a dense (x, y) array
+    :param bool lazy:
+        if True the machine will only create each non-Ethernet chip when it
+        is first used
     :return: The machine model.
     :rtype: Machine
     """
     if isinstance(j_machine, str):
-        with open(j_machine, encoding="utf-8") as j_file:
-            j_machine = _obj(json.load(j_file))
-
-    # get the default values
-    width = _int(j_machine["width"])
-    height = _int(j_machine["height"])
-
-    machine = MachineDataView.get_machine_version().create_machine(
-        width, height, origin="Json")
-    s_monitors = _obj(j_machine["standardResources"])["monitors"]
-    s_router_entries = _int(_obj(
-        j_machine["standardResources"])["routerEntries"])
-    s_sdram = _int(_obj(j_machine["standardResources"])["sdram"])
-    s_tag_ids = _ary(_obj(j_machine["standardResources"])["tags"])
-
-    eth_res = _obj(j_machine["ethernetResources"])
-    e_monitors = eth_res["monitors"]
-    e_router_entries = _int(eth_res["routerEntries"])
-    e_sdram = _int(eth_res["sdram"])
-    e_tag_ids = _ary(eth_res["tags"])
+        return machine_from_json_stream(j_machine, dense, lazy)
 
+    adder = _ChipAdder(j_machine, dense, lazy)
     for aj_chip in _ary(j_machine["chips"]):
+        adder.add_chip(aj_chip)
+    return adder.finish()
+
+
+def machine_from_json_stream(
+        path: str, dense: bool = False, lazy: bool = False) -> Machine:
+    """
+    Generate a model of a machine from a JSON file, adding the chips to the
+    machine as they are parsed.
+
+    Only one chip description is held in memory at a time, so the memory
+    needed is that of the machine model rather than the document plus the
+    model. This relies on the ``chips`` coming after the other values, as
+    written by :py:func:`to_json_path`; if they do not the chips are held
+    until the rest of the document has been read.
+
+    Files compressed with gzip are detected and decompressed as they are
+    read.
+
+    :param str path: The path to the JSON file, which may be gzip compressed
+    :param bool dense:
+        if True the machine will hold its chips in a dense (x, y) array
+    :param bool lazy:
+        if True the machine will only create each non-Ethernet chip when it
+        is first used
+    :return: The machine model.
+    :rtype: Machine
+    """
+    with open(path, "rb") as raw:
+        is_gzip = raw.read(2) == _GZIP_MAGIC
+    j_file: TextIO
+    if is_gzip:
+        j_file = gzip.open(path, "rt", encoding="utf-8")
+    else:
+        j_file = open(path, encoding="utf-8")
+    with j_file:
+        stream = _JsonStream(j_file)
+        header: JsonObject = dict()
+        pending: List[JsonValue] = []
+        adder: Optional[_ChipAdder] = None
+        stream.expect("{")
+        if not stream.next_is("}"):
+            while True:
+                key = _str(stream.value())
+                stream.expect(":")
+                if key != "chips":
+                    header[key] = stream.value()
+                else:
+                    stream.expect("[")
+                    if not stream.next_is("]"):
+                        while True:
+                            aj_chip = stream.value()
+                            if adder is None and _has_header(header):
+                                adder = _ChipAdder(header, dense, lazy)
+                            if adder is None:
+                                pending.append(aj_chip)
+                            else:
+                                adder.add_chip(aj_chip)
+                            if stream.next_is("]"):
+                                break
+                            stream.expect(",")
+                if stream.next_is("}"):
+                    break
+                stream.expect(",")
+
+    if adder is None:
+        adder = _ChipAdder(header, dense, lazy)
+    for aj_chip in pending:
+        adder.add_chip(aj_chip)
+    return adder.finish()
+
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# The values needed before any chip can be added
+_HEADER_KEYS = ("width", "height", "standardResources", "ethernetResources")
+
+
+def _has_header(header: JsonObject) -> bool:
+    return all(key in header for key in _HEADER_KEYS)
+
+
+class _JsonStream(object):
+    """
+    Reads JSON values one at a time from a text file.
+    """
+
+    __slots__ = ("_buffer", "_decoder", "_eof", "_file", "_pos")
+
+    # The number of characters read from the file at a time
+    _CHUNK = 1 << 16
+
+    def __init__(self, j_file: TextIO):
+        self._file = j_file
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _read(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(self._CHUNK)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop what has been used so the buffer stays small
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            while (self._pos < len(self._buffer) and
+                    self._buffer[self._pos] in " \t\n\r"):
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._read():
+                return
+
+    def next_is(self, char: str) -> bool:
+        """
+        Consumes the next non-whitespace character if it is char.
+        """
+        self._skip_whitespace()
+        if self._buffer.startswith(char, self._pos):
+            self._pos += 1
+            return True
+        return False
+
+    def expect(self, char: str) -> None:
+        """
+        Consumes the next non-whitespace character which must be char.
+        """
+        if not self.next_is(char):
+            found = self._buffer[self._pos:self._pos + 20]
+            raise ValueError(f"Expected {char!r} in JSON but found {found!r}")
+
+    def value(self) -> JsonValue:
+        """
+        Consumes and returns the next complete JSON value.
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number at the end of the buffer may not be complete
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._read()
+
+
+class _ChipAdder(object):
+    """
+    Creates a machine from the values of a JSON description other than
+    the chips and then adds the chips one by one.
+    """
+
+    __slots__ = (
+        "_boards", "_e_monitors", "_e_router_entries", "_e_sdram",
+        "_e_tag_ids", "_height", "_lazy", "_machine", "_s_monitors",
+        "_s_router_entries", "_s_sdram", "_s_tag_ids", "_template", "_width")
+
+    def __init__(self, j_machine: JsonObject, dense: bool, lazy: bool):
+        # get the default values
+        self._width = _int(j_machine["width"])
+        self._height = _int(j_machine["height"])
+        self._lazy = lazy
+
+        version = MachineDataView.get_machine_version()
+        self._machine = version.create_machine(
+            self._width, self._height, origin="Json", dense=dense, lazy=lazy)
+        self._template = BoardTemplate.for_chip_core_map(
+            version.chip_core_map)
+        # The board xys and the index of each xy on the board for each board
+        self._boards: Dict[XY, Tuple[List[XY], Dict[XY, int]]] = dict()
+        std_res = _obj(j_machine["standardResources"])
+        self._s_monitors = std_res["monitors"]
+        self._s_router_entries = _int(std_res["routerEntries"])
+        self._s_sdram = _int(std_res["sdram"])
+        self._s_tag_ids = _ary(std_res["tags"])
+
+        eth_res = _obj(j_machine["ethernetResources"])
+        self._e_monitors = eth_res["monitors"]
+        self._e_router_entries = _int(eth_res["routerEntries"])
+        self._e_sdram = _int(eth_res["sdram"])
+        self._e_tag_ids = _ary(eth_res["tags"])
+
+    def add_chip(self, aj_chip: JsonValue) -> None:
+        """
+        Adds the chip described by one element of the chips array.
+        """
+        machine = self._machine
         j_chip = _ary(aj_chip)
         details = _obj(j_chip[2])
         source_x = _int(j_chip[0])
@@ -114,17 +304,17 @@ def machine_from_json(j_machine: Union[JsonObject, str]) -> Machine:
 
         # get the details
         if "ipAddress" in details:
-            ip_address = _str(details["ipAddress"])
-            router_entries = e_router_entries
-            sdram = e_sdram
-            tag_ids = e_tag_ids
-            monitors = e_monitors
+            ip_address: Optional[str] = _str(details["ipAddress"])
+            router_entries = self._e_router_entries
+            sdram = self._e_sdram
+            tag_ids = self._e_tag_ids
+            monitors = self._e_monitors
         else:
             ip_address = None
-            router_entries = s_router_entries
-            sdram = s_sdram
-            tag_ids = s_tag_ids
-            monitors = s_monitors
+            router_entries = self._s_router_entries
+            sdram = self._s_sdram
+            tag_ids = self._s_tag_ids
+            monitors = self._s_monitors
         if len(j_chip) > 3:
             exceptions = _obj(j_chip[3])
             if "monitors" in exceptions:
@@ -144,11 +334,39 @@ def machine_from_json(j_machine: Union[JsonObject, str]) -> Machine:
             dead_links = _ary(details["deadLinks"])
         else:
             dead_links = []
+        board_xy = (_int(board_x), _int(board_y))
+        if (self._lazy and ip_address is None and
+                0 <= source_x < self._width and
+                0 <= source_y < self._height):
+            link_mask = 0
+            for source_link_id in range(Router.MAX_LINKS_PER_ROUTER):
+                if source_link_id not in dead_links:
+                    link_mask |= 1 << source_link_id
+            # A chip without an IP address has no tags by default, so only
+            # tags beyond that need keeping
+            tags = [_int(tag) for tag in tag_ids]
+            machine.add_lazy_chip(
+                source_x, source_y, _int(details["cores"]), link_mask,
+                board_xy[0], board_xy[1], sdram, router_entries,
+                tags or None)
+            return
+        if board_xy not in self._boards:
+            board_xys = self._template.board_xys(machine, *board_xy)
+            self._boards[board_xy] = (board_xys, {
+                xy: index for index, xy in enumerate(board_xys)})
+        board_xys, board_index = self._boards[board_xy]
+        index = board_index.get((source_x, source_y))
+        if index is None:
+            destinations = [
+                machine.xy_over_link(source_x, source_y, source_link_id)
+                for source_link_id in range(Router.MAX_LINKS_PER_ROUTER)]
+        else:
+            destinations = self._template.link_destinations(
+                machine, board_xys, index)
         links = []
         for source_link_id in range(6):
             if source_link_id not in dead_links:
-                destination_x, destination_y = machine.xy_over_link(
-                    source_x, source_y, source_link_id)
+                destination_x, destination_y = destinations[source_link_id]
                 links.append(Link(
                     source_x, source_y, source_link_id, destination_x,
                     destination_y))
@@ -157,14 +375,17 @@ def machine_from_json(j_machine: Union[JsonObject, str]) -> Machine:
         # Create and add a chip with this router
         chip = Chip(
             source_x, source_y, _int(details["cores"]), router, sdram,
-            _int(board_x), _int(board_y), ip_address, [
+            board_xy[0], board_xy[1], ip_address, [
                 _int(tag) for tag in tag_ids])
         machine.add_chip(chip)
 
-    machine.add_spinnaker_links()
-    machine.add_fpga_links()
-
-    return machine
+    def finish(self) -> Machine:
+        """
+        Adds the links that depend on all the chips and returns the machine.
+        """
+        self._machine.add_spinnaker_links()
+        self._machine.add_fpga_links()
+        return self._machine
 
 
 def _int_value(value: int) -> int:
@@ -0,0 +1,278 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from array import array
+from typing import (
+    Any, Callable, Collection, Dict, Iterable, Iterator, Optional, Tuple)
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.typing.coords import XY
+from .chip import Chip
+from .dense_chip_store import DenseChipStore
+from .compact_router import CompactRouter
+
+
+class LazyChipStore(DenseChipStore):
+    """
+    A dense chip store that keeps a compact description of each chip and
+    only creates the Chip (with a CompactRouter) the first time it is
+    asked for.
+
+    A chip is described by its core count, a mask of which of its links
+    exist, the (x, y) of its Ethernet chip, its SDRAM and its router
+    entries, all held in flat arrays indexed by slot.
+    Tags and down cores, which are rare, are held in a dictionary.
+
+    Existence checks, iteration over the (x, y) coordinates, and
+    :py:meth:`has_link` work from the arrays without creating any Chip.
+    """
+
+    __slots__ = (
+        # The x of the Ethernet chip of each slot
+        "_eth_x",
+        # The y of the Ethernet chip of each slot
+        "_eth_y",
+        # The tag ids and down cores of slots that have them
+        "_extras",
+        # One byte per slot with bit n set if link n exists
+        "_link_masks",
+        # The number of cores of each slot
+        "_n_cores",
+        # The number of router entries of each slot
+        "_router_entries",
+        # The SDRAM of each slot
+        "_sdram",
+        # Function to get the (x, y) over a link of an (x, y)
+        "_xy_over_link")
+
+    def __init__(self, width: int, height: int,
+                 xy_over_link: Callable[[int, int, int], XY]):
+        """
+        :param int width: The width of the machine
+        :param int height: The height of the machine
+        :param xy_over_link:
+            The machine's :py:meth:`~spinn_machine.Machine.xy_over_link`
+        """
+        super().__init__(width, height)
+        n_slots = width * height
+        self._n_cores = bytearray(n_slots)
+        self._link_masks = bytearray(n_slots)
+        self._eth_x = array("i", bytes(4 * n_slots))
+        self._eth_y = array("i", bytes(4 * n_slots))
+        self._sdram = array("q", bytes(8 * n_slots))
+        self._router_entries = array("i", bytes(4 * n_slots))
+        self._extras: Dict[int, Tuple[
+            Optional[Iterable[int]], Optional[Collection[int]]]] = dict()
+        self._xy_over_link = xy_over_link
+
+    def register(
+            self, x: int, y: int, n_cores: int, link_mask: int,
+            eth_x: int, eth_y: int, sdram: int, router_entries: int,
+            tag_ids: Optional[Iterable[int]] = None,
+            down_cores: Optional[Collection[int]] = None) -> None:
+        """
+        Record the description of a chip without creating it.
+
+        :param int x:
+        :param int y:
+        :param int n_cores: The number of processors including monitors
+        :param int link_mask: Bit n is set if link n exists
+        :param int eth_x: The x of the nearest Ethernet chip
+        :param int eth_y: The y of the nearest Ethernet chip
+        :param int sdram: The SDRAM of the chip
+        :param int router_entries: The multicast entries of the router
+        :param tag_ids: As for :py:class:`~spinn_machine.Chip`
+        :type tag_ids: iterable(int) or None
+        :param down_cores: As for :py:class:`~spinn_machine.Chip`
+        :type down_cores: iterable(int) or None
+        :raises KeyError: If the (x, y) is outside the machine
+        """
+        index = self.slot(x, y)
+        if index < 0:
+            raise KeyError((x, y))
+        self._n_cores[index] = n_cores
+        self._link_masks[index] = link_mask
+        self._eth_x[index] = eth_x
+        self._eth_y[index] = eth_y
+        self._sdram[index] = sdram
+        self._router_entries[index] = router_entries
+        if tag_ids is not None or down_cores:
+            self._extras[index] = (tag_ids, down_cores)
+        else:
+            self._extras.pop(index, None)
+        # Any previous chip here is replaced by the description
+        self._slots[index] = None
+        if not self._exists[index]:
+            self._exists[index] = 1
+            self._n_chips += 1
+
+    def register_many(
+            self, slots: NDArray[numpy.integer],
+            n_cores: NDArray[numpy.integer],
+            link_masks: NDArray[numpy.integer],
+            eth_x: NDArray[numpy.integer], eth_y: NDArray[numpy.integer],
+            sdram: NDArray[numpy.integer],
+            router_entries: NDArray[numpy.integer]) -> None:
+        """
+        Record the descriptions of many chips in empty slots at once.
+
+        Each argument is an array with one value per chip.
+        The chips have no down cores and the default tags.
+        The caller must make sure the slots are valid, distinct and empty.
+
+        :param ~numpy.ndarray slots: The slot of each chip
+        :param ~numpy.ndarray n_cores:
+        :param ~numpy.ndarray link_masks:
+        :param ~numpy.ndarray eth_x:
+        :param ~numpy.ndarray eth_y:
+        :param ~numpy.ndarray sdram:
+        :param ~numpy.ndarray router_entries:
+        """
+        numpy.frombuffer(self._n_cores, numpy.uint8)[slots] = n_cores
+        numpy.frombuffer(self._link_masks, numpy.uint8)[slots] = link_masks
+        numpy.frombuffer(self._eth_x, numpy.int32)[slots] = eth_x
+        numpy.frombuffer(self._eth_y, numpy.int32)[slots] = eth_y
+        numpy.frombuffer(self._sdram, numpy.int64)[slots] = sdram
+        numpy.frombuffer(
+            self._router_entries, numpy.int32)[slots] = router_entries
+        numpy.frombuffer(self._exists, numpy.uint8)[slots] = 1
+        self._n_chips += len(slots)
+
+    def chip_arrays(self) -> Tuple[
+            NDArray[numpy.uint8], NDArray[numpy.int32],
+            NDArray[numpy.int32]]:
+        """
+        Get the link mask and the (x, y) of the Ethernet chip of every slot
+        without creating any Chip.
+
+        Chips already created are read from the chip so changes to their
+        links are seen.
+        Slots with no chip hold zeros.
+
+        :return: link masks, Ethernet xs and Ethernet ys each indexed by slot
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+        """
+        link_masks = numpy.frombuffer(self._link_masks, numpy.uint8).copy()
+        eth_x = numpy.frombuffer(self._eth_x, numpy.int32).copy()
+        eth_y = numpy.frombuffer(self._eth_y, numpy.int32).copy()
+        for index, chip in enumerate(self._slots):
+            if chip is not None:
+                link_masks[index] = chip.router.link_mask
+                eth_x[index] = chip.nearest_ethernet_x
+                eth_y[index] = chip.nearest_ethernet_y
+        return link_masks, eth_x, eth_y
+
+    def is_materialised(self, x: int, y: int) -> bool:
+        """
+        Determine if the Chip at (x, y) has been created.
+
+        :param int x:
+        :param int y:
+        :rtype: bool
+        """
+        index = self.slot(x, y)
+        if index < 0:
+            return (x, y) in self._overflow
+        return self._slots[index] is not None
+
+    @property
+    def n_materialised(self) -> int:
+        """
+        The number of Chips that have been created so far.
+
+        :rtype: int
+        """
+        return (sum(1 for chip in self._slots if chip is not None) +
+                len(self._overflow))
+
+    def has_link(self, x: int, y: int, link: int) -> bool:
+        """
+        Determine if the chip at (x, y) has the link without creating it.
+
+        :param int x:
+        :param int y:
+        :param int link:
+        :rtype: bool
+        """
+        index = self.slot(x, y)
+        if index < 0:
+            chip = self._overflow.get((x, y))
+            return chip is not None and chip.router.is_link(link)
+        if not self._exists[index]:
+            return False
+        chip = self._slots[index]
+        if chip is not None:
+            return chip.router.is_link(link)
+        return (self._link_masks[index] >> link) & 1 == 1
+
+    def _materialise(self, index: int) -> Chip:
+        y, x = divmod(index, self._width)
+        router = CompactRouter(
+            x, y, self._link_masks[index], self._router_entries[index],
+            self._xy_over_link)
+        tag_ids, down_cores = self._extras.get(index, (None, None))
+        chip = Chip(
+            x, y, self._n_cores[index], router, self._sdram[index],
+            self._eth_x[index], self._eth_y[index],
+            tag_ids=tag_ids, down_cores=down_cores)
+        self._slots[index] = chip
+        return chip
+
+    def chip_at(self, x: int, y: int) -> Optional[Chip]:
+        if 0 <= x < self._width and 0 <= y < self._height:
+            index = y * self._width + x
+            if not self._exists[index]:
+                return None
+            chip = self._slots[index]
+            if chip is None:
+                chip = self._materialise(index)
+            return chip
+        return self._overflow.get((x, y))
+
+    def __getitem__(self, xy: XY) -> Chip:
+        chip = self.chip_at(*xy)
+        if chip is None:
+            raise KeyError(xy)
+        return chip
+
+    def get(self, xy: XY, default: Any = None) -> Any:
+        chip = self.chip_at(*xy)
+        if chip is None:
+            return default
+        return chip
+
+    def __setitem__(self, xy: XY, chip: Chip):
+        super().__setitem__(xy, chip)
+        index = self.slot(*xy)
+        if index >= 0:
+            self._extras.pop(index, None)
+
+    def __delitem__(self, xy: XY):
+        super().__delitem__(xy)
+        index = self.slot(*xy)
+        if index >= 0:
+            self._extras.pop(index, None)
+
+    def values(self) -> Iterator[Chip]:  # type: ignore[override]
+        exists = self._exists
+        for index, chip in enumerate(self._slots):
+            if chip is not None:
+                yield chip
+            elif exists[index]:
+                yield self._materialise(index)
+        yield from self._overflow.values()
+
+    def items(self) -> Iterator[Tuple[XY, Chip]]:  # type: ignore[override]
+        for chip in self.values():
+            yield (chip.x, chip.y), chip
@@ -0,0 +1,208 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The links of a Machine as arrays so the link checks can be done with NumPy.
+"""
+from __future__ import annotations
+from typing import List, Tuple, TYPE_CHECKING
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.typing.coords import XY
+from .router import Router
+if TYPE_CHECKING:
+    from .machine import Machine
+
+# The wraps that join the left and right, and the top and bottom, edges
+_WRAP_X = ("Wrapped", "HorWrap")
+_WRAP_Y = ("Wrapped", "VerWrap")
+
+
+class LinkArray(object):
+    """
+    A snapshot of which chips and links of a Machine exist held as arrays.
+
+    The array of links has shape (height, width, 6) with
+    ``links[y, x, link]`` True if the chip at (x, y) has the link.
+
+    The checks work out the neighbour over each link for every chip at once
+    by shifting the arrays, wrapping round the edges the machine wraps
+    round. Unlike the same checks on :py:class:`~spinn_machine.Machine`,
+    neighbours across a wrap-around are therefore taken into account.
+
+    Chips outside the width and height of the machine are ignored.
+    Later changes to the machine are not seen.
+    """
+
+    __slots__ = (
+        # The slot of the Ethernet chip of each chip or -1 if no chip
+        "_ethernet",
+        # True where there is a chip
+        "_exists",
+        # The (x, y) added by each link
+        "_link_add",
+        # True where there is a link
+        "_links",
+        # True if the left and right edges join
+        "_wrap_x",
+        # True if the top and bottom edges join
+        "_wrap_y")
+
+    def __init__(self, machine: Machine):
+        """
+        :param Machine machine: The machine to read the links of
+        """
+        width, height = machine.width, machine.height
+        n_slots = width * height
+        lazy = machine._lazy  # pylint: disable=protected-access
+        if lazy is not None:
+            link_masks, eth_x, eth_y = lazy.chip_arrays()
+            exists = numpy.frombuffer(
+                lazy.existence_bitmap, dtype=numpy.uint8).astype(bool)
+        else:
+            slots, link_mask_list, eth_x_list, eth_y_list = [], [], [], []
+            for chip in machine.chips:
+                if 0 <= chip.x < width and 0 <= chip.y < height:
+                    slots.append(chip.y * width + chip.x)
+                    link_mask_list.append(chip.router.link_mask)
+                    eth_x_list.append(chip.nearest_ethernet_x)
+                    eth_y_list.append(chip.nearest_ethernet_y)
+            exists = numpy.zeros(n_slots, dtype=bool)
+            exists[slots] = True
+            link_masks = numpy.zeros(n_slots, dtype=numpy.uint8)
+            link_masks[slots] = link_mask_list
+            eth_x = numpy.zeros(n_slots, dtype=numpy.int64)
+            eth_x[slots] = eth_x_list
+            eth_y = numpy.zeros(n_slots, dtype=numpy.int64)
+            eth_y[slots] = eth_y_list
+
+        self._exists = exists.reshape(height, width)
+        bits = numpy.arange(Router.MAX_LINKS_PER_ROUTER, dtype=numpy.uint8)
+        self._links = (((link_masks[:, None] >> bits) & 1).astype(bool) &
+                       exists[:, None]).reshape(
+                           height, width, Router.MAX_LINKS_PER_ROUTER)
+        self._ethernet = numpy.where(
+            exists, eth_y.astype(numpy.int64) * width + eth_x, -1).reshape(
+                height, width)
+        self._link_add = machine.LINK_ADD_TABLE
+        self._wrap_x = machine.wrap in _WRAP_X
+        self._wrap_y = machine.wrap in _WRAP_Y
+
+    @property
+    def links(self) -> NDArray[numpy.bool_]:
+        """
+        Which links exist, indexed by y, x and link.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self._links
+
+    @property
+    def exists(self) -> NDArray[numpy.bool_]:
+        """
+        Which chips exist, indexed by y and x.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self._exists
+
+    def over_link(self, array: NDArray, link: int, fill) -> NDArray:
+        """
+        Get for every (x, y) the value of an array at the (x, y) over a link.
+
+        :param ~numpy.ndarray array: An array indexed by y and x first
+        :param int link: The link to look over
+        :param fill: The value where the link leaves the machine
+        :rtype: ~numpy.ndarray
+        """
+        add_x, add_y = self._link_add[link]
+        result = numpy.roll(array, (-add_y, -add_x), axis=(0, 1))
+        if not self._wrap_x and add_x != 0:
+            result[:, -1 if add_x > 0 else 0] = fill
+        if not self._wrap_y and add_y != 0:
+            result[-1 if add_y > 0 else 0] = fill
+        return result
+
+    @staticmethod
+    def _xys(found: NDArray[numpy.bool_]) -> List[XY]:
+        ys, xs = numpy.nonzero(found)
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def _incoming(self, link: int) -> NDArray[numpy.bool_]:
+        """
+        Where the chip over a link has the link coming back.
+        """
+        back = Router.opposite(link)
+        return self.over_link(self._links[:, :, back], link, False)
+
+    def _same_board(self, link: int) -> NDArray[numpy.bool_]:
+        """
+        Where the chip over a link exists and is on the same board.
+        """
+        return self.over_link(self._ethernet, link, -2) == self._ethernet
+
+    def one_way_links(self) -> List[Tuple[int, int, int, int]]:
+        """
+        Get the links whose destination does not have a link back.
+
+        :return: (x, y, link, back) of each one way link
+        :rtype: list(tuple(int,int,int,int))
+        """
+        one_way = numpy.stack([
+            self._links[:, :, link] & ~self._incoming(link)
+            for link in range(Router.MAX_LINKS_PER_ROUTER)], axis=-1)
+        ys, xs, links = numpy.nonzero(one_way)
+        return [(x, y, link, Router.opposite(link)) for x, y, link in zip(
+            xs.tolist(), ys.tolist(), links.tolist())]
+
+    def unreachable_outgoing_chips(self) -> List[XY]:
+        """
+        Detects chips that can not reach any of their neighbours.
+
+        :rtype: list(tuple(int,int))
+        """
+        return self._xys(self._exists & ~self._links.any(axis=-1))
+
+    def unreachable_incoming_chips(self) -> List[XY]:
+        """
+        Detects chips that are not reachable from any of their neighbours.
+
+        :rtype: list(tuple(int,int))
+        """
+        reached = numpy.zeros_like(self._exists)
+        for link in range(Router.MAX_LINKS_PER_ROUTER):
+            reached |= self._incoming(link)
+        return self._xys(self._exists & ~reached)
+
+    def unreachable_outgoing_local_chips(self) -> List[XY]:
+        """
+        Detects chips that can not reach any of their *local* neighbours.
+
+        :rtype: list(tuple(int,int))
+        """
+        reaches = numpy.zeros_like(self._exists)
+        for link in range(Router.MAX_LINKS_PER_ROUTER):
+            reaches |= self._links[:, :, link] & self._same_board(link)
+        return self._xys(self._exists & ~reaches)
+
+    def unreachable_incoming_local_chips(self) -> List[XY]:
+        """
+        Detects chips that are not reachable from any of their *local*
+        neighbours.
+
+        :rtype: list(tuple(int,int))
+        """
+        reached = numpy.zeros_like(self._exists)
+        for link in range(Router.MAX_LINKS_PER_ROUTER):
+            reached |= self._incoming(link) & self._same_board(link)
+        return self._xys(self._exists & ~reached)
@@ -15,18 +15,29 @@ from __future__ import annotations
 from collections import Counter
 import logging
 from typing import (
-    Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union,
-    TYPE_CHECKING)
+    Collection, Dict, Iterable, Iterator, List, MutableMapping, Optional,
+    Sequence, Tuple, Union, TYPE_CHECKING)
+import numpy
+from numpy.typing import ArrayLike, NDArray
 from typing_extensions import TypeAlias
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spinn_utilities.typing.coords import XY
 from spinn_machine.data import MachineDataView
-from spinn_machine.link_data_objects import FPGALinkData, SpinnakerLinkData
+from spinn_machine.link_data_objects import (
+    AbstractLinkData, FPGALinkData, SpinnakerLinkData)
+from .dense_chip_store import DenseChipStore
+from .board_index import BoardIndex
+from .lazy_chip_store import LazyChipStore
+from .link_array import LinkArray
+from .distance_matrix import (
+    existing_slots, full_distance_matrix, slot_coordinates)
 from .exceptions import (
     SpinnMachineAlreadyExistsException, SpinnMachineException)
+from .router import LINK_MASK_COUNTS, Router
 
 if TYPE_CHECKING:
     from .chip import Chip
+    from .link import Link
 
 logger = logging.getLogger(__name__)
 _SpinLinkKey: TypeAlias = Tuple[Union[str, XY], int]
@@ -49,16 +60,22 @@ class Machine(object, metaclass=AbstractBase):
     LINK_ADD_TABLE = [(1, 0), (1, 1), (0, 1), (-1, 0), (-1, -1), (0, -1)]
 
     __slots__ = (
+        # The chips grouped by board
+        "_board_index",
         "_boot_ethernet_address",
         # A map off the expected x, y coordinates on a standard board to
         # the most likely number of cores on that chip.
         "_chip_core_map",
         "_chips",
+        # The DenseChipStore if the chips are held in one; otherwise None
+        "_dense",
         "_ethernet_connected_chips",
         "_fpga_links",
         # Declared height of the machine
         # This can not be changed
         "_height",
+        # The LazyChipStore if the chips are created on demand; otherwise None
+        "_lazy",
         # A Counter of the number of cores on each Chip
         "_n_cores_counter",
         # A Counter of links on each Chip
@@ -72,13 +89,15 @@ class Machine(object, metaclass=AbstractBase):
         "_spinnaker_links",
         # A Counter for SDRAM on each Chip
         "_sdram_counter",
+        # An (x, y) found by get_unused_xy or None if not known
+        "_unused_xy",
         # Declared width of the machine
         # This can not be changed
         "_width"
     )
 
     def __init__(self, width: int, height: int, chip_core_map: Dict[XY, int],
-                 origin: str = ""):
+                 origin: str = "", dense: bool = False, lazy: bool = False):
         """
         :param int width: The width of the machine excluding
         :param int height:
@@ -88,6 +107,15 @@ class Machine(object, metaclass=AbstractBase):
             the most likely number of cores on that chip.
         :param str origin: Extra information about how this machine was created
             to be used in the str method. Example "``Virtual``" or "``Json``"
+        :param bool dense:
+            If True the chips are held in a
+            :py:class:`~spinn_machine.dense_chip_store.DenseChipStore` so
+            lookups by (x, y) are array indexes rather than tuple hashes.
+        :param bool lazy:
+            If True the chips are held in a
+            :py:class:`~spinn_machine.lazy_chip_store.LazyChipStore` so
+            chips added with :py:meth:`add_lazy_chip` are only created when
+            first used. Implies dense.
         :raise SpinnMachineAlreadyExistsException:
             If any two chips have the same x and y coordinates
         """
@@ -109,8 +137,21 @@ class Machine(object, metaclass=AbstractBase):
         # Store the boot chip information
         self._boot_ethernet_address: Optional[str] = None
 
-        # The dictionary of chips
-        self._chips: Dict[XY, Chip] = dict()
+        # The mapping of (x, y) to chips
+        self._chips: MutableMapping[XY, Chip]
+        if lazy:
+            self._lazy: Optional[LazyChipStore] = LazyChipStore(
+                width, height, self.xy_over_link)
+            self._dense: Optional[DenseChipStore] = self._lazy
+            self._chips = self._lazy
+        elif dense:
+            self._lazy = None
+            self._dense = DenseChipStore(width, height)
+            self._chips = self._dense
+        else:
+            self._lazy = None
+            self._dense = None
+            self._chips = dict()
 
         self._origin = origin
 
@@ -119,6 +160,9 @@ class Machine(object, metaclass=AbstractBase):
         self._n_router_entries_counter: Counter[int] = Counter()
         self._sdram_counter: Counter[int] = Counter()
 
+        self._board_index = BoardIndex(self.get_xys_by_ethernet)
+        self._unused_xy: Optional[XY] = None
+
     @abstractmethod
     def multiple_48_chip_boards(self) -> bool:
         """
@@ -200,7 +244,6 @@ class Machine(object, metaclass=AbstractBase):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def get_down_xys_by_ethernet(
             self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
         """
@@ -221,7 +264,7 @@ class Machine(object, metaclass=AbstractBase):
         :return: Yields the (x, y) of the down chips on this board.
         :rtype: iterable(tuple(int,int))
         """
-        raise NotImplementedError
+        return self._board_index.down_xys((ethernet_x, ethernet_y))
 
     def get_chips_by_ethernet(
             self, ethernet_x: int, ethernet_y: int) -> Iterable[Chip]:
@@ -244,7 +287,6 @@ class Machine(object, metaclass=AbstractBase):
                 ethernet_x, ethernet_y):
             yield self._chips[chip_xy]
 
-    @abstractmethod
     def get_existing_xys_by_ethernet(
             self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
         """
@@ -263,7 +305,46 @@ class Machine(object, metaclass=AbstractBase):
         :return: Yields the (x,y)s of chips on this board.
         :rtype: iterable(tuple(int,int))
         """
-        raise NotImplementedError
+        return self._board_index.existing_xys((ethernet_x, ethernet_y))
+
+    def get_n_chips_by_ethernet(self, ethernet_x: int, ethernet_y: int) -> int:
+        """
+        The number of chips on the board with this Ethernet-enabled chip.
+
+        :param int ethernet_x:
+            The X coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :param int ethernet_y:
+            The Y coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :rtype: int
+        """
+        return self._board_index.n_chips((ethernet_x, ethernet_y))
+
+    def get_cores_count_by_ethernet(
+            self, ethernet_x: int, ethernet_y: int) -> int:
+        """
+        The total number of processors of the chips on the board with this
+        Ethernet-enabled chip.
+
+        :param int ethernet_x:
+            The X coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :param int ethernet_y:
+            The Y coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :rtype: int
+        """
+        return self._board_index.n_cores((ethernet_x, ethernet_y))
+
+    def get_sdram_by_ethernet(self, ethernet_x: int, ethernet_y: int) -> int:
+        """
+        The total SDRAM of the chips on the board with this
+        Ethernet-enabled chip.
+
+        :param int ethernet_x:
+            The X coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :param int ethernet_y:
+            The Y coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :rtype: int
+        """
+        return self._board_index.sdram((ethernet_x, ethernet_y))
 
     @abstractmethod
     def xy_over_link(self, x: int, y: int, link: int) -> XY:
@@ -457,6 +538,110 @@ class Machine(object, metaclass=AbstractBase):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_vector_lengths(
+            self, sources: ArrayLike, destinations: ArrayLike
+            ) -> NDArray[numpy.integer]:
+        """
+        Batch version of :py:meth:`get_vector_length`.
+
+        Computes the length of the shortest vector for every source and
+        destination pair in one call using the same wrap-aware algorithm.
+
+        Sources and destinations are arrays with (x, y) in the last axis,
+        so shape (n, 2) for n pairs. They are broadcast against each other
+        so a single (x, y) can be compared with many.
+
+        .. warning::
+            GIGO: This method does not check if input parameters make sense.
+
+        :param sources: (x,y) coordinates of the source chips
+        :type sources: ~numpy.ndarray
+        :param destinations: (x,y) coordinates of the destination chips
+        :type destinations: ~numpy.ndarray
+        :return: The distances in steps, one per pair
+        :rtype: ~numpy.ndarray
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_vectors(
+            self, sources: ArrayLike, destinations: ArrayLike
+            ) -> NDArray[numpy.integer]:
+        """
+        Batch version of :py:meth:`get_vector`.
+
+        Sources and destinations are as for :py:meth:`get_vector_lengths`.
+
+        :param sources: (x,y) coordinates of the source chips
+        :type sources: ~numpy.ndarray
+        :param destinations: (x,y) coordinates of the destination chips
+        :type destinations: ~numpy.ndarray
+        :return: The (x, y, z) vectors with the vector in the last axis
+        :rtype: ~numpy.ndarray
+        """
+        raise NotImplementedError
+
+    def distance_matrix(
+            self, existing_only: bool = False,
+            cache_dir: Optional[str] = None) -> NDArray[numpy.integer]:
+        """
+        Get the hop distance between every pair of chip positions.
+
+        The distances are those of :py:meth:`get_vector_length` so they take
+        wrap-arounds into consideration but do not check if the chips and
+        links assumed actually exist.
+
+        Rows and columns are in slot order, i.e. ``y * width + x``.
+        :py:meth:`distance_matrix_xys` gives the (x, y) of each row.
+
+        The matrix over all positions is memoised per version, width, height
+        and wrap so later calls (even on other Machine objects) are free.
+        If a cache_dir is given the matrix is also saved there as a ``.npy``
+        file and later runs memory-map that file rather than recompute it.
+
+        :param bool existing_only:
+            If True only rows and columns for chips that exist are returned
+        :param cache_dir: Directory to save and load the matrix or None
+        :type cache_dir: str or None
+        :return: A square matrix of hop distances, which is read-only when
+            over all positions as it is shared
+        :rtype: ~numpy.ndarray
+        """
+        matrix = full_distance_matrix(self, cache_dir)
+        if not existing_only:
+            return matrix
+        slots = existing_slots(self)
+        return matrix[numpy.ix_(slots, slots)]
+
+    def distance_matrix_xys(
+            self, existing_only: bool = False) -> NDArray[numpy.integer]:
+        """
+        The (x, y) coordinates of the rows of :py:meth:`distance_matrix`.
+
+        :param bool existing_only:
+            If True only the coordinates of chips that exist are returned
+        :return: An array of shape (n, 2)
+        :rtype: ~numpy.ndarray
+        """
+        coords = slot_coordinates(self._width, self._height)
+        if existing_only:
+            return coords[existing_slots(self)]
+        return coords
+
+    def link_array(self) -> LinkArray:
+        """
+        Get the chips and links of the machine as arrays.
+
+        The checks of the result, such as
+        :py:meth:`~spinn_machine.link_array.LinkArray.one_way_links`,
+        work on the whole machine at once so are much faster than the
+        methods of the same name here on large machines.
+
+        :rtype: ~spinn_machine.link_array.LinkArray
+        """
+        return LinkArray(self)
+
     @abstractmethod
     def concentric_xys(self, radius: int, start: XY) -> Iterable[XY]:
         """
@@ -578,12 +763,138 @@ class Machine(object, metaclass=AbstractBase):
         self._n_router_entries_counter[
             chip.router.n_available_multicast_entries] += 1
         self._sdram_counter[chip.sdram] += 1
+        self._index_chip(
+            chip.x, chip.y, chip.nearest_ethernet_x, chip.nearest_ethernet_y,
+            chip.n_processors, chip.sdram)
 
         if chip.ip_address is not None:
             self._ethernet_connected_chips.append(chip)
             if (chip == (0, 0)):
                 self._boot_ethernet_address = chip.ip_address
 
+    def add_lazy_chip(
+            self, x: int, y: int, n_cores: int, link_mask: int,
+            eth_x: int, eth_y: int, sdram: int, router_entries: int,
+            tag_ids: Optional[Iterable[int]] = None,
+            down_cores: Optional[Collection[int]] = None):
+        """
+        Add the description of a chip to a lazy machine.
+
+        The Chip is only created when it is first asked for, but the chip
+        counts immediately in the aggregates such as :py:attr:`n_chips` and
+        :py:meth:`get_cores_count`.
+
+        Chips with an IP address must be added with :py:meth:`add_chip`.
+
+        :param int x:
+        :param int y:
+        :param int n_cores: The number of processors including monitors
+        :param int link_mask: Bit n is set if link n exists
+        :param int eth_x: The x of the nearest Ethernet chip
+        :param int eth_y: The y of the nearest Ethernet chip
+        :param int sdram: The SDRAM of the chip
+        :param int router_entries: The multicast entries of the router
+        :param tag_ids: As for :py:class:`~spinn_machine.Chip`
+        :type tag_ids: iterable(int) or None
+        :param down_cores: As for :py:class:`~spinn_machine.Chip`
+        :type down_cores: iterable(int) or None
+        :raise SpinnMachineException:
+            If the machine is not lazy or (x, y) is outside the machine
+        :raise SpinnMachineAlreadyExistsException:
+            If a chip with the same x and y coordinates already exists
+        """
+        if self._lazy is None:
+            raise SpinnMachineException(
+                "Chips can only be added lazily to a lazy machine")
+        if self._lazy.slot(x, y) < 0:
+            raise SpinnMachineException(
+                f"Chip {x}, {y} is outside the machine so can not be lazy")
+        if self._lazy.has_chip(x, y):
+            raise SpinnMachineAlreadyExistsException("chip", f"{x}, {y}")
+        self._lazy.register(
+            x, y, n_cores, link_mask, eth_x, eth_y, sdram, router_entries,
+            tag_ids, down_cores)
+
+        n_processors = n_cores
+        if down_cores:
+            n_monitors = MachineDataView.get_machine_version().n_scamp_cores
+            n_processors -= sum(
+                1 for core in set(down_cores) if n_monitors <= core < n_cores)
+        self._n_cores_counter[n_processors] += 1
+        self._n_links_counter[LINK_MASK_COUNTS[link_mask]] += 1
+        self._n_router_entries_counter[router_entries] += 1
+        self._sdram_counter[sdram] += 1
+        self._index_chip(x, y, eth_x, eth_y, n_processors, sdram)
+
+    def _index_chip(self, x: int, y: int, eth_x: int, eth_y: int,
+                    n_processors: int, sdram: int):
+        self._board_index.add((x, y), (eth_x, eth_y), n_processors, sdram)
+        # A new chip or board may cover the unused (x, y)
+        if (x, y) == (eth_x, eth_y) or (x, y) == self._unused_xy:
+            self._unused_xy = None
+
+    def add_lazy_chips(
+            self, xs: ArrayLike, ys: ArrayLike, n_cores: ArrayLike,
+            link_masks: ArrayLike, eth_xs: ArrayLike, eth_ys: ArrayLike,
+            sdrams: ArrayLike, router_entries: ArrayLike):
+        """
+        Add the descriptions of many chips to a lazy machine at once.
+
+        Each argument is an array with one value per chip, as for
+        :py:meth:`add_lazy_chip`. The chips have no down cores and the
+        default tags.
+
+        :raise SpinnMachineException:
+            If the machine is not lazy or any (x, y) is outside the machine
+        :raise SpinnMachineAlreadyExistsException:
+            If a chip with the same x and y coordinates already exists
+        """
+        if self._lazy is None:
+            raise SpinnMachineException(
+                "Chips can only be added lazily to a lazy machine")
+        x_array = numpy.asarray(xs, dtype=numpy.int64)
+        y_array = numpy.asarray(ys, dtype=numpy.int64)
+        outside = ((x_array < 0) | (x_array >= self._width) |
+                   (y_array < 0) | (y_array >= self._height))
+        if outside.any():
+            index = int(numpy.argmax(outside))
+            raise SpinnMachineException(
+                f"Chip {x_array[index]}, {y_array[index]} is outside the "
+                "machine so can not be lazy")
+        slots = y_array * self._width + x_array
+        existing = numpy.frombuffer(self._lazy.existence_bitmap, numpy.uint8)
+        clashes = existing[slots] != 0
+        unique, first = numpy.unique(slots, return_index=True)
+        if clashes.any() or len(unique) < len(slots):
+            if not clashes.any():
+                repeated = numpy.ones(len(slots), dtype=bool)
+                repeated[first] = False
+                clashes = repeated
+            index = int(numpy.argmax(clashes))
+            raise SpinnMachineAlreadyExistsException(
+                "chip", f"{x_array[index]}, {y_array[index]}")
+        masks = numpy.asarray(link_masks, dtype=numpy.uint8)
+        cores = numpy.asarray(n_cores, dtype=numpy.uint8)
+        sdram_array = numpy.asarray(sdrams, dtype=numpy.int64)
+        entries = numpy.asarray(router_entries, dtype=numpy.int32)
+        self._lazy.register_many(
+            slots, cores, masks, numpy.asarray(eth_xs, dtype=numpy.int32),
+            numpy.asarray(eth_ys, dtype=numpy.int32), sdram_array, entries)
+
+        link_counts = numpy.frombuffer(LINK_MASK_COUNTS, numpy.uint8)[masks]
+        for counter, values in (
+                (self._n_cores_counter, cores),
+                (self._n_links_counter, link_counts),
+                (self._n_router_entries_counter, entries),
+                (self._sdram_counter, sdram_array)):
+            for value, count in zip(*numpy.unique(values, return_counts=True)):
+                counter[int(value)] += int(count)
+        for x, y, eth_x, eth_y, n_processors, sdram in zip(
+                x_array.tolist(), y_array.tolist(),
+                numpy.asarray(eth_xs).tolist(), numpy.asarray(eth_ys).tolist(),
+                cores.tolist(), sdram_array.tolist()):
+            self._index_chip(x, y, eth_x, eth_y, n_processors, sdram)
+
     def add_chips(self, chips: Iterable[Chip]):
         """
         Add some chips to the machine.
@@ -596,6 +907,145 @@ class Machine(object, metaclass=AbstractBase):
         for next_chip in chips:
             self.add_chip(next_chip)
 
+    def remove_chip(self, x: int, y: int) -> Chip:
+        """
+        Remove a chip from the machine in place.
+
+        The links of other chips that lead to the chip are removed too,
+        as are the SpiNNaker and FPGA links connected to the chip.
+        If the chip is an Ethernet chip the SpiNNaker and FPGA links of its
+        board are removed as well.
+
+        Only the chip and its neighbours are looked at, so this is much
+        cheaper than building a new machine without the chip.
+
+        :param int x:
+        :param int y:
+        :return: The chip removed
+        :rtype: ~spinn_machine.Chip
+        :raise SpinnMachineException: If there is no chip at (x, y)
+        """
+        chip = self.get_chip_at(x, y)
+        if chip is None:
+            raise SpinnMachineException(
+                f"There is no chip at {x}, {y} to remove")
+
+        for link_id in range(Router.MAX_LINKS_PER_ROUTER):
+            dest_x, dest_y = self.xy_over_link(x, y, link_id)
+            back = Router.opposite(link_id)
+            if self.is_link_at(dest_x, dest_y, back) and self[
+                    dest_x, dest_y].router.get_destination(back) == (x, y):
+                self.remove_link(dest_x, dest_y, back)
+
+        del self._chips[x, y]
+        self._board_index.remove(
+            (x, y), (chip.nearest_ethernet_x, chip.nearest_ethernet_y),
+            chip.n_processors, chip.sdram)
+        # An earlier (x, y) may now be unused
+        self._unused_xy = None
+        self._uncount(self._n_cores_counter, chip.n_processors)
+        self._uncount(self._n_links_counter, len(chip.router))
+        self._uncount(self._n_router_entries_counter,
+                      chip.router.n_available_multicast_entries)
+        self._uncount(self._sdram_counter, chip.sdram)
+
+        if chip.ip_address is not None:
+            self._ethernet_connected_chips.remove(chip)
+            if chip == (0, 0):
+                self._boot_ethernet_address = None
+        self._remove_link_data(chip)
+        return chip
+
+    def remove_link(self, x: int, y: int, link: int) -> Link:
+        """
+        Remove one direction of a link from the machine in place.
+
+        The link back from the other chip, if any, is not removed.
+        If the link was where a SpiNNaker link is connected, the SpiNNaker
+        link is added as it would be for a new machine.
+
+        :param int x:
+        :param int y:
+        :param int link: The ID of the link on the chip at (x, y)
+        :return: The link removed
+        :rtype: ~spinn_machine.Link
+        :raise SpinnMachineException:
+            If there is no chip at (x, y) or it does not have the link
+        """
+        chip = self.get_chip_at(x, y)
+        if chip is None:
+            raise SpinnMachineException(
+                f"There is no chip at {x}, {y} to remove a link from")
+        n_links = len(chip.router)
+        removed = chip.router.remove_link(link)
+        self._uncount(self._n_links_counter, n_links)
+        self._n_links_counter[n_links - 1] += 1
+
+        if self._width == self._height == 2:
+            chip_0_0 = self.get_chip_at(0, 0)
+            if chip_0_0 is not None and chip_0_0.ip_address is not None:
+                if chip == (0, 0) and link == 3:
+                    self._add_spinnaker_link(0, 0, 0, 3, chip_0_0.ip_address)
+                elif chip == (1, 0) and link == 0:
+                    self._add_spinnaker_link(1, 1, 0, 0, chip_0_0.ip_address)
+        elif chip.ip_address is not None and link == 4 and (
+                self._width == self._height == 8 or
+                self.multiple_48_chip_boards()):
+            self._add_spinnaker_link(0, x, y, 4, chip.ip_address)
+        return removed
+
+    @staticmethod
+    def _uncount(counter: Counter[int], value: int):
+        counter[value] -= 1
+        if counter[value] == 0:
+            del counter[value]
+
+    def _remove_link_data(self, chip: Chip):
+        """
+        Remove the SpiNNaker and FPGA links connected to a chip, and those
+        of its board if it is an Ethernet chip.
+
+        :param ~spinn_machine.Chip chip:
+        """
+        ip = chip.ip_address
+        eth_xy = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+        # Link data is keyed by both the chip and the board address
+        start_keys: List[Union[str, XY]] = [(chip.x, chip.y)]
+        if ip is not None:
+            start_keys.append(ip)
+
+        def doomed(link_data: AbstractLinkData) -> bool:
+            return (link_data.board_address == ip or (
+                link_data.connected_chip_x == chip.x and
+                link_data.connected_chip_y == chip.y))
+
+        for spinnaker_link_id in (0, 1):
+            for s_key in start_keys:
+                spinnaker = self._spinnaker_links.get(
+                    (s_key, spinnaker_link_id))
+                if spinnaker is None or not doomed(spinnaker):
+                    continue
+                for key in (
+                        (spinnaker.board_address, spinnaker_link_id),
+                        ((spinnaker.connected_chip_x,
+                          spinnaker.connected_chip_y), spinnaker_link_id)):
+                    if self._spinnaker_links.get(key) is spinnaker:
+                        del self._spinnaker_links[key]
+
+        # Each board has 3 FPGAs each with 16 links
+        for fpga_id in range(3):
+            for fpga_link in range(16):
+                for f_key in start_keys:
+                    fpga = self._fpga_links.get((f_key, fpga_id, fpga_link))
+                    if fpga is None or not doomed(fpga):
+                        continue
+                    for b_key in (
+                            fpga.board_address, eth_xy,
+                            (fpga.connected_chip_x, fpga.connected_chip_y)):
+                        f_link_key = (b_key, fpga_id, fpga_link)
+                        if self._fpga_links.get(f_link_key) is fpga:
+                            del self._fpga_links[f_link_key]
+
     @property
     def chips(self) -> Iterator[Chip]:
         """
@@ -647,6 +1097,8 @@ class Machine(object, metaclass=AbstractBase):
             or ``None`` if no such chip
         :rtype: ~spinn_machine.Chip or None
         """
+        if self._dense is not None:
+            return self._dense.chip_at(x, y)
         return self._chips.get((x, y))
 
     def __getitem__(self, x_y_tuple: XY) -> Chip:
@@ -671,6 +1123,8 @@ class Machine(object, metaclass=AbstractBase):
         :return: True if the chip exists, False otherwise
         :rtype: bool
         """
+        if self._dense is not None:
+            return self._dense.has_chip(x, y)
         return (x, y) in self._chips
 
     def is_link_at(self, x: int, y: int, link: int) -> bool:
@@ -681,6 +1135,8 @@ class Machine(object, metaclass=AbstractBase):
         :param int y: The y location of the chip to test the link of
         :param int link: The link to test the existence of
         """
+        if self._dense is not None:
+            return self._dense.has_link(x, y, link)
         return (x, y) in self._chips and self._chips[x, y].router.is_link(link)
 
     def __contains__(self, x_y_tuple: XY):
@@ -696,6 +1152,25 @@ class Machine(object, metaclass=AbstractBase):
         """
         return x_y_tuple in self._chips
 
+    @property
+    def is_dense(self) -> bool:
+        """
+        Whether the chips are held in a dense (x, y) indexed array.
+
+        :rtype: bool
+        """
+        return self._dense is not None
+
+    @property
+    def is_lazy(self) -> bool:
+        """
+        Whether chips added by :py:meth:`add_lazy_chip` are only created
+        when first used.
+
+        :rtype: bool
+        """
+        return self._lazy is not None
+
     @property
     def width(self) -> int:
         """
@@ -1082,7 +1557,8 @@ class Machine(object, metaclass=AbstractBase):
 
         :rtype: int
         """
-        return sum(chip.n_placable_processors for chip in self.chips)
+        n_monitors = MachineDataView.get_machine_version().n_scamp_cores
+        return self.get_cores_count() - self.n_chips * n_monitors
 
     @property
     def total_cores(self) -> int:
@@ -1091,7 +1567,7 @@ class Machine(object, metaclass=AbstractBase):
 
         :rtype: int
         """
-        return sum(chip.n_processors for chip in self.chips)
+        return self.get_cores_count()
 
     def unreachable_outgoing_chips(self) -> List[XY]:
         """
@@ -1206,11 +1682,14 @@ class Machine(object, metaclass=AbstractBase):
         """
         link_checks = [(0, 3), (1, 4), (2, 5), (3, 0), (4, 1), (5, 2)]
         for chip in self.chips:
+            router = chip.router
+            link_mask = router.link_mask
             for out, back in link_checks:
-                link = chip.router.get_link(out)
-                if link is not None:
+                if (link_mask >> out) & 1:
+                    destination = router.get_destination(out)
+                    assert destination is not None
                     if not self.is_link_at(
-                            link.destination_x, link.destination_y, back):
+                            destination[0], destination[1], back):
                         yield chip.x, chip.y, out, back
 
     @staticmethod
@@ -1253,6 +1732,65 @@ class Machine(object, metaclass=AbstractBase):
                 else:
                     return (x - y, 0, -y)
 
+    @staticmethod
+    def _minimize_vectors(
+            x: NDArray[numpy.integer],
+            y: NDArray[numpy.integer]) -> NDArray[numpy.integer]:
+        """
+        Batch version of :py:meth:`_minimize_vector`.
+
+        When x and y have the same sign the one nearest to zero is moved
+        into z, otherwise the vector is already minimal.
+
+        :param ~numpy.ndarray x:
+        :param ~numpy.ndarray y:
+        :return: (x, y, z) vectors with the vector in the last axis
+        :rtype: ~numpy.ndarray
+        """
+        same_sign = (x > 0) == (y > 0)
+        delta = numpy.where(
+            x > 0, numpy.minimum(x, y), numpy.maximum(x, y))
+        delta = numpy.where(same_sign, delta, 0)
+        return numpy.stack((x - delta, y - delta, -delta), axis=-1)
+
+    @staticmethod
+    def _minimized_lengths(
+            x: NDArray[numpy.integer],
+            y: NDArray[numpy.integer]) -> NDArray[numpy.integer]:
+        """
+        Gets the lengths of the minimised (x, y, 0) vectors without
+        building them.
+
+        Where x and y have the same sign the length is the greater
+        absolute value otherwise it is the sum of the absolute values.
+
+        :param ~numpy.ndarray x:
+        :param ~numpy.ndarray y:
+        :rtype: ~numpy.ndarray
+        """
+        abs_x = numpy.abs(x)
+        abs_y = numpy.abs(y)
+        return numpy.where(
+            (x > 0) == (y > 0), numpy.maximum(abs_x, abs_y), abs_x + abs_y)
+
+    @staticmethod
+    def _vector_deltas(
+            sources: ArrayLike, destinations: ArrayLike) -> Tuple[
+                NDArray[numpy.integer], NDArray[numpy.integer]]:
+        """
+        Converts source and destination arrays into x and y deltas.
+
+        :param sources: (x, y) coordinates with the (x, y) in the last axis
+        :param destinations:
+            (x, y) coordinates with the (x, y) in the last axis
+        :return: destination x - source x, destination y - source y
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        source_array = numpy.asarray(sources, dtype=numpy.int64)
+        destination_array = numpy.asarray(destinations, dtype=numpy.int64)
+        delta = destination_array - source_array
+        return delta[..., 0], delta[..., 1]
+
     @property
     def local_xys(self) -> Iterable[XY]:
         """
@@ -1285,16 +1823,15 @@ class Machine(object, metaclass=AbstractBase):
         :return: an unused (x,y) coordinate
         :rtype: (int, int)
         """
-        # get a set of xys that could be connected to any existing Ethernet
-        xys_by_ethernet: Set[XY] = set()
-        for ethernet_x, ethernet_y in self.ethernet_connected_chips:
-            xys_by_ethernet.update(self.get_xys_by_ethernet(
-                ethernet_x, ethernet_y))
+        if self._unused_xy is not None:
+            return self._unused_xy
         x = 0
         while (True):
             for y in range(self.height):
                 xy = (x, y)
-                if xy not in self._chips and xy not in xys_by_ethernet:
+                if (xy not in self._chips and
+                        not self._board_index.is_on_board(xy)):
+                    self._unused_xy = xy
                     return xy
             x += 1
 
@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import defaultdict
+from collections import defaultdict, deque
 import logging
-from typing import Collection, Iterable, Set, Tuple
+from typing import Collection, Deque, Dict, Iterable, List, Set, Tuple
 from spinn_utilities.config_holder import get_config_bool
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.typing.coords import XY
@@ -52,7 +52,7 @@ def _machine_ignore(
     :return: A New Machine object
     """
     new_machine = MachineDataView.get_machine_version().create_machine(
-        original.width, original.height, "Fixed")
+        original.width, original.height, "Fixed", original.is_dense)
     links_map = defaultdict(set)
     for x, y, d, _ in dead_links:
         links_map[(x, y)].add(d)
@@ -215,3 +215,209 @@ def machine_repair(original: Machine, removed_chips: Iterable[XY] = ()):
 
     new_machine = _machine_ignore(original, dead_chips, dead_links)
     return machine_repair(new_machine)
+
+
+def _reachable_from(
+        machine: Machine, start: XY, alive: Set[XY],
+        dead_links: Set[Tuple[int, int, int]]) -> Set[XY]:
+    """
+    Find the alive chips that can be reached from start.
+
+    :param Machine machine:
+    :param tuple(int,int) start: The (x, y) to search from
+    :param set(tuple(int,int)) alive: The chips that may be used
+    :param set(tuple(int,int,int)) dead_links:
+        The (x, y, link_id) of links that may not be used
+    :rtype: set(tuple(int,int))
+    """
+    reached = {start}
+    to_visit: Deque[XY] = deque([start])
+    while to_visit:
+        x, y = to_visit.popleft()
+        router = machine[x, y].router
+        link_mask = router.link_mask
+        for link_id in range(Router.MAX_LINKS_PER_ROUTER):
+            if not (link_mask >> link_id) & 1:
+                continue
+            if (x, y, link_id) not in dead_links:
+                destination = router.get_destination(link_id)
+                if (destination is not None and destination in alive and
+                        destination not in reached):
+                    reached.add(destination)
+                    to_visit.append(destination)
+    return reached
+
+
+def _orphans(machine: Machine, alive: Set[XY]) -> Set[XY]:
+    """
+    Find the alive chips whose chain of parent links leads to a chip that
+    is not alive.
+
+    :param Machine machine:
+    :param set(tuple(int,int)) alive: The chips that are still in use
+    :rtype: set(tuple(int,int))
+    """
+    # Whether the parent chain of an (x, y) stays among the alive chips
+    has_parent: Dict[XY, bool] = dict()
+    orphans: Set[XY] = set()
+    for xy in alive:
+        chain: List[XY] = []
+        current = xy
+        while current not in has_parent:
+            if current not in alive:
+                has_parent[current] = False
+                break
+            parent_link = machine[current].parent_link
+            if parent_link is None:
+                has_parent[current] = True
+                break
+            chain.append(current)
+            current = machine.xy_over_link(
+                current[0], current[1], parent_link)
+            if current in chain:
+                # A loop of parents never reaches the boot chip
+                has_parent[current] = False
+                break
+        result = has_parent[current]
+        for chained in chain:
+            has_parent[chained] = result
+        if not has_parent[xy]:
+            orphans.add(xy)
+    return orphans
+
+
+def machine_repair_components(
+        original: Machine, removed_chips: Iterable[XY] = (),
+        in_place: bool = False) -> Machine:
+    """
+    Remove chips that can't be reached from, or can't reach, the boot chip,
+    one way links and chips whose parent in the signal tree has gone.
+
+    Unlike :py:func:`machine_repair` this removes whole groups of
+    unreachable chips, not just single chips cut off from their local
+    neighbours, and rebuilds the machine at most once.
+    A chip cut off from its own board but linked both ways to another
+    board is kept.
+
+    Once one way links are set aside every link has a partner going back,
+    so the chips that can reach, and be reached from, the boot chip are
+    exactly those found by one search from it.
+
+    :param original: the original machine
+    :type original: Machine
+    :param removed_chips: List of chips (x and y coordinates) that have been
+        removed while the machine was being created.
+        One-way links to these chip are expected repairs so always done and
+        never logged
+    :type removed_chips: list(tuple(int,int))
+    :param bool in_place:
+        If True the chips and links are removed from the original machine
+        using :py:meth:`~spinn_machine.Machine.remove_chip` and
+        :py:meth:`~spinn_machine.Machine.remove_link`, so the cost depends on
+        the number of repairs rather than the size of the machine.
+        Otherwise a new machine is built and the original is not changed.
+    :raises SpinnMachineException: if repair_machine is false and an unexpected
+        repair is needed, or if the machine has no boot chip
+    :return: Either the original machine or a repaired replacement
+    :rtype: Machine
+    """
+    repair_machine = get_config_bool("Machine", "repair_machine")
+    removed = set(removed_chips)
+    dead_links: Set[Tuple[int, int, int, int]] = set()
+
+    # holder for error message
+    error_message = ""
+
+    for (source_x, source_y, out, back) in (
+            original.link_array().one_way_links()):
+        (dest_x, dest_y) = original.xy_over_link(source_x, source_y, out)
+        if (dest_x, dest_y) in removed:
+            dead_links.add((source_x, source_y, out, back))
+        else:
+            uni_direction_link_message = _generate_uni_direction_link_error(
+                dest_x, dest_y, source_x, source_y, out, back, original)
+            if repair_machine:
+                logger.warning(uni_direction_link_message)
+            else:
+                logger.error(uni_direction_link_message)
+                error_message += uni_direction_link_message
+            dead_links.add((source_x, source_y, out, back))
+
+    if not original.is_chip_at(0, 0):
+        raise SpinnMachineException(
+            "The machine has no boot chip so can not be repaired")
+    boot_xy = (original.boot_chip.x, original.boot_chip.y)
+    blocked = {(x, y, out) for (x, y, out, _) in dead_links}
+    all_xys = set(original.chip_coordinates)
+    alive = _reachable_from(original, boot_xy, all_xys, blocked)
+    unreachable = all_xys - alive
+    orphans = _orphans(original, alive)
+    while orphans:
+        alive -= orphans
+        # Losing the orphans may cut off more chips
+        if boot_xy in alive:
+            alive = _reachable_from(original, boot_xy, alive, blocked)
+        orphans = _orphans(original, alive)
+    orphaned = all_xys - alive - unreachable
+
+    # Report the unreachable chips a board at a time
+    by_board: Dict[XY, List[XY]] = defaultdict(list)
+    for xy in sorted(unreachable):
+        chip = original[xy]
+        by_board[chip.nearest_ethernet_x, chip.nearest_ethernet_y].append(
+            original.get_local_xy(chip))
+    for (eth_x, eth_y), local_xys in sorted(by_board.items()):
+        ethernet = original.get_chip_at(eth_x, eth_y)
+        msg = f"Your machine has chips at {local_xys} on board " \
+              f"{ethernet or (eth_x, eth_y)} which can not reach or be " \
+              f"reached from the boot chip which will cause algorithms to " \
+              f"fail. Please report this to " \
+              f"spinnakerusers@googlegroups.com \n\n"
+        if repair_machine:
+            logger.warning(msg)
+        else:
+            logger.error(msg)
+            error_message += msg
+    for xy in sorted(orphaned):
+        chip = original[xy]
+        ethernet = original.get_chip_at(
+            chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+        ip_address = None if ethernet is None else ethernet.ip_address
+        msg = f"The source: {chip} will fail to receive signals " \
+              f"because a parent in the signal tree has disappeared " \
+              f"from the machine since it was booted. This occurred on " \
+              f"board with ip address {ip_address} " \
+              f"Please report this to " \
+              f"spinnakerusers@googlegroups.com \n\n"
+        if repair_machine:
+            logger.warning(msg)
+        else:
+            logger.error(msg)
+            error_message += msg
+
+    if not repair_machine and error_message != "":
+        raise SpinnMachineException(error_message)
+
+    dead_chips = all_xys - alive
+    if not dead_chips and not dead_links:
+        return original
+
+    if in_place:
+        for (x, y, out, _) in dead_links:
+            if (x, y) not in dead_chips:
+                original.remove_link(x, y, out)
+        # Removing a chip also removes the links into it
+        for (x, y) in dead_chips:
+            original.remove_chip(x, y)
+        return original
+
+    # Links into the removed chips go as well
+    for xy in dead_chips:
+        for link_id in range(Router.MAX_LINKS_PER_ROUTER):
+            if original.is_link_at(xy[0], xy[1], link_id):
+                dest_x, dest_y = original.xy_over_link(xy[0], xy[1], link_id)
+                if (dest_x, dest_y) in alive:
+                    back = (link_id + 3) % 6
+                    if original.is_link_at(dest_x, dest_y, back):
+                        dead_links.add((dest_x, dest_y, back, link_id))
+    return _machine_ignore(original, dead_chips, dead_links)
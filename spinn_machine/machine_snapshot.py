@@ -0,0 +1,283 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A compact binary snapshot of a Machine.
+
+The file is a fixed header followed by one fixed width record per chip::
+
+    header: magic, format version, machine version, width, height,
+            number of chips, bytes of core bitmap, bytes of v_to_p map
+    record: x, y, flags, link mask, parent link, Ethernet x, Ethernet y,
+            SDRAM, router entries, IP address, tag bitmap, core bitmap,
+            v_to_p map
+
+All values are little-endian.
+The records are read straight from a memory map of the file as a NumPy
+structured array so no text has to be parsed.
+
+Links are held as a mask, so on loading their destinations are recomputed
+with :py:meth:`~spinn_machine.Machine.xy_over_link`.
+The SpiNNaker and FPGA links are recomputed in the same way as for JSON.
+"""
+from __future__ import annotations
+import ipaddress
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional
+import numpy
+from spinn_machine.data import MachineDataView
+from .chip import Chip
+from .exceptions import SpinnMachineException
+from .link import Link
+from .machine import Machine
+from .router import Router
+
+#: Identifies a snapshot file
+MAGIC = b"SPINNMSN"
+
+#: The version of the format written
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIIIIII")
+
+# Flags of a record
+_HAS_IP = 1
+_HAS_V_TO_P = 2
+_HAS_PARENT = 4
+
+# Tags are held as a bitmap so must be below this
+_MAX_TAG = 16
+
+
+def _record_dtype(core_bytes: int, v_to_p_bytes: int) -> numpy.dtype:
+    return numpy.dtype([
+        ("x", "<u2"), ("y", "<u2"),
+        ("flags", "u1"), ("link_mask", "u1"), ("parent_link", "u1"),
+        ("eth_x", "<u2"), ("eth_y", "<u2"),
+        ("sdram", "<u8"), ("router_entries", "<u4"),
+        ("ip", "<u4"), ("tags", "<u2"),
+        ("cores", "u1", (core_bytes,)),
+        ("v_to_p", "u1", (v_to_p_bytes,))])
+
+
+def _tag_bitmap(chip: Chip) -> int:
+    tags = 0
+    for tag in chip.tag_ids:
+        if not 0 <= tag < _MAX_TAG:
+            raise SpinnMachineException(
+                f"{chip} has tag {tag} which can not be in a snapshot")
+        tags |= 1 << tag
+    return tags
+
+
+def _header_size() -> int:
+    # Records start on an 8 byte boundary
+    return (_HEADER.size + 7) // 8 * 8
+
+
+def to_snapshot_path(file_path: str, machine: Optional[Machine] = None):
+    """
+    Writes a binary snapshot of a machine.
+
+    :param str file_path: Location to write file to. Warning will overwrite!
+    :param machine: The machine to write or None for the current machine
+    :type machine: Machine or None
+    :raises SpinnMachineException:
+        If a chip has a tag that can not be held in the snapshot
+    """
+    # pylint: disable=protected-access
+    if machine is None:
+        machine = MachineDataView.get_machine()
+    chips = list(machine.chips)
+    max_core = max(
+        (max(chip.all_processor_ids, default=0) for chip in chips),
+        default=0)
+    core_bytes = max_core // 8 + 1
+    v_to_p_bytes = max(
+        (len(chip._v_to_p_map) for chip in chips
+         if chip._v_to_p_map is not None), default=0)
+    records = numpy.zeros(
+        len(chips), dtype=_record_dtype(core_bytes, v_to_p_bytes))
+
+    records["x"] = [chip.x for chip in chips]
+    records["y"] = [chip.y for chip in chips]
+    records["link_mask"] = [chip.router.link_mask for chip in chips]
+    records["eth_x"] = [chip.nearest_ethernet_x for chip in chips]
+    records["eth_y"] = [chip.nearest_ethernet_y for chip in chips]
+    records["sdram"] = [chip.sdram for chip in chips]
+    records["router_entries"] = [
+        chip.router.n_available_multicast_entries for chip in chips]
+    records["tags"] = [_tag_bitmap(chip) for chip in chips]
+
+    cores = numpy.zeros((len(chips), core_bytes * 8), dtype=numpy.uint8)
+    flags = numpy.zeros(len(chips), dtype=numpy.uint8)
+    for index, chip in enumerate(chips):
+        cores[index, list(chip.all_processor_ids)] = 1
+        if chip.ip_address is not None:
+            flags[index] |= _HAS_IP
+            records["ip"][index] = int(ipaddress.IPv4Address(
+                chip.ip_address))
+        if chip.parent_link is not None:
+            flags[index] |= _HAS_PARENT
+            records["parent_link"][index] = chip.parent_link
+        if chip._v_to_p_map is not None:
+            flags[index] |= _HAS_V_TO_P
+            v_to_p = numpy.frombuffer(
+                bytes(chip._v_to_p_map), dtype=numpy.uint8)
+            records["v_to_p"][index] = 0xFF
+            records["v_to_p"][index, :len(v_to_p)] = v_to_p
+    records["flags"] = flags
+    records["cores"] = numpy.packbits(cores, axis=1, bitorder="little")
+
+    version = MachineDataView.get_machine_version()
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, version.number, machine.width, machine.height,
+        len(chips), core_bytes, v_to_p_bytes)
+    with open(file_path, "wb") as s_file:
+        s_file.write(header.ljust(_header_size(), b"\0"))
+        s_file.write(records.tobytes())
+
+
+def machine_from_snapshot(
+        file_path: str, dense: bool = False, lazy: bool = False) -> Machine:
+    """
+    Generate a model of a machine from a binary snapshot.
+
+    :param str file_path: The snapshot written by :py:func:`to_snapshot_path`
+    :param bool dense:
+        if True the machine will hold its chips in a dense (x, y) array
+    :param bool lazy:
+        if True the machine will only create chips when first used.
+        Chips with an IP address, a parent link or a virtual to physical
+        core map are always created.
+    :return: The machine model.
+    :rtype: Machine
+    :raises SpinnMachineException:
+        If the file is not a snapshot, is an unsupported format version,
+        is from a different version of machine or is too short for its
+        records
+    """
+    if os.path.getsize(file_path) < _header_size():
+        raise SpinnMachineException(f"{file_path} is not a machine snapshot")
+    with open(file_path, "rb") as s_file:
+        with mmap.mmap(s_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _machine_from_buffer(data, file_path, dense, lazy)
+
+
+def _machine_from_buffer(
+        data: mmap.mmap, file_path: str, dense: bool, lazy: bool) -> Machine:
+    if len(data) < _header_size():
+        raise SpinnMachineException(f"{file_path} is not a machine snapshot")
+    (magic, format_version, version_number, width, height, n_chips,
+     core_bytes, v_to_p_bytes) = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SpinnMachineException(f"{file_path} is not a machine snapshot")
+    if format_version != FORMAT_VERSION:
+        raise SpinnMachineException(
+            f"{file_path} has unsupported snapshot format {format_version}")
+    version = MachineDataView.get_machine_version()
+    if version_number != version.number:
+        raise SpinnMachineException(
+            f"{file_path} is a snapshot of a version {version_number} "
+            f"machine but the version is {version.number}")
+
+    record_dtype = _record_dtype(core_bytes, v_to_p_bytes)
+    if _header_size() + n_chips * record_dtype.itemsize > len(data):
+        raise SpinnMachineException(
+            f"{file_path} is too short for the records of {n_chips} chips")
+    records = numpy.frombuffer(
+        data, dtype=record_dtype, count=n_chips, offset=_header_size())
+    machine = version.create_machine(
+        width, height, origin="Snapshot", dense=dense, lazy=lazy)
+
+    # Turn the columns into lists as reading those is much faster
+    xs = records["x"].tolist()
+    ys = records["y"].tolist()
+    all_flags = records["flags"].tolist()
+    link_masks = records["link_mask"].tolist()
+    parent_links = records["parent_link"].tolist()
+    eth_xs = records["eth_x"].tolist()
+    eth_ys = records["eth_y"].tolist()
+    sdrams = records["sdram"].tolist()
+    router_entries = records["router_entries"].tolist()
+    ips = records["ip"].tolist()
+    tag_bitmaps = records["tags"].tolist()
+    # Nearly all chips share one of a few sets of tags
+    tag_lists: Dict[int, List[int]] = {
+        bitmap: [tag for tag in range(_MAX_TAG) if (bitmap >> tag) & 1]
+        for bitmap in set(tag_bitmaps)}
+    core_bits = numpy.unpackbits(
+        records["cores"], axis=1, bitorder="little")
+    n_cores = numpy.where(
+        core_bits.any(axis=1),
+        core_bits.shape[1] - numpy.argmax(core_bits[:, ::-1], axis=1),
+        0).tolist()
+    # Cores below the highest core that are missing are down
+    n_set = core_bits.sum(axis=1).tolist()
+
+    if lazy:
+        # Plain chips in bounds are described in one go
+        simple = numpy.asarray(
+            (records["flags"] == 0) & (records["tags"] == 0) &
+            (records["x"] < width) & (records["y"] < height))
+        simple &= numpy.asarray(n_set) == numpy.asarray(n_cores)
+        machine.add_lazy_chips(
+            records["x"][simple], records["y"][simple],
+            numpy.asarray(n_cores)[simple], records["link_mask"][simple],
+            records["eth_x"][simple], records["eth_y"][simple],
+            records["sdram"][simple], records["router_entries"][simple])
+        remaining = numpy.flatnonzero(~simple).tolist()
+    else:
+        remaining = list(range(n_chips))
+
+    for index in remaining:
+        x = xs[index]
+        y = ys[index]
+        flags = all_flags[index]
+        tag_ids = tag_lists[tag_bitmaps[index]]
+        down_cores = None
+        if n_set[index] != n_cores[index]:
+            down_cores = set(numpy.flatnonzero(
+                core_bits[index, :n_cores[index]] == 0).tolist())
+        if lazy and flags == 0 and 0 <= x < width and 0 <= y < height:
+            machine.add_lazy_chip(
+                x, y, n_cores[index], link_masks[index], eth_xs[index],
+                eth_ys[index], sdrams[index], router_entries[index],
+                tag_ids, down_cores)
+            continue
+
+        link_mask = link_masks[index]
+        links = []
+        for link_id in range(Router.MAX_LINKS_PER_ROUTER):
+            if (link_mask >> link_id) & 1:
+                dest_x, dest_y = machine.xy_over_link(x, y, link_id)
+                links.append(Link(x, y, link_id, dest_x, dest_y))
+        ip_address = None
+        if flags & _HAS_IP:
+            ip_address = str(ipaddress.IPv4Address(ips[index]))
+        parent_link = None
+        if flags & _HAS_PARENT:
+            parent_link = parent_links[index]
+        v_to_p_map = None
+        if flags & _HAS_V_TO_P:
+            v_to_p_map = bytes(records["v_to_p"][index])
+        machine.add_chip(Chip(
+            x, y, n_cores[index], Router(links, router_entries[index]),
+            sdrams[index], eth_xs[index], eth_ys[index], ip_address,
+            tag_ids, down_cores, parent_link, v_to_p_map))
+
+    machine.add_spinnaker_links()
+    machine.add_fpga_links()
+    return machine
@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
-from typing import Any, FrozenSet, Iterable, Optional, Tuple, overload
+from typing import (
+    Any, FrozenSet, Iterable, List, Optional, Tuple, overload)
+import numpy
+from numpy.typing import ArrayLike
 from spinn_machine.router import Router
 from .exceptions import SpinnMachineInvalidParameterException
+from .route_arrays import route_to_ids
 
 
 class MulticastRoutingEntry(object):
@@ -100,6 +104,69 @@ class MulticastRoutingEntry(object):
             self._processor_ids = None
             self._link_ids = None
 
+    @classmethod
+    def from_arrays(cls, keys: ArrayLike, masks: ArrayLike,
+                    routes: ArrayLike, defaultable: Optional[ArrayLike] = None
+                    ) -> List[MulticastRoutingEntry]:
+        """
+        Make many entries at once from their keys, masks and SpiNNaker
+        routes.
+
+        The keys are checked against the masks for the whole batch at once,
+        and as with a spinnaker_route given to the constructor the processor
+        and link IDs are only worked out if asked for.
+
+        :param keys: The routing keys
+        :param masks: The routing masks
+        :param routes: The encoded SpiNNaker routes
+        :param defaultable:
+            If each entry is defaultable, or None if none are
+        :rtype: list(MulticastRoutingEntry)
+        :raise SpinnMachineInvalidParameterException:
+            If a key is changed when masked with its mask, or the arrays
+            are of different lengths
+        """
+        key_array = numpy.asarray(keys, dtype=numpy.uint32).reshape(-1)
+        mask_array = numpy.asarray(masks, dtype=numpy.uint32).reshape(-1)
+        route_array = numpy.asarray(routes, dtype=numpy.uint32).reshape(-1)
+        n_entries = len(key_array)
+        if defaultable is None:
+            defaultable_array = numpy.zeros(n_entries, dtype=bool)
+        else:
+            defaultable_array = numpy.asarray(
+                defaultable, dtype=bool).reshape(-1)
+        if not (len(mask_array) == len(route_array) ==
+                len(defaultable_array) == n_entries):
+            raise SpinnMachineInvalidParameterException(
+                "keys, masks, routes and defaultable",
+                f"{n_entries}, {len(mask_array)}, {len(route_array)} and "
+                f"{len(defaultable_array)} values",
+                "There must be the same number of each")
+        bad = numpy.flatnonzero((key_array & mask_array) != key_array)
+        if len(bad):
+            raise SpinnMachineInvalidParameterException(
+                "key_mask_combo and mask",
+                f"{key_array[bad[0]]} and {mask_array[bad[0]]}",
+                "The key combo is changed when masked with the mask. This"
+                " is determined to be an error in the tool chain. Please "
+                "correct this and try again.")
+        entries: List[MulticastRoutingEntry] = list()
+        append = entries.append
+        new = cls.__new__
+        for key, mask, route, is_defaultable in zip(
+                key_array.tolist(), mask_array.tolist(),
+                route_array.tolist(), defaultable_array.tolist()):
+            entry = new(cls)
+            entry._routing_entry_key = key
+            entry._mask = mask
+            entry._defaultable = is_defaultable
+            entry._spinnaker_route = route
+            entry._processor_ids = None
+            entry._link_ids = None
+            entry.__repr = None
+            append(entry)
+        return entries
+
     @property
     def routing_entry_key(self) -> int:
         """
@@ -271,9 +338,4 @@ class MulticastRoutingEntry(object):
 
         :rtype: tuple(frozenset(int), frozenset(int))
         """
-        processor_ids = (pi for pi in range(0, Router.MAX_CORES_PER_ROUTER)
-                         if self._spinnaker_route & 1 <<
-                         (Router.MAX_LINKS_PER_ROUTER + pi))
-        link_ids = (li for li in range(0, Router.MAX_LINKS_PER_ROUTER)
-                    if self._spinnaker_route & 1 << li)
-        return frozenset(processor_ids), frozenset(link_ids)
+        return route_to_ids(self._spinnaker_route)
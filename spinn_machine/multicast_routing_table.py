@@ -0,0 +1,443 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import (
+    Dict, Iterable, Iterator, List, Optional, Sequence, Tuple,
+    TYPE_CHECKING)
+import numpy
+from numpy.typing import ArrayLike, NDArray
+from spinn_utilities.typing.coords import XY
+from .exceptions import (
+    SpinnMachineAlreadyExistsException, SpinnMachineException)
+from .multicast_routing_entry import MulticastRoutingEntry
+from .route_arrays import entries_to_arrays
+from .router import Router
+if TYPE_CHECKING:
+    from .machine import Machine
+
+# The most key and entry pairs compared at once when matching
+_MAX_BLOCK = 1 << 22
+
+#: The layout of an entry in a table written by
+#: :py:meth:`MulticastRoutingTable.to_bytes`
+ENTRY_DTYPE = numpy.dtype(
+    [("key", "<u4"), ("mask", "<u4"), ("route", "<u4")])
+
+
+class MulticastRoutingTable(object):
+    """
+    The multicast routing table of one chip.
+
+    Entries are held in the order they were added, which is the order the
+    router checks them in; the first entry whose mask and key match a
+    packet's key gives the route, as in the router's TCAM.
+
+    The keys, masks and routes are also made available as NumPy arrays so
+    many keys can be looked up at once.
+    """
+
+    __slots__ = (
+        # The x-coordinate of the chip
+        "_x",
+        # The y-coordinate of the chip
+        "_y",
+        # The entries in router order
+        "_entries",
+        # The (key, mask) of every entry
+        "_key_masks",
+        # The key, mask and route arrays, or None until asked for
+        "_arrays")
+
+    def __init__(self, x: int, y: int,
+                 entries: Iterable[MulticastRoutingEntry] = ()):
+        """
+        :param int x: The x-coordinate of the chip
+        :param int y: The y-coordinate of the chip
+        :param iterable(MulticastRoutingEntry) entries:
+            The entries of the table in router order
+        :raise SpinnMachineAlreadyExistsException:
+            If two entries have the same key and mask
+        """
+        self._x = x
+        self._y = y
+        self._entries: List[MulticastRoutingEntry] = list()
+        self._key_masks: Dict[Tuple[int, int], MulticastRoutingEntry] = \
+            dict()
+        self._arrays: Optional[Tuple[
+            NDArray[numpy.uint32], NDArray[numpy.uint32],
+            NDArray[numpy.uint32]]] = None
+        self.add_multicast_routing_entries(entries)
+
+    @classmethod
+    def from_arrays(cls, x: int, y: int, keys: ArrayLike, masks: ArrayLike,
+                    routes: ArrayLike, defaultable: Optional[ArrayLike] = None
+                    ) -> MulticastRoutingTable:
+        """
+        Make a table from the keys, masks and SpiNNaker routes of its
+        entries in router order.
+
+        :param int x: The x-coordinate of the chip
+        :param int y: The y-coordinate of the chip
+        :param keys: The routing keys
+        :param masks: The routing masks
+        :param routes: The encoded SpiNNaker routes
+        :param defaultable:
+            If each entry is defaultable, or None if none are
+        :rtype: MulticastRoutingTable
+        :raise SpinnMachineInvalidParameterException:
+            If a key is changed when masked with its mask, or the arrays
+            are of different lengths
+        :raise SpinnMachineAlreadyExistsException:
+            If two entries have the same key and mask
+        """
+        table = cls(x, y, MulticastRoutingEntry.from_arrays(
+            keys, masks, routes, defaultable))
+        arrays = tuple(
+            numpy.array(values, dtype=numpy.uint32).reshape(-1)
+            for values in (keys, masks, routes))
+        for array in arrays:
+            array.flags.writeable = False
+        table._arrays = arrays  # type: ignore[assignment]
+        return table
+
+    @property
+    def x(self) -> int:
+        """
+        The x-coordinate of the chip of this table.
+
+        :rtype: int
+        """
+        return self._x
+
+    @property
+    def y(self) -> int:
+        """
+        The y-coordinate of the chip of this table.
+
+        :rtype: int
+        """
+        return self._y
+
+    def add_multicast_routing_entry(self, entry: MulticastRoutingEntry):
+        """
+        Add an entry to the end of the table.
+
+        :param MulticastRoutingEntry entry:
+        :raise SpinnMachineAlreadyExistsException:
+            If an entry with the same key and mask is already in the table
+        """
+        self.add_multicast_routing_entries((entry, ))
+
+    def add_multicast_routing_entries(
+            self, entries: Iterable[MulticastRoutingEntry]):
+        """
+        Add entries to the end of the table.
+
+        Either all the entries are added or, if one has the key and mask of
+        another, none are.
+
+        :param iterable(MulticastRoutingEntry) entries:
+        :raise SpinnMachineAlreadyExistsException:
+            If two entries have the same key and mask
+        """
+        new_entries = list(entries)
+        new_key_masks: Dict[Tuple[int, int], MulticastRoutingEntry] = {
+            (entry.routing_entry_key, entry.mask): entry
+            for entry in new_entries}
+        if (len(new_key_masks) != len(new_entries) or
+                not self._key_masks.keys().isdisjoint(new_key_masks)):
+            seen = set(self._key_masks)
+            for entry in new_entries:
+                key_mask = (entry.routing_entry_key, entry.mask)
+                if key_mask in seen:
+                    raise SpinnMachineAlreadyExistsException(
+                        "Multicast_routing_entry",
+                        f"key:{key_mask[0]} mask:{key_mask[1]}")
+                seen.add(key_mask)
+        self._entries.extend(new_entries)
+        self._key_masks.update(new_key_masks)
+        self._arrays = None
+
+    @property
+    def multicast_routing_entries(self) -> Sequence[MulticastRoutingEntry]:
+        """
+        The entries in router order.
+
+        :rtype: list(MulticastRoutingEntry)
+        """
+        return self._entries
+
+    @property
+    def number_of_entries(self) -> int:
+        """
+        The number of entries in the table.
+
+        :rtype: int
+        """
+        return len(self._entries)
+
+    @property
+    def number_of_defaultable_entries(self) -> int:
+        """
+        The number of entries that are defaultable.
+
+        :rtype: int
+        """
+        return sum(1 for entry in self._entries if entry.defaultable)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[MulticastRoutingEntry]:
+        return iter(self._entries)
+
+    def get_entry_by_key_mask(
+            self, key: int, mask: int) -> Optional[MulticastRoutingEntry]:
+        """
+        Get the entry with a key and mask.
+
+        :param int key:
+        :param int mask:
+        :return: The entry or None if there is none
+        :rtype: MulticastRoutingEntry or None
+        """
+        return self._key_masks.get((key, mask))
+
+    @property
+    def arrays(self) -> Tuple[NDArray[numpy.uint32], NDArray[numpy.uint32],
+                              NDArray[numpy.uint32]]:
+        """
+        The keys, masks and routes of the entries in router order as
+        read-only arrays.
+
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+        """
+        if self._arrays is None:
+            arrays = entries_to_arrays(self._entries)
+            for array in arrays:
+                array.flags.writeable = False
+            self._arrays = arrays
+        return self._arrays
+
+    @property
+    def defaultable_flags(self) -> NDArray[numpy.bool_]:
+        """
+        Whether each entry is defaultable, in router order.
+
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.fromiter(
+            (entry.defaultable for entry in self._entries), dtype=bool,
+            count=len(self))
+
+    def to_bytes(self) -> bytes:
+        """
+        The entries in router order as a key, mask and SpiNNaker route
+        word each, all little-endian, as loaded onto a chip.
+
+        Whether entries are defaultable is not included.
+        See :py:class:`FrozenMulticastRoutingTable` to read it back.
+
+        :rtype: bytes
+        """
+        keys, masks, routes = self.arrays
+        words = numpy.empty(len(keys), dtype=ENTRY_DTYPE)
+        words["key"] = keys
+        words["mask"] = masks
+        words["route"] = routes
+        return words.tobytes()
+
+    def lookup(self, keys: ArrayLike) -> NDArray[numpy.int64]:
+        """
+        Find for each key the index of the first entry that matches it,
+        as the router does.
+
+        :param keys: The keys to look up
+        :return: The index of the matching entry or -1 for each key
+        :rtype: ~numpy.ndarray
+        """
+        key_array = numpy.asarray(keys, dtype=numpy.uint32)
+        flat_keys = key_array.ravel()
+        entry_keys, masks, _ = self.arrays
+        result = numpy.full(len(flat_keys), -1, dtype=numpy.int64)
+        if len(entry_keys) == 0:
+            return result.reshape(key_array.shape)
+        block = max(1, _MAX_BLOCK // len(entry_keys))
+        for start in range(0, len(flat_keys), block):
+            chunk = flat_keys[start:start + block]
+            matches = (chunk[:, None] & masks[None, :]) == entry_keys[None, :]
+            first = numpy.argmax(matches, axis=1)
+            found = matches[numpy.arange(len(chunk)), first]
+            result[start:start + block] = numpy.where(found, first, -1)
+        return result.reshape(key_array.shape)
+
+    def get_entry_for_key(self, key: int) -> Optional[MulticastRoutingEntry]:
+        """
+        Get the first entry that matches a key, as the router does.
+
+        :param int key:
+        :return: The entry or None if no entry matches
+        :rtype: MulticastRoutingEntry or None
+        """
+        for entry in self._entries:
+            if key & entry.mask == entry.routing_entry_key:
+                return entry
+        return None
+
+    def find_conflicts(self) -> List[Tuple[int, int]]:
+        """
+        Find the pairs of entries that some key matches both of.
+
+        For such a pair the later entry is never used for the keys that
+        match both, which is only safe if that is intended.
+
+        :return: The indices (earlier, later) of each pair
+        :rtype: list(tuple(int,int))
+        """
+        keys, masks, _ = self.arrays
+        n_entries = len(keys)
+        pairs: List[Tuple[int, int]] = list()
+        if n_entries == 0:
+            return pairs
+        block = max(1, _MAX_BLOCK // n_entries)
+        later = numpy.arange(n_entries)
+        for start in range(0, n_entries, block):
+            rows = slice(start, start + block)
+            # Two entries overlap if they agree on the bits both care about
+            overlap = (((keys[rows, None] ^ keys[None, :]) &
+                        masks[rows, None] & masks[None, :]) == 0)
+            overlap &= later[None, :] > later[rows, None]
+            earlier, others = numpy.nonzero(overlap)
+            pairs.extend(zip((earlier + start).tolist(), others.tolist()))
+        return pairs
+
+    def fits(self, router: Router) -> bool:
+        """
+        Determine if the table fits in the router of the chip.
+
+        :param Router router:
+        :rtype: bool
+        """
+        return len(self) <= router.n_available_multicast_entries
+
+    def check_capacity(self, router: Router):
+        """
+        Check that the table fits in the router of the chip.
+
+        :param Router router:
+        :raise SpinnMachineException: If there are too many entries
+        """
+        if not self.fits(router):
+            raise SpinnMachineException(
+                f"The routing table of chip {self._x}:{self._y} has "
+                f"{len(self)} entries but the router only has "
+                f"{router.n_available_multicast_entries} available")
+
+    def __repr__(self) -> str:
+        entries = "\n".join(str(entry) for entry in self._entries)
+        return f"{self._x}:{self._y}\n\n{entries}"
+
+
+class MulticastRoutingTables(object):
+    """
+    The multicast routing tables of a machine, one per chip.
+    """
+
+    __slots__ = (
+        # The tables by the (x, y) of their chip
+        "_tables", )
+
+    def __init__(self, tables: Iterable[MulticastRoutingTable] = ()):
+        """
+        :param iterable(MulticastRoutingTable) tables:
+        :raise SpinnMachineAlreadyExistsException:
+            If two tables are for the same chip
+        """
+        self._tables: Dict[XY, MulticastRoutingTable] = dict()
+        for table in tables:
+            self.add_routing_table(table)
+
+    def add_routing_table(self, table: MulticastRoutingTable):
+        """
+        Add the table of a chip.
+
+        :param MulticastRoutingTable table:
+        :raise SpinnMachineAlreadyExistsException:
+            If there is already a table for the chip
+        """
+        xy = (table.x, table.y)
+        if xy in self._tables:
+            raise SpinnMachineAlreadyExistsException(
+                "Multicast_routing_table", f"{table.x}:{table.y}")
+        self._tables[xy] = table
+
+    @property
+    def routing_tables(self) -> Iterable[MulticastRoutingTable]:
+        """
+        The tables in the order they were added.
+
+        :rtype: iterable(MulticastRoutingTable)
+        """
+        return self._tables.values()
+
+    def get_routing_table_for_chip(
+            self, x: int, y: int) -> Optional[MulticastRoutingTable]:
+        """
+        Get the table of a chip.
+
+        :param int x: The x-coordinate of the chip
+        :param int y: The y-coordinate of the chip
+        :return: The table or None if the chip has none
+        :rtype: MulticastRoutingTable or None
+        """
+        return self._tables.get((x, y))
+
+    @property
+    def max_number_of_entries(self) -> int:
+        """
+        The number of entries in the largest table.
+
+        :rtype: int
+        """
+        return max((len(table) for table in self._tables.values()),
+                   default=0)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __iter__(self) -> Iterator[MulticastRoutingTable]:
+        return iter(self._tables.values())
+
+    def __contains__(self, xy: XY) -> bool:
+        return xy in self._tables
+
+    def __getitem__(self, xy: XY) -> MulticastRoutingTable:
+        return self._tables[xy]
+
+    def check_capacity(self, machine: Machine):
+        """
+        Check that every table fits in the router of its chip.
+
+        :param Machine machine:
+        :raise SpinnMachineException:
+            If a table is for a chip not in the machine or has too many
+            entries
+        """
+        for table in self:
+            chip = machine.get_chip_at(table.x, table.y)
+            if chip is None:
+                raise SpinnMachineException(
+                    f"There is a routing table for chip {table.x}:{table.y} "
+                    "which is not in the machine")
+            table.check_capacity(chip.router)
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from typing import Iterable, Tuple
+import numpy
+from numpy.typing import ArrayLike, NDArray
 from spinn_utilities.overrides import overrides
 from spinn_utilities.typing.coords import XY
 from .machine import Machine
@@ -45,22 +47,6 @@ class NoWrapMachine(Machine):
             # if Ethernet_x/y != 0 GIGO mode so ignore Ethernet
             yield ((x + ethernet_x, y + ethernet_y), n_cores)
 
-    @overrides(Machine.get_existing_xys_by_ethernet)
-    def get_existing_xys_by_ethernet(
-            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
-        for (x, y) in self._chip_core_map:
-            chip_xy = (x + ethernet_x, y + ethernet_y)
-            if chip_xy in self._chips:
-                yield chip_xy
-
-    @overrides(Machine.get_down_xys_by_ethernet)
-    def get_down_xys_by_ethernet(
-            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
-        for (x, y) in self._chip_core_map:
-            chip_xy = ((x + ethernet_x), (y + ethernet_y))
-            if chip_xy not in self._chips:
-                yield chip_xy
-
     @overrides(Machine.xy_over_link)
     def xy_over_link(self, x: int, y: int, link: int) -> XY:
         add_x, add_y = Machine.LINK_ADD_TABLE[link]
@@ -129,6 +115,20 @@ class NoWrapMachine(Machine):
         return self._minimize_vector(
             destination[0]-source[0], destination[1]-source[1])
 
+    @overrides(Machine.get_vector_lengths)
+    def get_vector_lengths(
+            self, sources: ArrayLike, destinations: ArrayLike
+            ) -> NDArray[numpy.integer]:
+        x, y = self._vector_deltas(sources, destinations)
+        return self._minimized_lengths(x, y)
+
+    @overrides(Machine.get_vectors)
+    def get_vectors(
+            self, sources: ArrayLike, destinations: ArrayLike
+            ) -> NDArray[numpy.integer]:
+        x, y = self._vector_deltas(sources, destinations)
+        return self._minimize_vectors(x, y)
+
     @overrides(Machine.concentric_xys)
     def concentric_xys(self, radius: int, start: XY) -> Iterable[XY]:
         # Aliases for convenience
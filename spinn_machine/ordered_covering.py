@@ -0,0 +1,522 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Routing table minimisation by Ordered Covering.
+
+The entries are put in order of how many bits of the key they ignore,
+most specific first.
+Entries with the same route are then repeatedly replaced by one more
+general entry placed after all the entries more specific than it,
+taking the merge that removes the most entries each time.
+A merge of all the entries of a route is cut down until:
+
+* no entry it replaces is hidden from some of its original keys by an
+  entry with a different route between it and where the new entry goes,
+  and
+* no entry with a different route after where the new entry goes would
+  have any of its original keys taken by the new entry,
+
+where the original keys of an entry made by earlier merges are those of
+the entries it replaced.
+To avoid such a key a bit the merge ignores is set by dropping the members
+which ignore it or differ there, taking the bit which drops the fewest.
+So every key matched by the original table is still routed the same way.
+Keys that matched no entry may now be routed.
+
+See Mundy, Heathcote and Garside, "On-chip order-exploiting routing
+table minimization for a multicast supercomputer network" (HPSR 2016).
+"""
+from __future__ import annotations
+import time
+from typing import List, Optional, Tuple, TYPE_CHECKING
+import numpy
+from numpy.typing import NDArray
+from .exceptions import SpinnMachineException
+from .multicast_routing_entry import MulticastRoutingEntry
+from .multicast_routing_table import (
+    MulticastRoutingTable, MulticastRoutingTables)
+if TYPE_CHECKING:
+    from .machine import Machine
+
+_FULL_MASK = 0xFFFFFFFF
+_BITS = numpy.arange(32, dtype=numpy.uint32)
+# The most pairs of entries compared at once
+_MAX_BLOCK = 1 << 22
+
+
+def _generality(masks: NDArray[numpy.uint32]) -> NDArray[numpy.int64]:
+    """
+    The number of bits of the key each mask ignores.
+    """
+    as_bytes = masks.astype("<u4").view(numpy.uint8).reshape(len(masks), 4)
+    return 32 - numpy.unpackbits(as_bytes, axis=1).sum(
+        axis=1, dtype=numpy.int64)
+
+
+def _merged(keys: NDArray[numpy.uint32],
+            masks: NDArray[numpy.uint32]) -> Tuple[int, int]:
+    """
+    The most specific key and mask that match all the given ones.
+    """
+    all_ones = int(numpy.bitwise_and.reduce(keys))
+    any_ones = int(numpy.bitwise_or.reduce(keys))
+    mask = (int(numpy.bitwise_and.reduce(masks)) &
+            ~(all_ones ^ any_ones) & _FULL_MASK)
+    return all_ones & mask, mask
+
+
+class _OrderedCovering(object):
+    """
+    The state of the minimisation of one table.
+
+    Each entry keeps the original keys and masks it stands for, its
+    aliases, as only the keys of those need to be routed as before.
+    As the original entries are orthogonal, only entries made by merges
+    can match the aliases of another entry.
+    """
+
+    __slots__ = (
+        # The key of each alias
+        "_alias_keys",
+        # The mask of each alias
+        "_alias_masks",
+        # The id of the entry of each alias
+        "_alias_ids",
+        # The keys of the removed defaultable entries
+        "_default_keys",
+        # The masks of the removed defaultable entries
+        "_default_masks",
+        # The defaultable flags in order
+        "_defaultable",
+        # The entries in order, None where made by a merge
+        "_entries",
+        # The number of ignored bits in order, which is ascending
+        "_generality",
+        # The id of each entry in order
+        "_ids",
+        # The keys in order
+        "_keys",
+        # The masks in order
+        "_masks",
+        # The number of entries in the original table
+        "_n_original",
+        # The position in order of each id
+        "_positions",
+        # The routes in order
+        "_routes")
+
+    def __init__(self, table: MulticastRoutingTable):
+        keys, masks, routes = table.arrays
+        generality = _generality(masks)
+        # Entries as general as each other go in key order so that cutting
+        # down a merge from the end keeps it to nearby keys
+        order = numpy.lexsort((keys, generality))
+        self._keys = keys[order]
+        self._masks = masks[order]
+        self._routes = routes[order]
+        self._generality = generality[order]
+        entries = table.multicast_routing_entries
+        self._entries: List[Optional[MulticastRoutingEntry]] = [
+            entries[index] for index in order.tolist()]
+        self._defaultable = numpy.array(
+            [entry.defaultable for entry in entries],
+            dtype=bool)[order]
+        self._n_original = len(keys)
+        self._ids = numpy.arange(len(keys), dtype=numpy.int64)
+        self._positions = self._ids.copy()
+        self._alias_keys = self._keys.copy()
+        self._alias_masks = self._masks.copy()
+        self._alias_ids = self._ids.copy()
+        self._default_keys = numpy.zeros(0, dtype=numpy.uint32)
+        self._default_masks = numpy.zeros(0, dtype=numpy.uint32)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _update(self, keep: NDArray[numpy.bool_], insert: int = -1,
+                key: int = 0, mask: int = 0, route: int = 0):
+        """
+        Keep only some entries, then add a merged entry if insert is not -1.
+        """
+        self._keys = self._keys[keep]
+        self._masks = self._masks[keep]
+        self._routes = self._routes[keep]
+        self._generality = self._generality[keep]
+        self._defaultable = self._defaultable[keep]
+        self._ids = self._ids[keep]
+        self._entries = [
+            entry for entry, kept in zip(self._entries, keep.tolist())
+            if kept]
+        if insert >= 0:
+            self._keys = numpy.insert(self._keys, insert, key)
+            self._masks = numpy.insert(self._masks, insert, mask)
+            self._routes = numpy.insert(self._routes, insert, route)
+            self._generality = numpy.insert(
+                self._generality, insert, 32 - bin(mask).count("1"))
+            self._defaultable = numpy.insert(self._defaultable, insert, False)
+            self._ids = numpy.insert(
+                self._ids, insert, len(self._positions))
+            self._entries.insert(insert, None)
+            self._positions = numpy.append(self._positions, -1)
+        self._positions[self._ids] = numpy.arange(len(self))
+
+    def remove_default_routes(self):
+        """
+        Remove the defaultable entries whose keys no later entry matches,
+        so their packets are routed by default routing instead.
+
+        Their keys are remembered so no merge later takes them.
+        """
+        remove = numpy.zeros(len(self), dtype=bool)
+        for index in numpy.flatnonzero(self._defaultable).tolist():
+            later = slice(index + 1, None)
+            covered = ((self._keys[later] ^ self._keys[index]) &
+                       self._masks[later] & self._masks[index]) == 0
+            if not covered.any():
+                remove[index] = True
+        self._default_keys = self._keys[remove]
+        self._default_masks = self._masks[remove]
+        kept_aliases = ~numpy.isin(self._alias_ids, self._ids[remove])
+        self._alias_keys = self._alias_keys[kept_aliases]
+        self._alias_masks = self._alias_masks[kept_aliases]
+        self._alias_ids = self._alias_ids[kept_aliases]
+        self._update(~remove)
+
+    def _insertion_points(self, masks: NDArray[numpy.uint32]) -> NDArray:
+        """
+        Where entries with the given masks go to keep the order, before
+        the entries as general as them.
+        """
+        return numpy.searchsorted(
+            self._generality, _generality(masks), side="left")
+
+    def _insertion_point(self, mask: int) -> int:
+        return int(self._insertion_points(
+            numpy.array([mask], dtype=numpy.uint32))[0])
+
+    def _first_blockers(self, members: NDArray[numpy.int64], route: int,
+                        insert: int) -> NDArray[numpy.int64]:
+        """
+        For each member, the first entry with another route after it that
+        matches a key of one of its aliases, or the insertion point if
+        there is none before it.
+        """
+        first = numpy.full(len(members), insert, dtype=numpy.int64)
+        between = numpy.arange(int(members[0]) + 1, insert)
+        others = between[
+            (self._ids[between] >= self._n_original) &
+            (self._routes[between] != route)]
+        if len(others) == 0:
+            return first
+        aliases = numpy.flatnonzero(
+            numpy.isin(self._alias_ids, self._ids[members]))
+        owners = self._positions[self._alias_ids[aliases]]
+        alias_first = numpy.full(len(aliases), insert, dtype=numpy.int64)
+        block = max(1, _MAX_BLOCK // len(others))
+        for start in range(0, len(aliases), block):
+            rows = aliases[start:start + block]
+            overlap = (((self._alias_keys[rows, None] ^
+                         self._keys[None, others]) &
+                        self._alias_masks[rows, None] &
+                        self._masks[None, others]) == 0)
+            overlap &= others[None, :] > owners[start:start + block, None]
+            alias_first[start:start + block] = numpy.where(
+                overlap, others[None, :], insert).min(axis=1, initial=insert)
+        numpy.minimum.at(
+            first, numpy.searchsorted(members, owners), alias_first)
+        return first
+
+    def _up_fix(self, members: NDArray[numpy.int64], route: int,
+                least: int) -> Tuple[NDArray[numpy.int64], bool]:
+        """
+        Drop the members an entry with another route between them and the
+        insertion point would take keys from, from the last up, moving the
+        insertion point up as the merge gets more specific.
+
+        :return: The members left, none if no more than least, and whether
+            any were dropped
+        """
+        _, mask = _merged(self._keys[members], self._masks[members])
+        insert = self._insertion_point(mask)
+        first = self._first_blockers(members, route, insert)
+        if not (first < insert).any():
+            return members, False
+        keys = self._keys[members]
+        masks = self._masks[members]
+        # The merges of the members before each one
+        and_keys = numpy.bitwise_and.accumulate(keys).tolist()
+        or_keys = numpy.bitwise_or.accumulate(keys).tolist()
+        and_masks = numpy.bitwise_and.accumulate(masks).tolist()
+        kept = numpy.ones(len(members), dtype=bool)
+        # The merge of the members kept after the current one
+        kept_and_keys = _FULL_MASK
+        kept_or_keys = 0
+        kept_and_masks = _FULL_MASK
+        n_left = len(members)
+        for index in range(len(members) - 1, -1, -1):
+            if first[index] < insert:
+                kept[index] = False
+                n_left -= 1
+                if n_left <= least:
+                    return members[:0], True
+                all_ones = kept_and_keys
+                any_ones = kept_or_keys
+                mask = kept_and_masks
+                if index:
+                    all_ones &= and_keys[index - 1]
+                    any_ones |= or_keys[index - 1]
+                    mask &= and_masks[index - 1]
+                insert = self._insertion_point(mask & ~(all_ones ^ any_ones))
+            else:
+                kept_and_keys &= int(keys[index])
+                kept_or_keys |= int(keys[index])
+                kept_and_masks &= int(masks[index])
+        return members[kept], True
+
+    def _down_fix(self, members: NDArray[numpy.int64], route: int,
+                  least: int) -> NDArray[numpy.int64]:
+        """
+        Drop members until the merge does not take the keys of an alias of
+        an entry with another route after the insertion point, or of a
+        removed defaultable entry.
+
+        :return: The members left, none if no more than least
+        """
+        owners = self._positions[self._alias_ids]
+        other = self._routes[owners] != route
+        # The removed defaultable entries are always below the merge
+        clash_keys = numpy.concatenate(
+            (self._alias_keys[other], self._default_keys))
+        clash_masks = numpy.concatenate(
+            (self._alias_masks[other], self._default_masks))
+        clash_owners = numpy.concatenate((
+            owners[other],
+            numpy.full(len(self._default_keys), len(self), dtype=numpy.int64)))
+        # Which bits of each member are cared about and 1 or 0
+        bits = (self._keys[members, None] >> _BITS & 1) == 1
+        cared = (self._masks[members, None] >> _BITS & 1) == 1
+        ones = cared & bits
+        zeros = cared & ~bits
+        while len(members) > least:
+            key, mask = _merged(self._keys[members], self._masks[members])
+            # As the merge only gets more specific, the aliases it does not
+            # take keys of now never clash
+            takes = ((clash_keys ^ numpy.uint32(key)) & clash_masks &
+                     numpy.uint32(mask)) == 0
+            clash_keys = clash_keys[takes]
+            clash_masks = clash_masks[takes]
+            clash_owners = clash_owners[takes]
+            clashes = clash_owners >= self._insertion_point(mask)
+            if not clashes.any():
+                return members
+            # The bits the merge ignores but a clashing alias does not; only
+            # the aliases with the fewest are avoided, as they are the
+            # hardest to
+            settable = clash_masks[clashes] & numpy.uint32(~mask & _FULL_MASK)
+            n_settable = 32 - _generality(~settable)
+            if n_settable.min() == 0:
+                break
+            fewest = n_settable == n_settable.min()
+            settable = settable[fewest]
+            clash_ones = clash_keys[clashes][fewest] & settable
+            # For each bit, whether setting it to 1 (column 0) or 0 (column
+            # 1) in the merge avoids one of those aliases
+            usable = numpy.array([
+                int(numpy.bitwise_or.reduce(settable & ~clash_ones)),
+                int(numpy.bitwise_or.reduce(clash_ones))]) >> \
+                _BITS[:, None] & 1
+            # The members dropped to give each bit each value
+            n_dropped = len(members) - numpy.stack((
+                numpy.count_nonzero(ones, axis=0),
+                numpy.count_nonzero(zeros, axis=0)), axis=1)
+            n_dropped[usable == 0] = len(members) + 1
+            # The fewest dropped, preferring the highest bit then a 1, so
+            # the merges kept are of nearby keys
+            best = int(numpy.argmin(n_dropped[::-1].reshape(-1)))
+            bit = len(n_dropped) - 1 - best // 2
+            value = 1 - best % 2
+            keep = ones[:, bit] if value else zeros[:, bit]
+            members = members[keep]
+            ones = ones[keep]
+            zeros = zeros[keep]
+        return members[:0]
+
+    def _refine(self, members: NDArray[numpy.int64], route: int,
+                least: int) -> Tuple[NDArray[numpy.int64], int, int, int]:
+        """
+        Cut down a merge until it is safe, giving up once it has no more
+        than least members.
+
+        :return: The members, the merged key and mask, and where it goes
+        """
+        members = self._down_fix(members, route, least)
+        if len(members) > least:
+            members, changed = self._up_fix(members, route, least)
+            # Dropping members only moves the merge up, so the up check
+            # holds after another down check
+            if changed and len(members) > least:
+                members = self._down_fix(members, route, least)
+        if len(members) <= least:
+            return members[:0], 0, 0, 0
+        key, mask = _merged(self._keys[members], self._masks[members])
+        # An entry left out that is the same as the merge goes with it
+        same = numpy.flatnonzero(
+            (self._keys == key) & (self._masks == mask))
+        if (self._routes[same] != route).any():
+            return members[:0], 0, 0, 0
+        return (numpy.union1d(members, same), key, mask,
+                self._insertion_point(mask))
+
+    def best_merge(self) -> Tuple[NDArray[numpy.int64], int, int, int]:
+        """
+        Find the safe merge that removes the most entries.
+
+        :return: The members, the merged key and mask, and where it goes
+        """
+        best: Tuple[NDArray[numpy.int64], int, int, int] = (
+            numpy.zeros(0, dtype=numpy.int64), 0, 0, 0)
+        candidates = []
+        for route in numpy.unique(self._routes).tolist():
+            members = numpy.flatnonzero(self._routes == route)
+            candidates.append((len(members), route, members))
+        # Try the biggest first, as a merge is only cut down while it stays
+        # bigger than the best found
+        candidates.sort(key=lambda candidate: -candidate[0])
+        for n_members, route, members in candidates:
+            least = max(1, len(best[0]))
+            if n_members <= least:
+                break
+            merge = self._refine(members, route, least)
+            if len(merge[0]) > len(best[0]):
+                best = merge
+        return best
+
+    def apply(self, members: NDArray[numpy.int64], key: int, mask: int,
+              insert: int):
+        """
+        Replace the members of a merge by the merged entry.
+        """
+        route = int(self._routes[members[0]])
+        new_id = len(self._positions)
+        self._alias_ids[numpy.isin(
+            self._alias_ids, self._ids[members])] = new_id
+        keep = numpy.ones(len(self), dtype=bool)
+        keep[members] = False
+        # Members as general as the merge can be after where it goes
+        self._update(
+            keep, insert - int(numpy.count_nonzero(members < insert)),
+            key, mask, route)
+
+    def table(self, x: int, y: int) -> MulticastRoutingTable:
+        """
+        The entries as a table.
+        """
+        entries = []
+        for entry, key, mask, route in zip(
+                self._entries, self._keys.tolist(), self._masks.tolist(),
+                self._routes.tolist()):
+            if entry is None:
+                entry = MulticastRoutingEntry(
+                    key, mask, spinnaker_route=route)
+            entries.append(entry)
+        return MulticastRoutingTable(x, y, entries)
+
+
+def minimise_table(
+        table: MulticastRoutingTable, target_length: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        remove_default_routes: bool = False) -> MulticastRoutingTable:
+    """
+    Minimise a routing table by Ordered Covering.
+
+    The entries of the table must be orthogonal; no key may be matched by
+    two entries with different routes.
+    This is not checked, as doing so takes as long as minimising;
+    :py:meth:`MulticastRoutingTable.find_conflicts` can be used to check.
+    The entries of the result are in the order the router must use them.
+
+    :param MulticastRoutingTable table: The table to minimise
+    :param target_length:
+        Stop once the table has no more than this many entries,
+        or None to minimise as far as possible
+    :type target_length: int or None
+    :param time_limit:
+        The most seconds to spend merging, or None for no limit
+    :type time_limit: float or None
+    :param bool remove_default_routes:
+        If True defaultable entries are removed where the router's default
+        routing would send their packets the same way
+    :return: A new table for the same chip
+    :rtype: MulticastRoutingTable
+    :raise SpinnMachineException:
+        If the target length is not reached before no merge can be found or
+        the time runs out
+    """
+    start = time.perf_counter()
+    covering = _OrderedCovering(table)
+    if remove_default_routes:
+        covering.remove_default_routes()
+    target = 0 if target_length is None else target_length
+    while len(covering) > target:
+        if (time_limit is not None and
+                time.perf_counter() - start > time_limit):
+            break
+        members, key, mask, insert = covering.best_merge()
+        if len(members) < 2:
+            break
+        covering.apply(members, key, mask, insert)
+
+    if target_length is not None and len(covering) > target_length:
+        raise SpinnMachineException(
+            f"The routing table of chip {table.x}:{table.y} could only be "
+            f"minimised to {len(covering)} entries but the target is "
+            f"{target_length}")
+    return covering.table(table.x, table.y)
+
+
+def minimise_routing_tables(
+        tables: MulticastRoutingTables, machine: Machine,
+        time_limit: Optional[float] = None,
+        remove_default_routes: bool = False) -> MulticastRoutingTables:
+    """
+    Minimise each table which does not fit in the router of its chip until
+    it does.
+
+    Tables which already fit are kept as they are.
+
+    :param MulticastRoutingTables tables:
+    :param Machine machine: The machine with the chips of the tables
+    :param time_limit: The most seconds to spend on each table or None
+    :type time_limit: float or None
+    :param bool remove_default_routes:
+        If True defaultable entries are removed where the router's default
+        routing would send their packets the same way
+    :rtype: MulticastRoutingTables
+    :raise SpinnMachineException:
+        If a table is not for a chip of the machine or can not be made to fit
+    """
+    minimised = MulticastRoutingTables()
+    for table in tables:
+        chip = machine.get_chip_at(table.x, table.y)
+        if chip is None:
+            raise SpinnMachineException(
+                f"There is a routing table for chip {table.x}:{table.y} "
+                "which is not in the machine")
+        if table.fits(chip.router):
+            minimised.add_routing_table(table)
+        else:
+            minimised.add_routing_table(minimise_table(
+                table, chip.router.n_available_multicast_entries,
+                time_limit, remove_default_routes))
+    return minimised
@@ -0,0 +1,196 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Conversion between routing table entries and arrays of keys, masks and
+SpiNNaker route words, many entries at a time.
+
+A route word has bit ``l`` set for each link ``l`` and bit ``6 + p`` set
+for each processor ``p`` the entry routes to.
+"""
+from __future__ import annotations
+from typing import FrozenSet, Sequence, Tuple, TYPE_CHECKING
+import numpy
+from numpy.typing import ArrayLike, NDArray
+from .exceptions import SpinnMachineInvalidParameterException
+if TYPE_CHECKING:
+    from .multicast_routing_entry import MulticastRoutingEntry
+
+# Router.MAX_LINKS_PER_ROUTER and Router.MAX_CORES_PER_ROUTER, which the
+# router imports this module to use
+_N_LINKS = 6
+_N_CORES = 18
+#: The bits of a route word used for links
+LINK_BITS = (1 << _N_LINKS) - 1
+#: The bits of a route word used for processors, once shifted down
+PROCESSOR_BITS = (1 << _N_CORES) - 1
+
+# The processor field is looked up in two halves, as one table for the
+# whole field would have 2^18 entries
+_HALF = _N_CORES // 2
+_HALF_BITS = (1 << _HALF) - 1
+
+
+def _id_sets(n_bits: int, offset: int) -> Tuple[FrozenSet[int], ...]:
+    return tuple(
+        frozenset(offset + bit for bit in range(n_bits) if value >> bit & 1)
+        for value in range(1 << n_bits))
+
+
+# The link IDs of each value of the link field
+_LINK_IDS = _id_sets(_N_LINKS, 0)
+# The processor IDs of each value of the low and high half of the
+# processor field
+_LOW_PROCESSOR_IDS = _id_sets(_HALF, 0)
+_HIGH_PROCESSOR_IDS = _id_sets(_N_CORES - _HALF, _HALF)
+
+
+def route_to_ids(route: int) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+    """
+    Decode one route word by table lookup.
+
+    :param int route:
+    :return: The processor IDs and the link IDs
+    :rtype: tuple(frozenset(int), frozenset(int))
+    """
+    processors = route >> _N_LINKS
+    return (_LOW_PROCESSOR_IDS[processors & _HALF_BITS] |
+            _HIGH_PROCESSOR_IDS[(processors >> _HALF) & _HALF_BITS],
+            _LINK_IDS[route & LINK_BITS])
+
+
+def entries_to_arrays(entries: Sequence[MulticastRoutingEntry]) -> Tuple[
+        NDArray[numpy.uint32], NDArray[numpy.uint32], NDArray[numpy.uint32]]:
+    """
+    Get the keys, masks and route words of entries.
+
+    :param list(MulticastRoutingEntry) entries:
+    :return: The keys, masks and routes, in the order of the entries
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+    """
+    n_entries = len(entries)
+    return (
+        numpy.fromiter((entry.routing_entry_key for entry in entries),
+                       dtype=numpy.uint32, count=n_entries),
+        numpy.fromiter((entry.mask for entry in entries),
+                       dtype=numpy.uint32, count=n_entries),
+        numpy.fromiter((entry.spinnaker_route for entry in entries),
+                       dtype=numpy.uint32, count=n_entries))
+
+
+def encode_routes(processor_bits: ArrayLike,
+                  link_bits: ArrayLike) -> NDArray[numpy.uint32]:
+    """
+    Make route words from processor and link bitsets.
+
+    :param processor_bits: Bit ``p`` set for each processor ``p``
+    :param link_bits: Bit ``l`` set for each link ``l``
+    :rtype: ~numpy.ndarray
+    :raise SpinnMachineInvalidParameterException:
+        If a bitset has a bit set for a processor or link the router does
+        not have
+    """
+    processors = numpy.asarray(processor_bits, dtype=numpy.int64)
+    links = numpy.asarray(link_bits, dtype=numpy.int64)
+    bad_processors = (processors & ~PROCESSOR_BITS) != 0
+    if bad_processors.any():
+        raise SpinnMachineInvalidParameterException(
+            "processor_bits", hex(int(processors[bad_processors][0])),
+            f"Processor IDs must be between 0 and {_N_CORES - 1}")
+    bad_links = (links & ~LINK_BITS) != 0
+    if bad_links.any():
+        raise SpinnMachineInvalidParameterException(
+            "link_bits", hex(int(links[bad_links][0])),
+            f"Link IDs must be between 0 and {_N_LINKS - 1}")
+    return ((processors << _N_LINKS) | links).astype(numpy.uint32)
+
+
+def decode_routes(routes: ArrayLike) -> Tuple[
+        NDArray[numpy.uint32], NDArray[numpy.uint8]]:
+    """
+    Split route words into processor and link bitsets.
+
+    :param routes: The route words
+    :return: The processor bitsets, with bit ``p`` set for processor ``p``,
+        and the link bitsets, with bit ``l`` set for link ``l``
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    """
+    route_array = numpy.asarray(routes, dtype=numpy.uint32)
+    return ((route_array >> numpy.uint32(_N_LINKS)) &
+            numpy.uint32(PROCESSOR_BITS),
+            (route_array & LINK_BITS).astype(numpy.uint8))
+
+
+def routes_to_flags(routes: ArrayLike) -> Tuple[
+        NDArray[numpy.bool_], NDArray[numpy.bool_]]:
+    """
+    Split route words into a flag for each processor and each link.
+
+    :param routes: The route words
+    :return: The processor flags, with a column for each processor ID, and
+        the link flags, with a column for each link ID
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    """
+    route_array = numpy.ascontiguousarray(routes, dtype="<u4").reshape(-1)
+    flags = numpy.unpackbits(
+        route_array.view(numpy.uint8).reshape(len(route_array), 4),
+        axis=1, bitorder="little").astype(bool)
+    return (flags[:, _N_LINKS:_N_LINKS + _N_CORES], flags[:, :_N_LINKS])
+
+
+def _flag_rows(flags: ArrayLike, name: str) -> NDArray[numpy.bool_]:
+    array = numpy.asarray(flags, dtype=bool)
+    if array.ndim == 1 and array.size == 0:
+        return array.reshape(0, 0)
+    if array.ndim > 2:
+        raise SpinnMachineInvalidParameterException(
+            name, str(array.shape), "There must be a row for each route")
+    return numpy.atleast_2d(array)
+
+
+def flags_to_routes(processor_flags: ArrayLike,
+                    link_flags: ArrayLike) -> NDArray[numpy.uint32]:
+    """
+    Make route words from a flag for each processor and each link.
+
+    A single row of flags is one route, and an empty sequence no routes.
+
+    :param processor_flags:
+        A row for each route with a column for each processor ID
+    :param link_flags: A row for each route with a column for each link ID
+    :rtype: ~numpy.ndarray
+    :raise SpinnMachineInvalidParameterException:
+        If there are more columns than processors or links, or the flags
+        do not have the same number of rows
+    """
+    processors = _flag_rows(processor_flags, "processor_flags")
+    links = _flag_rows(link_flags, "link_flags")
+    if len(processors) != len(links):
+        raise SpinnMachineInvalidParameterException(
+            "link_flags", str(links.shape),
+            f"There must be a row for each of the {len(processors)} "
+            "rows of processor flags")
+    if processors.shape[1] > _N_CORES:
+        raise SpinnMachineInvalidParameterException(
+            "processor_flags", str(processors.shape),
+            f"There can be at most {_N_CORES} processor columns")
+    if links.shape[1] > _N_LINKS:
+        raise SpinnMachineInvalidParameterException(
+            "link_flags", str(links.shape),
+            f"There can be at most {_N_LINKS} link columns")
+    flags = numpy.zeros((len(processors), 32), dtype=bool)
+    flags[:, _N_LINKS:_N_LINKS + processors.shape[1]] = processors
+    flags[:, :links.shape[1]] = links
+    return numpy.packbits(
+        flags, axis=1, bitorder="little").view("<u4").reshape(-1).astype(
+            numpy.uint32)
@@ -14,14 +14,21 @@
 from __future__ import annotations
 from typing import (
     Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING)
+from spinn_utilities.typing.coords import XY
 from .exceptions import (
-    SpinnMachineAlreadyExistsException, SpinnMachineInvalidParameterException)
+    SpinnMachineAlreadyExistsException, SpinnMachineException,
+    SpinnMachineInvalidParameterException)
+from .route_arrays import route_to_ids
 if TYPE_CHECKING:
     from .link import Link
     from .fixed_route_entry import FixedRouteEntry
     from .multicast_routing_entry import MulticastRoutingEntry
 
 
+#: The number of links set in each possible link mask
+LINK_MASK_COUNTS = bytes(bin(mask).count("1") for mask in range(64))
+
+
 class Router(object):
     """
     Represents a router of a chip, with a set of available links.
@@ -58,6 +65,29 @@ class Router(object):
 
         self._n_available_multicast_entries = n_available_multicast_entries
 
+    @property
+    def is_compact(self) -> bool:
+        """
+        Whether the links are created on demand from a link mask, as by a
+        :py:class:`~spinn_machine.CompactRouter`.
+
+        :rtype: bool
+        """
+        return False
+
+    @property
+    def link_mask(self) -> int:
+        """
+        The links of this router as a bit mask with bit n set if link n
+        exists.
+
+        :rtype: int
+        """
+        mask = 0
+        for link_id in self._links:
+            mask |= 1 << link_id
+        return mask
+
     def add_link(self, link: Link):
         """
         Add a link to the router of the chip.
@@ -71,6 +101,22 @@ class Router(object):
                 "link", str(link.source_link_id))
         self._links[link.source_link_id] = link
 
+    def remove_link(self, source_link_id: int) -> Link:
+        """
+        Remove a link from the router of the chip.
+
+        :param int source_link_id: The ID of the link to remove
+        :return: The link removed
+        :rtype: ~spinn_machine.Link
+        :raise ~spinn_machine.exceptions.SpinnMachineException:
+            If there is no link with the given ID
+        """
+        link = self._links.pop(source_link_id, None)
+        if link is None:
+            raise SpinnMachineException(
+                f"There is no link {source_link_id} to remove")
+        return link
+
     def is_link(self, source_link_id: int) -> bool:
         """
         Determine if there is a link with ID source_link_id.
@@ -99,6 +145,20 @@ class Router(object):
         """
         return self._links.get(source_link_id)
 
+    def get_destination(self, source_link_id: int) -> Optional[XY]:
+        """
+        Get the (x, y) at the other end of a link without needing a
+        :py:class:`Link` object.
+
+        :param int source_link_id: The ID of the link to find
+        :return: The (x, y) of the destination or None if no such link
+        :rtype: tuple(int, int) or None
+        """
+        link = self._links.get(source_link_id)
+        if link is None:
+            return None
+        return (link.destination_x, link.destination_y)
+
     def __getitem__(self, source_link_id: int) -> Optional[Link]:
         """
         See :py:meth:`get_link`
@@ -186,11 +246,8 @@ class Router(object):
         :return: The list of processor IDs, and the list of link IDs.
         :rtype: tuple(list(int), list(int))
         """
-        processor_ids = [pi for pi in range(0, Router.MAX_CORES_PER_ROUTER)
-                         if route & 1 << (Router.MAX_LINKS_PER_ROUTER + pi)]
-        link_ids = [li for li in range(0, Router.MAX_LINKS_PER_ROUTER)
-                    if route & 1 << li]
-        return processor_ids, link_ids
+        processor_ids, link_ids = route_to_ids(route)
+        return sorted(processor_ids), sorted(link_ids)
 
     def get_neighbouring_chips_coords(self) -> List[Dict[str, int]]:
         """
@@ -207,7 +264,7 @@ class Router(object):
         return (
             f"[Router: "
             f"available_entries={self._n_available_multicast_entries}, "
-            f"links={list(self._links.values())}]")
+            f"links={list(self.links)}]")
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -0,0 +1,238 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+from spinn_utilities.typing.coords import XY
+from .exceptions import SpinnMachineException
+from .router import Router
+if TYPE_CHECKING:
+    from .machine import Machine
+
+_LINKS = range(Router.MAX_LINKS_PER_ROUTER)
+
+
+class RoutingGraph(object):
+    """
+    A graph of the chips and links that actually exist in a Machine.
+
+    Unlike :py:meth:`~spinn_machine.Machine.get_vector` the paths found
+    only use chips that exist and links that are present in each
+    chip's router, so they route around dead chips and links.
+
+    All links are assumed to have the same cost so a breadth first search
+    gives the shortest paths.
+
+    The graph is a snapshot; it does not see later changes to the Machine.
+    """
+
+    __slots__ = (
+        # The index of each chip (x, y)
+        "_index",
+        # For each chip index * 6 + link the index of the chip reached
+        # over that link or -1 if there is no link or no chip there
+        "_neighbours",
+        # The (x, y) of each chip index
+        "_xys")
+
+    def __init__(self, machine: Machine):
+        """
+        :param Machine machine: The machine to build the graph of
+        """
+        self._xys: List[XY] = [(chip.x, chip.y) for chip in machine.chips]
+        self._index: Dict[XY, int] = {
+            xy: index for index, xy in enumerate(self._xys)}
+        self._neighbours: List[int] = [-1] * (
+            len(self._xys) * Router.MAX_LINKS_PER_ROUTER)
+        index = self._index
+        for source, chip in enumerate(machine.chips):
+            base = source * Router.MAX_LINKS_PER_ROUTER
+            router = chip.router
+            link_mask = router.link_mask
+            for link_id in _LINKS:
+                if (link_mask >> link_id) & 1:
+                    destination = router.get_destination(link_id)
+                    assert destination is not None
+                    self._neighbours[base + link_id] = index.get(
+                        destination, -1)
+
+    def __len__(self) -> int:
+        """
+        The number of chips in the graph.
+
+        :rtype: int
+        """
+        return len(self._xys)
+
+    def _indexes(self, xys: Iterable[XY]) -> List[int]:
+        try:
+            return [self._index[xy] for xy in xys]
+        except KeyError as ex:
+            raise SpinnMachineException(
+                f"There is no chip at {ex.args[0]}") from ex
+
+    def _bfs(self, sources: List[int]) -> Tuple[List[int], List[int]]:
+        """
+        Breadth first search from all the sources at once.
+
+        :return: The hop count to each chip (-1 if unreachable) and the
+            ``parent index * 6 + link`` used to reach each chip (-1 for the
+            sources and unreachable chips)
+        """
+        n_links = Router.MAX_LINKS_PER_ROUTER
+        neighbours = self._neighbours
+        hops = [-1] * len(self._xys)
+        via = [-1] * len(self._xys)
+        queue = deque(sources)
+        for source in sources:
+            hops[source] = 0
+        while queue:
+            current = queue.popleft()
+            next_hops = hops[current] + 1
+            base = current * n_links
+            for link in _LINKS:
+                target = neighbours[base + link]
+                if target >= 0 and hops[target] < 0:
+                    hops[target] = next_hops
+                    via[target] = base + link
+                    queue.append(target)
+        return hops, via
+
+    def _hop_dict(self, hops: List[int]) -> Dict[XY, int]:
+        return {
+            self._xys[index]: hop for index, hop in enumerate(hops)
+            if hop >= 0}
+
+    def hops_from(self, source: XY) -> Dict[XY, int]:
+        """
+        Get the number of hops from the source to every reachable chip.
+
+        :param tuple(int,int) source: The (x, y) of the source chip
+        :return: A map of (x, y) to hop count for all reachable chips,
+            including the source with a count of 0
+        :rtype: dict(tuple(int,int), int)
+        :raises SpinnMachineException: If there is no chip at the source
+        """
+        hops, _ = self._bfs(self._indexes([source]))
+        return self._hop_dict(hops)
+
+    def hops_from_any(self, sources: Iterable[XY]) -> Dict[XY, int]:
+        """
+        Get the number of hops from the nearest of the sources to every
+        reachable chip.
+
+        :param iterable(tuple(int,int)) sources: The (x, y) of each source
+        :return: A map of (x, y) to hop count for all reachable chips
+        :rtype: dict(tuple(int,int), int)
+        :raises SpinnMachineException: If there is no chip at a source
+        """
+        hops, _ = self._bfs(self._indexes(sources))
+        return self._hop_dict(hops)
+
+    def _path_to(self, via: List[int], target: int) -> List[
+            Tuple[int, int, int]]:
+        n_links = Router.MAX_LINKS_PER_ROUTER
+        path: List[Tuple[int, int, int]] = []
+        while via[target] >= 0:
+            parent, link = divmod(via[target], n_links)
+            x, y = self._xys[parent]
+            path.append((x, y, link))
+            target = parent
+        path.reverse()
+        return path
+
+    def shortest_path(self, source: XY, destination: XY) -> Optional[
+            List[Tuple[int, int, int]]]:
+        """
+        Get a shortest path between two chips over existing links.
+
+        :param tuple(int,int) source: The (x, y) of the source chip
+        :param tuple(int,int) destination: The (x, y) of the destination chip
+        :return: The hops as (x, y, link) where x, y is the chip the link
+            leaves from, empty if source is destination,
+            or None if the destination can not be reached
+        :rtype: list(tuple(int,int,int)) or None
+        :raises SpinnMachineException: If there is no chip at the source or
+            destination
+        """
+        source_index, destination_index = self._indexes(
+            [source, destination])
+        hops, via = self._bfs([source_index])
+        if hops[destination_index] < 0:
+            return None
+        return self._path_to(via, destination_index)
+
+    def shortest_paths_from(
+            self, sources: Iterable[XY], destinations: Iterable[XY]
+            ) -> Dict[XY, Optional[List[Tuple[int, int, int]]]]:
+        """
+        Get a shortest path to each destination from the nearest source.
+
+        :param iterable(tuple(int,int)) sources: The (x, y) of each source
+        :param iterable(tuple(int,int)) destinations:
+            The (x, y) of each destination
+        :return: A map of destination to path as in :py:meth:`shortest_path`
+        :rtype: dict(tuple(int,int), list(tuple(int,int,int)) or None)
+        :raises SpinnMachineException: If there is no chip at a source or
+            destination
+        """
+        hops, via = self._bfs(self._indexes(sources))
+        destinations = list(destinations)
+        paths: Dict[XY, Optional[List[Tuple[int, int, int]]]] = dict()
+        for xy, index in zip(destinations, self._indexes(destinations)):
+            if hops[index] < 0:
+                paths[xy] = None
+            else:
+                paths[xy] = self._path_to(via, index)
+        return paths
+
+    def shortest_path_tree(
+            self, source: XY, destinations: Iterable[XY]
+            ) -> Dict[XY, Set[int]]:
+        """
+        Get a tree of shortest paths from the source to all the destinations.
+
+        Every destination is reached by a shortest path and paths share
+        links wherever they can, as needed to build a multicast route.
+
+        :param tuple(int,int) source: The (x, y) of the source chip
+        :param iterable(tuple(int,int)) destinations:
+            The (x, y) of each destination
+        :return: A map of the (x, y) of each chip in the tree that sends
+            packets on to the IDs of the links it sends them on.
+            Chips with no outgoing links are not included.
+        :rtype: dict(tuple(int,int), set(int))
+        :raises SpinnMachineException:
+            If there is no chip at the source or a destination or if a
+            destination can not be reached
+        """
+        n_links = Router.MAX_LINKS_PER_ROUTER
+        hops, via = self._bfs(self._indexes([source]))
+        tree: Dict[XY, Set[int]] = dict()
+        in_tree: Set[int] = set()
+        destinations = list(destinations)
+        for xy, target in zip(destinations, self._indexes(destinations)):
+            if hops[target] < 0:
+                raise SpinnMachineException(
+                    f"Chip {xy} can not be reached from {source}")
+            while via[target] >= 0 and target not in in_tree:
+                in_tree.add(target)
+                parent, link = divmod(via[target], n_links)
+                parent_xy = self._xys[parent]
+                if parent_xy in tree:
+                    tree[parent_xy].add(link)
+                else:
+                    tree[parent_xy] = {link}
+                target = parent
+        return tree
@@ -0,0 +1,367 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The differences between the routing tables of two runs, so only the
+chips whose tables changed need to be loaded again.
+
+Entries are matched by their key and mask, and by default compared only by
+route, as that is all the router is given; whether an entry is defaultable
+is not loaded onto the chip, nor kept when a table is written as bytes.
+A table made from bytes can have more than one entry with a key and mask;
+those are matched in order, the first of one table with the first of the
+other.
+"""
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.typing.coords import XY
+from .multicast_routing_entry import MulticastRoutingEntry
+from .multicast_routing_table import (
+    MulticastRoutingTable, MulticastRoutingTables)
+
+
+def _key_masks(table: MulticastRoutingTable) -> NDArray[numpy.uint64]:
+    keys, masks, _ = table.arrays
+    return (keys.astype(numpy.uint64) << numpy.uint64(32)) | masks
+
+
+def _occurrences(groups: NDArray[numpy.int64]) -> NDArray[numpy.int64]:
+    """
+    How many entries of the same group come before each entry.
+    """
+    order = numpy.argsort(groups, kind="stable")
+    sorted_groups = groups[order]
+    starts = numpy.flatnonzero(numpy.concatenate(
+        ([True], sorted_groups[1:] != sorted_groups[:-1])))
+    occurrences = numpy.empty(len(groups), dtype=numpy.int64)
+    occurrences[order] = numpy.arange(len(groups)) - numpy.repeat(
+        starts, numpy.diff(numpy.append(starts, len(groups))))
+    return occurrences
+
+
+def _match(old: MulticastRoutingTable, new: MulticastRoutingTable) -> Tuple[
+        NDArray[numpy.int64], NDArray[numpy.int64]]:
+    """
+    The indices of the entries of both tables with the same key and mask,
+    the nth with a key and mask in one matched to the nth in the other.
+    """
+    n_old = len(old)
+    _, groups = numpy.unique(numpy.concatenate(
+        (_key_masks(old), _key_masks(new))), return_inverse=True)
+    groups = groups.astype(numpy.int64).reshape(-1)
+    ids = []
+    for table_groups in (groups[:n_old], groups[n_old:]):
+        ids.append(table_groups * len(groups) + _occurrences(table_groups))
+    _, old_common, new_common = numpy.intersect1d(
+        ids[0], ids[1], assume_unique=True, return_indices=True)
+    return old_common, new_common
+
+
+class RoutingTableDiff(object):
+    """
+    The differences between two routing tables of a chip.
+    """
+
+    __slots__ = (
+        # The x-coordinate of the chip
+        "_x",
+        # The y-coordinate of the chip
+        "_y",
+        # The entries only in the new table, in its order
+        "_added",
+        # The entries only in the old table, in its order
+        "_removed",
+        # The (old, new) entries with a key and mask in both tables that
+        # differ, in the order of the new table
+        "_changed",
+        # If the entries in both tables are in a different order
+        "_reordered")
+
+    def __init__(
+            self, x: int, y: int,
+            added: Sequence[MulticastRoutingEntry] = (),
+            removed: Sequence[MulticastRoutingEntry] = (),
+            changed: Sequence[Tuple[
+                MulticastRoutingEntry, MulticastRoutingEntry]] = (),
+            reordered: bool = False):
+        """
+        :param int x: The x-coordinate of the chip
+        :param int y: The y-coordinate of the chip
+        :param list(MulticastRoutingEntry) added:
+            The entries only in the new table
+        :param list(MulticastRoutingEntry) removed:
+            The entries only in the old table
+        :param changed:
+            The old and new entries with the same key and mask that differ
+        :type changed:
+            list(tuple(MulticastRoutingEntry, MulticastRoutingEntry))
+        :param bool reordered:
+            If the entries in both tables are in a different order
+        """
+        self._x = x
+        self._y = y
+        self._added = added
+        self._removed = removed
+        self._changed = changed
+        self._reordered = reordered
+
+    @property
+    def x(self) -> int:
+        """
+        The x-coordinate of the chip.
+
+        :rtype: int
+        """
+        return self._x
+
+    @property
+    def y(self) -> int:
+        """
+        The y-coordinate of the chip.
+
+        :rtype: int
+        """
+        return self._y
+
+    @property
+    def added(self) -> Sequence[MulticastRoutingEntry]:
+        """
+        The entries only in the new table, in its order.
+
+        :rtype: list(MulticastRoutingEntry)
+        """
+        return self._added
+
+    @property
+    def removed(self) -> Sequence[MulticastRoutingEntry]:
+        """
+        The entries only in the old table, in its order.
+
+        :rtype: list(MulticastRoutingEntry)
+        """
+        return self._removed
+
+    @property
+    def changed(self) -> Sequence[Tuple[
+            MulticastRoutingEntry, MulticastRoutingEntry]]:
+        """
+        The old and new entries with the same key and mask but a different
+        route, or defaultable if that was compared, in the order of the new
+        table.
+
+        :rtype: list(tuple(MulticastRoutingEntry, MulticastRoutingEntry))
+        """
+        return self._changed
+
+    @property
+    def reordered(self) -> bool:
+        """
+        Whether the entries in both tables are in a different order.
+
+        As the router uses the first entry that matches, this matters
+        where entries overlap.
+
+        :rtype: bool
+        """
+        return self._reordered
+
+    @property
+    def is_unchanged(self) -> bool:
+        """
+        Whether the tables have the same entries in the same order.
+
+        :rtype: bool
+        """
+        return not (self._added or self._removed or self._changed or
+                    self._reordered)
+
+    def __repr__(self) -> str:
+        return (f"RoutingTableDiff({self._x}:{self._y} "
+                f"added={len(self._added)} removed={len(self._removed)} "
+                f"changed={len(self._changed)} reordered={self._reordered})")
+
+
+def diff_routing_table(
+        old: MulticastRoutingTable, new: MulticastRoutingTable,
+        compare_defaultable: bool = False) -> RoutingTableDiff:
+    """
+    Find the differences between two tables of a chip.
+
+    The entries are matched by sorting the keys and masks of both, so no
+    entry is compared with every other.
+    Entries with the same key and mask as an earlier one of the same table
+    are matched in order.
+
+    :param MulticastRoutingTable old: The table as it was
+    :param MulticastRoutingTable new: The table as it is now
+    :param bool compare_defaultable:
+        If True entries that only differ in being defaultable are changed
+        too; that is not loaded onto the chip so by default they are not
+    :return: The differences, for the chip of the new table
+    :rtype: RoutingTableDiff
+    """
+    old_keys, old_masks, old_routes = old.arrays
+    new_keys, new_masks, new_routes = new.arrays
+    if (len(old_keys) == len(new_keys) and
+            numpy.array_equal(old_keys, new_keys) and
+            numpy.array_equal(old_masks, new_masks) and
+            numpy.array_equal(old_routes, new_routes) and
+            (not compare_defaultable or numpy.array_equal(
+                old.defaultable_flags, new.defaultable_flags))):
+        return RoutingTableDiff(new.x, new.y)
+
+    old_common, new_common = _match(old, new)
+    # Go through the entries in both in the order of the new table
+    order = numpy.argsort(new_common)
+    old_common = old_common[order]
+    new_common = new_common[order]
+
+    old_only = numpy.ones(len(old_keys), dtype=bool)
+    old_only[old_common] = False
+    new_only = numpy.ones(len(new_keys), dtype=bool)
+    new_only[new_common] = False
+    differs = old_routes[old_common] != new_routes[new_common]
+    if compare_defaultable:
+        differs |= (old.defaultable_flags[old_common] !=
+                    new.defaultable_flags[new_common])
+
+    old_entries = old.multicast_routing_entries
+    new_entries = new.multicast_routing_entries
+    return RoutingTableDiff(
+        new.x, new.y,
+        added=[new_entries[index]
+               for index in numpy.flatnonzero(new_only).tolist()],
+        removed=[old_entries[index]
+                 for index in numpy.flatnonzero(old_only).tolist()],
+        changed=[(old_entries[old_index], new_entries[new_index])
+                 for old_index, new_index in zip(
+                     old_common[differs].tolist(),
+                     new_common[differs].tolist())],
+        reordered=bool((numpy.diff(old_common) < 0).any()))
+
+
+class RoutingTablesDiff(object):
+    """
+    The differences between the routing tables of two runs on a machine.
+    """
+
+    __slots__ = (
+        # The differences of the chips with changed tables by (x, y)
+        "_diffs",
+        # The (x, y) of the chips with unchanged tables
+        "_unchanged")
+
+    def __init__(self, diffs: Iterable[RoutingTableDiff],
+                 unchanged: Iterable[XY] = ()):
+        """
+        :param iterable(RoutingTableDiff) diffs:
+            The differences of the chips with changed tables
+        :param iterable(tuple(int,int)) unchanged:
+            The (x, y) of the chips with unchanged tables
+        """
+        self._diffs: Dict[XY, RoutingTableDiff] = {
+            (diff.x, diff.y): diff for diff in diffs}
+        self._unchanged: List[XY] = list(unchanged)
+
+    @property
+    def diffs(self) -> Iterable[RoutingTableDiff]:
+        """
+        The differences of the chips whose tables changed.
+
+        :rtype: iterable(RoutingTableDiff)
+        """
+        return self._diffs.values()
+
+    @property
+    def changed_chips(self) -> Iterable[XY]:
+        """
+        The (x, y) of the chips whose tables changed, including those with
+        a table in only one run.
+
+        :rtype: iterable(tuple(int,int))
+        """
+        return self._diffs.keys()
+
+    @property
+    def unchanged_chips(self) -> Sequence[XY]:
+        """
+        The (x, y) of the chips whose tables did not change.
+
+        :rtype: list(tuple(int,int))
+        """
+        return self._unchanged
+
+    def get_diff_for_chip(self, x: int, y: int) -> Optional[RoutingTableDiff]:
+        """
+        Get the differences of the table of a chip.
+
+        :param int x: The x-coordinate of the chip
+        :param int y: The y-coordinate of the chip
+        :return: The differences, or None if the table did not change
+        :rtype: RoutingTableDiff or None
+        """
+        return self._diffs.get((x, y))
+
+    @property
+    def is_unchanged(self) -> bool:
+        """
+        Whether no table changed.
+
+        :rtype: bool
+        """
+        return not self._diffs
+
+    def __repr__(self) -> str:
+        return (f"RoutingTablesDiff(changed={len(self._diffs)} "
+                f"unchanged={len(self._unchanged)})")
+
+
+def diff_routing_tables(
+        old: MulticastRoutingTables, new: MulticastRoutingTables,
+        compare_defaultable: bool = False) -> RoutingTablesDiff:
+    """
+    Find the differences between the tables of two runs.
+
+    A chip with a table in only one of the runs is compared with an empty
+    table.
+
+    :param MulticastRoutingTables old: The tables as they were
+    :param MulticastRoutingTables new: The tables as they are now
+    :param bool compare_defaultable:
+        If True entries that only differ in being defaultable are changed
+        too; that is not loaded onto the chip so by default they are not
+    :rtype: RoutingTablesDiff
+    """
+    diffs: List[RoutingTableDiff] = list()
+    unchanged: List[XY] = list()
+    for table in new:
+        old_table = old.get_routing_table_for_chip(table.x, table.y)
+        if old_table is None:
+            old_table = MulticastRoutingTable(table.x, table.y)
+        diff = diff_routing_table(old_table, table, compare_defaultable)
+        if diff.is_unchanged:
+            unchanged.append((table.x, table.y))
+        else:
+            diffs.append(diff)
+    for old_table in old:
+        if (old_table.x, old_table.y) not in new:
+            diff = diff_routing_table(
+                old_table, MulticastRoutingTable(old_table.x, old_table.y),
+                compare_defaultable)
+            if diff.is_unchanged:
+                unchanged.append((old_table.x, old_table.y))
+            else:
+                diffs.append(diff)
+    return RoutingTablesDiff(diffs, unchanged)
@@ -0,0 +1,266 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The routing tables of a whole machine in one file, read through a memory
+map so only the tables in use are paged in and several processes can
+share them.
+
+The file is a fixed header, an index record per chip in (x, y) order and
+then the entries of each table::
+
+    header: magic, format version, number of chips
+    index:  x, y, number of entries, offset of the entries in the file
+    table:  key, mask, route of each entry, as written by
+            MulticastRoutingTable.to_bytes
+
+All values are little-endian.
+"""
+from __future__ import annotations
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, Optional
+import numpy
+from spinn_utilities.overrides import overrides
+from spinn_utilities.typing.coords import XY
+from .exceptions import SpinnMachineException
+from .frozen_multicast_routing_table import FrozenMulticastRoutingTable
+from .multicast_routing_table import (
+    ENTRY_DTYPE, MulticastRoutingTable, MulticastRoutingTables)
+
+#: Identifies a routing table store file
+MAGIC = b"SPINNRTS"
+
+#: The version of the format written
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sII")
+
+_INDEX_DTYPE = numpy.dtype([
+    ("x", "<u2"), ("y", "<u2"), ("n_entries", "<u4"), ("offset", "<u8")])
+
+
+def _header_size() -> int:
+    # The index starts on an 8 byte boundary
+    return (_HEADER.size + 7) // 8 * 8
+
+
+def _xy_keys(xs: numpy.ndarray, ys: numpy.ndarray) -> numpy.ndarray:
+    return (xs.astype(numpy.uint32) << numpy.uint32(16)) | ys
+
+
+def to_routing_table_store_path(
+        file_path: str, tables: Iterable[MulticastRoutingTable]):
+    """
+    Writes routing tables to a store, one table at a time.
+
+    Whether entries are defaultable is not written.
+
+    :param str file_path: Location to write file to. Warning will overwrite!
+    :param tables: The tables, at most one for each chip
+    :type tables: MulticastRoutingTables or iterable(MulticastRoutingTable)
+    :raises SpinnMachineException: If there are two tables for a chip
+    """
+    by_xy = sorted(tables, key=lambda table: (table.x, table.y))
+    index = numpy.zeros(len(by_xy), dtype=_INDEX_DTYPE)
+    index["x"] = [table.x for table in by_xy]
+    index["y"] = [table.y for table in by_xy]
+    index["n_entries"] = [len(table) for table in by_xy]
+    xy_keys = _xy_keys(index["x"], index["y"])
+    if (numpy.diff(xy_keys) == 0).any():
+        raise SpinnMachineException(
+            "There is more than one routing table for a chip")
+    # The tables follow the index in the same order
+    sizes = index["n_entries"].astype(numpy.uint64) * numpy.uint64(
+        ENTRY_DTYPE.itemsize)
+    index["offset"] = (numpy.uint64(_header_size() + index.nbytes) +
+                       numpy.cumsum(sizes) - sizes)
+
+    with open(file_path, "wb") as s_file:
+        s_file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(by_xy)).ljust(
+            _header_size(), b"\0"))
+        s_file.write(index.tobytes())
+        for table in by_xy:
+            s_file.write(table.to_bytes())
+
+
+class RoutingTableStore(MulticastRoutingTables):
+    """
+    Read-only routing tables of a machine from a file written by
+    :py:func:`to_routing_table_store_path`.
+
+    The file is memory mapped and the table of a chip is a
+    :py:class:`~spinn_machine.FrozenMulticastRoutingTable` over its part
+    of the map, made each time it is asked for, so no entries are read
+    until used.
+    Tables got from the store keep the map alive after it is closed.
+    """
+
+    __slots__ = (
+        # The memory map of the file
+        "_data",
+        # The index records in (x, y) order
+        "_index",
+        # The (x, y) of each index record as one sortable number
+        "_xy_keys")
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, file_path: str):
+        """
+        :param str file_path: The file written by
+            :py:func:`to_routing_table_store_path`
+        :raises SpinnMachineException:
+            If the file is not a routing table store, is an unsupported
+            format version or is too short for its index
+        """
+        if os.path.getsize(file_path) < _header_size():
+            raise SpinnMachineException(
+                f"{file_path} is not a routing table store")
+        with open(file_path, "rb") as s_file:
+            data = mmap.mmap(s_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._index = self._read_index(data, file_path)
+        except SpinnMachineException:
+            data.close()
+            raise
+        self._data: Optional[mmap.mmap] = data
+        self._xy_keys = _xy_keys(self._index["x"], self._index["y"])
+
+    @staticmethod
+    def _read_index(data: mmap.mmap, file_path: str) -> numpy.ndarray:
+        magic, format_version, n_chips = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise SpinnMachineException(
+                f"{file_path} is not a routing table store")
+        if format_version != FORMAT_VERSION:
+            raise SpinnMachineException(
+                f"{file_path} has unsupported routing table store format "
+                f"{format_version}")
+        tables_start = _header_size() + n_chips * _INDEX_DTYPE.itemsize
+        if tables_start > len(data):
+            raise SpinnMachineException(
+                f"{file_path} is too short for the index of {n_chips} chips")
+        # The index is copied so the map is not held by it
+        index = numpy.frombuffer(
+            data, dtype=_INDEX_DTYPE, count=n_chips,
+            offset=_header_size()).copy()
+        offsets = index["offset"].astype(numpy.int64)
+        ends = offsets + index["n_entries"].astype(numpy.int64) * \
+            ENTRY_DTYPE.itemsize
+        if (offsets < tables_start).any() or (ends > len(data)).any():
+            raise SpinnMachineException(
+                f"{file_path} is too short for the tables in its index")
+        return index
+
+    def close(self):
+        """
+        Release the memory map.
+
+        Tables already got from the store can still be used; the map is
+        unmapped once the last of them is no longer referenced.
+        """
+        if self._data is None:
+            return
+        try:
+            self._data.close()
+        except BufferError:
+            # Tables still use it, so leave it to go with the last of them
+            pass
+        self._data = None
+
+    def __enter__(self) -> RoutingTableStore:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _row(self, x: int, y: int) -> int:
+        key = (x << 16) | y
+        row = int(numpy.searchsorted(self._xy_keys, key))
+        if row < len(self._xy_keys) and self._xy_keys[row] == key:
+            return row
+        return -1
+
+    def _table(self, row: int) -> FrozenMulticastRoutingTable:
+        if self._data is None:
+            raise SpinnMachineException("The routing table store is closed")
+        x, y, n_entries, offset = self._index[row].tolist()
+        return FrozenMulticastRoutingTable(
+            x, y, memoryview(self._data)[
+                offset:offset + n_entries * ENTRY_DTYPE.itemsize])
+
+    @overrides(MulticastRoutingTables.add_routing_table)
+    def add_routing_table(self, table: MulticastRoutingTable):
+        raise RuntimeError("This object is immutable")
+
+    @property
+    @overrides(MulticastRoutingTables.routing_tables)
+    def routing_tables(self) -> Iterable[MulticastRoutingTable]:
+        return list(self)
+
+    @overrides(MulticastRoutingTables.get_routing_table_for_chip)
+    def get_routing_table_for_chip(
+            self, x: int, y: int) -> Optional[MulticastRoutingTable]:
+        row = self._row(x, y)
+        if row < 0:
+            return None
+        return self._table(row)
+
+    def get_number_of_entries(self, x: int, y: int) -> int:
+        """
+        The number of entries in the table of a chip, without reading it.
+
+        :param int x: The x-coordinate of the chip
+        :param int y: The y-coordinate of the chip
+        :return: The number of entries, or 0 if the chip has no table
+        :rtype: int
+        """
+        row = self._row(x, y)
+        if row < 0:
+            return 0
+        return int(self._index["n_entries"][row])
+
+    @property
+    def chips(self) -> Iterator[XY]:
+        """
+        The (x, y) of the chips with a table, in (x, y) order.
+
+        :rtype: iterable(tuple(int,int))
+        """
+        return zip(self._index["x"].tolist(), self._index["y"].tolist())
+
+    @property
+    @overrides(MulticastRoutingTables.max_number_of_entries)
+    def max_number_of_entries(self) -> int:
+        return int(self._index["n_entries"].max(initial=0))
+
+    @overrides(MulticastRoutingTables.__len__)
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @overrides(MulticastRoutingTables.__iter__)
+    def __iter__(self) -> Iterator[MulticastRoutingTable]:
+        for row in range(len(self._index)):
+            yield self._table(row)
+
+    @overrides(MulticastRoutingTables.__contains__)
+    def __contains__(self, xy: XY) -> bool:
+        return self._row(*xy) >= 0
+
+    @overrides(MulticastRoutingTables.__getitem__)
+    def __getitem__(self, xy: XY) -> MulticastRoutingTable:
+        row = self._row(*xy)
+        if row < 0:
+            raise KeyError(xy)
+        return self._table(row)
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from typing import Sequence, Optional, Tuple
+import numpy
+from numpy.typing import ArrayLike, NDArray
 from typing_extensions import TypeAlias
 from spinn_utilities.typing.coords import XY
 
@@ -32,6 +34,7 @@ class SpiNNakerTriadGeometry(object):
     """
     __slots__ = (
         "_ethernet_offset",
+        "_offsets",
         "_triad_height",
         "_triad_width",
         "_board_height",
@@ -96,14 +99,24 @@ class SpiNNakerTriadGeometry(object):
             for y in range(triad_height)
         )
 
+        offsets = [
+            [(x - vx, y - vy) for x, (vx, vy) in enumerate(row)]
+            for y, row in enumerate(nearest_ethernets)]
+
         # SpiNN-5 Ethernet connected chip lookup.
-        # Used by :py:meth:`.local_eth_coord`. Given an x and y
+        # Used by :py:meth:`.get_local_chip_coordinate_batch`. Given an x and y
         # chip position return the offset of the chip's position
         # from the board's bottom-left chip.
-        # Note: the order of indexes: ``_ethernet_offset[y][x]``!
-        self._ethernet_offset = [
-            [(x - vx, y - vy) for x, (vx, vy) in enumerate(row)]
-            for y, row in enumerate(nearest_ethernets)]
+        # Note: the order of indexes: ``_ethernet_offset[y, x]``!
+        self._ethernet_offset: NDArray[numpy.integer] = numpy.array(
+            offsets, dtype=numpy.int64).reshape(
+                triad_height, triad_width, 2)
+        self._ethernet_offset.setflags(write=False)
+
+        # The same offsets as tuples indexed by ``y * triad_width + x``
+        # as looking up a single chip is much faster in a tuple
+        self._offsets: Tuple[XY, ...] = tuple(
+            xy for row in offsets for xy in row)
 
     @staticmethod
     def __hexagonal_metric_distance(xy: XY, centre: _Centre):
@@ -213,7 +226,55 @@ class SpiNNakerTriadGeometry(object):
         """
         dx = (x - root_x) % self._triad_width
         dy = (y - root_y) % self._triad_height
-        return self._ethernet_offset[dy][dx]
+        return self._offsets[dy * self._triad_width + dx]
+
+    def get_local_chip_coordinate_batch(
+            self, xys: ArrayLike, root_x: int = 0,
+            root_y: int = 0) -> NDArray[numpy.integer]:
+        """
+        Batch version of :py:meth:`get_local_chip_coordinate`.
+
+        :param xys: (x, y) coordinates of the chips with (x, y) in the last
+            axis, so shape (n, 2) for n chips
+        :type xys: ~numpy.ndarray
+        :param int root_x: The x-coordinate of the boot chip (default 0, 0)
+        :param int root_y: The y-coordinate of the boot chip (default 0, 0)
+        :return: The coordinates of each chip relative to its board with
+            (x, y) in the last axis
+        :rtype: ~numpy.ndarray
+        """
+        xys = numpy.asarray(xys)
+        dx = (xys[..., 0] - root_x) % self._triad_width
+        dy = (xys[..., 1] - root_y) % self._triad_height
+        return self._ethernet_offset[dy, dx]
+
+    def get_ethernet_chip_coordinates_batch(
+            self, xys: ArrayLike, width: int, height: int,
+            root_x: int = 0, root_y: int = 0) -> NDArray[numpy.integer]:
+        """
+        Batch version of :py:meth:`get_ethernet_chip_coordinates`.
+
+        :param xys: (x, y) coordinates of the chips with (x, y) in the last
+            axis, so shape (n, 2) for n chips
+        :type xys: ~numpy.ndarray
+        :param int width:
+            width of the SpiNNaker machine (must be a multiple of the triad
+            width of this geometry)
+        :param int height:
+            height of the SpiNNaker machine (must be a multiple of the triad
+            height of this geometry)
+        :param int root_x:
+            x-coordinate of the boot chip (default 0, 0)
+        :param int root_y:
+            y-coordinate of the boot chip (default 0, 0)
+        :return: The coordinates of the closest Ethernet chip of each chip
+            with (x, y) in the last axis
+        :rtype: ~numpy.ndarray
+        """
+        xys = numpy.asarray(xys)
+        ethernets = xys - self.get_local_chip_coordinate_batch(
+            xys, root_x, root_y)
+        return ethernets % numpy.array([width, height])
 
     def get_potential_ethernet_chips(
             self, width: int, height: int) -> Sequence[XY]:
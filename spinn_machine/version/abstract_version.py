@@ -283,7 +283,8 @@ class AbstractVersion(object, metaclass=AbstractBase):
 
     def create_machine(
             self, width: Optional[int], height: Optional[int],
-            origin: Optional[str] = None) -> Machine:
+            origin: Optional[str] = None, dense: bool = False,
+            lazy: bool = False) -> Machine:
         """
         Creates a new empty machine based on the width, height and version.
 
@@ -293,16 +294,22 @@ class AbstractVersion(object, metaclass=AbstractBase):
         :param origin: Extra information about how this machine was created
             to be used in ``str(version)``. Example "``Virtual``" or "``Json``"
         :type origin: str or None
+        :param bool dense:
+            If True the Machine holds its chips in a dense (x, y) array
+        :param bool lazy:
+            If True the Machine can create its chips when first used
         :return: A subclass of Machine with no chips in it
         :rtype: ~spinn_machine.Machine
         :raises SpinnMachineInvalidParameterException:
             If the size is unexpected
         """
         self.verify_size(width, height)
-        return self._create_machine(width or 0, height or 0, origin or "")
+        return self._create_machine(
+            width or 0, height or 0, origin or "", dense, lazy)
 
     @abstractmethod
-    def _create_machine(self, width: int, height: int, origin: str) -> Machine:
+    def _create_machine(self, width: int, height: int, origin: str,
+                        dense: bool, lazy: bool) -> Machine:
         """
         Create a new empty machine based on the width, height and version.
         The width and height will have been validated.
@@ -313,6 +320,10 @@ class AbstractVersion(object, metaclass=AbstractBase):
         :param origin: Extra information about how this machine was created
             to be used in the str method. Example "``Virtual``" or "``Json``"
         :type origin: str
+        :param bool dense:
+            If True the Machine holds its chips in a dense (x, y) array
+        :param bool lazy:
+            If True the Machine can create its chips when first used
         :return: A subclass of Machine with no Chips in it
         :rtype: ~spinn_machine.Machine
         """
@@ -64,8 +64,10 @@ class Version3(VersionSpin1):
             raise SpinnMachineException("Unexpected {height=}")
 
     @overrides(VersionSpin1._create_machine)
-    def _create_machine(self, width: int, height: int, origin: str) -> Machine:
-        return FullWrapMachine(width, height, CHIPS_PER_BOARD, origin)
+    def _create_machine(self, width: int, height: int, origin: str,
+                        dense: bool, lazy: bool) -> Machine:
+        return FullWrapMachine(
+            width, height, CHIPS_PER_BOARD, origin, dense, lazy)
 
     @overrides(VersionSpin1.illegal_ethernet_message)
     def illegal_ethernet_message(self, x: int, y: int) -> Optional[str]:
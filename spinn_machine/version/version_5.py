@@ -85,19 +85,22 @@ class Version5(VersionSpin1):
                 f"or a multiple of 12 plus 4")
 
     @overrides(VersionSpin1._create_machine)
-    def _create_machine(self, width: int, height: int, origin: str) -> Machine:
+    def _create_machine(self, width: int, height: int, origin: str,
+                        dense: bool, lazy: bool) -> Machine:
         if width % 12 == 0:
             if height % 12 == 0:
-                return FullWrapMachine(width, height, CHIPS_PER_BOARD, origin)
+                return FullWrapMachine(
+                    width, height, CHIPS_PER_BOARD, origin, dense, lazy)
             else:
                 return HorizontalWrapMachine(
-                    width, height, CHIPS_PER_BOARD, origin)
+                    width, height, CHIPS_PER_BOARD, origin, dense, lazy)
         else:
             if height % 12 == 0:
                 return VerticalWrapMachine(
-                    width, height, CHIPS_PER_BOARD, origin)
+                    width, height, CHIPS_PER_BOARD, origin, dense, lazy)
             else:
-                return NoWrapMachine(width, height, CHIPS_PER_BOARD, origin)
+                return NoWrapMachine(
+                    width, height, CHIPS_PER_BOARD, origin, dense, lazy)
 
     @overrides(VersionSpin1.illegal_ethernet_message)
     def illegal_ethernet_message(self, x: int, y: int) -> Optional[str]:
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from typing import Iterable, Tuple
+import numpy
+from numpy.typing import ArrayLike, NDArray
 from spinn_utilities.overrides import overrides
 from spinn_utilities.typing.coords import XY
 from .machine import Machine
@@ -46,24 +48,6 @@ class VerticalWrapMachine(Machine):
         for (x, y), n_cores in self._chip_core_map.items():
             yield ((x + ethernet_x), (y + ethernet_y) % self._height), n_cores
 
-    @overrides(Machine.get_existing_xys_by_ethernet)
-    def get_existing_xys_by_ethernet(
-            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
-        for (x, y) in self._chip_core_map:
-            chip_xy = ((x + ethernet_x),
-                       (y + ethernet_y) % self._height)
-            if chip_xy in self._chips:
-                yield chip_xy
-
-    @overrides(Machine.get_down_xys_by_ethernet)
-    def get_down_xys_by_ethernet(
-            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
-        for (x, y) in self._chip_core_map:
-            chip_xy = ((x + ethernet_x),
-                       (y + ethernet_y) % self._height)
-            if chip_xy not in self._chips:
-                yield chip_xy
-
     @overrides(Machine.xy_over_link)
     def xy_over_link(self, x: int, y: int, link: int) -> XY:
         add_x, add_y = Machine.LINK_ADD_TABLE[link]
@@ -146,6 +130,40 @@ class VerticalWrapMachine(Machine):
         else:
             return self._minimize_vector(x, y_down)
 
+    def _wrapped_vector_lengths(
+            self, sources: ArrayLike, destinations: ArrayLike) -> Tuple[
+                NDArray[numpy.integer], NDArray[numpy.integer],
+                NDArray[numpy.integer], NDArray[numpy.integer],
+                NDArray[numpy.integer]]:
+        """
+        Gets the two possible wrapped vectors and their lengths.
+
+        :return: len_up, len_down, x, y_up, y_down
+        """
+        x, y = self._vector_deltas(sources, destinations)
+        y_up = y % self._height
+        y_down = y_up - self._height
+        len_up = self._minimized_lengths(x, y_up)
+        len_down = self._minimized_lengths(x, y_down)
+        return len_up, len_down, x, y_up, y_down
+
+    @overrides(Machine.get_vector_lengths)
+    def get_vector_lengths(
+            self, sources: ArrayLike, destinations: ArrayLike
+            ) -> NDArray[numpy.integer]:
+        len_up, len_down, _, _, _ = self._wrapped_vector_lengths(
+            sources, destinations)
+        return numpy.minimum(len_up, len_down)
+
+    @overrides(Machine.get_vectors)
+    def get_vectors(
+            self, sources: ArrayLike, destinations: ArrayLike
+            ) -> NDArray[numpy.integer]:
+        len_up, len_down, x, y_up, y_down = \
+            self._wrapped_vector_lengths(sources, destinations)
+        return self._minimize_vectors(
+            x, numpy.where(len_up < len_down, y_up, y_down))
+
     @overrides(Machine.concentric_xys)
     def concentric_xys(self, radius: int, start: XY) -> Iterable[XY]:
         # Aliases for convenience
@@ -14,12 +14,13 @@
 
 from collections import defaultdict
 import logging
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from spinn_utilities.config_holder import get_config_str_or_none
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.typing.coords import XY
 from spinn_machine.data import MachineDataView
 from spinn_machine.ignores import IgnoreChip, IgnoreCore, IgnoreLink
+from .board_template import BoardTemplate
 from .chip import Chip
 from .router import Router
 from .link import Link
@@ -29,17 +30,24 @@ logger = FormatAdapter(logging.getLogger(__name__))
 
 
 def virtual_machine(
-        width: int, height: int, validate: bool = True):
+        width: int, height: int, validate: bool = True, dense: bool = False,
+        lazy: bool = False):
     """
     Create a virtual SpiNNaker machine, used for planning execution.
 
     :param int width: the width of the virtual machine in chips
     :param int height: the height of the virtual machine in chips
     :param bool validate: if True will call the machine validate function
+    :param bool dense:
+        if True the machine will hold its chips in a dense (x, y) array
+    :param bool lazy:
+        if True the machine will only create each non-Ethernet chip when it
+        is first used. As validation looks at every chip, this is best
+        combined with validate False.
     :returns: a virtual machine (that cannot execute code)
     :rtype: ~spinn_machine.Machine
     """
-    factory = _VirtualMachine(width, height, validate)
+    factory = _VirtualMachine(width, height, validate, dense, lazy)
     return factory.machine
 
 
@@ -53,7 +61,9 @@ class _VirtualMachine(object):
         "_unused_links",
         "_machine",
         "_with_monitors",
-        "_n_router_entries"
+        "_n_router_entries",
+        "_sdram",
+        "_template"
     )
 
     _4_chip_down_links = {
@@ -64,13 +74,14 @@ class _VirtualMachine(object):
     ORIGIN = "Virtual"
 
     def __init__(
-            self, width: int, height: int, validate: bool = True):
+            self, width: int, height: int, validate: bool = True,
+            dense: bool = False, lazy: bool = False):
         version = MachineDataView.get_machine_version()
         version.verify_size(height, width)
         max_cores = version.max_cores_per_chip
         self._n_router_entries = version.n_router_entries
         self._machine = version.create_machine(
-            width, height, origin=self.ORIGIN)
+            width, height, origin=self.ORIGIN, dense=dense, lazy=lazy)
 
         # Store the down items
         unused_chips = []
@@ -97,15 +108,19 @@ class _VirtualMachine(object):
             self._unused_links.update(_VirtualMachine._4_chip_down_links)
 
         ethernet_chips = version.get_potential_ethernet_chips(width, height)
+        self._sdram = version.max_sdram_per_chip
+        self._template = BoardTemplate.for_chip_core_map(
+            version.chip_core_map)
 
         # Compute list of chips that are possible based on configuration
         # If there are no wrap arounds, and the the size is not 2 * 2,
         # the possible chips depend on the 48 chip board's gaps
+        unused = set(unused_chips)
         configured_chips: Dict[XY, Tuple[XY, int]] = dict()
         for eth in ethernet_chips:
             for (xy, n_cores) in self._machine.get_xy_cores_by_ethernet(
                     *eth):
-                if xy not in unused_chips:
+                if xy not in unused:
                     configured_chips[xy] = (eth, min(n_cores, max_cores))
 
         # for chip in self._unreachable_outgoing_chips:
@@ -113,20 +128,43 @@ class _VirtualMachine(object):
         # for chip in self._unreachable_incoming_chips:
         #    configured_chips.remove(chip)
 
-        for xy in configured_chips:
-            if xy in ethernet_chips:
-                x, y = xy
-                new_chip = self._create_chip(
-                    xy, configured_chips, f"127.0.{x}.{y}")
-            else:
-                new_chip = self._create_chip(xy, configured_chips)
-            self._machine.add_chip(new_chip)
-
+        self._add_chips(configured_chips, ethernet_chips)
         self._machine.add_spinnaker_links()
         self._machine.add_fpga_links()
+
         if validate:
             self._machine.validate()
 
+    def _add_chips(self, configured_chips: Dict[XY, Tuple[XY, int]],
+                   ethernet_chips: Sequence[XY]):
+        """
+        Creates and adds a chip for each of the configured chips.
+
+        The chips are created a board at a time so that the links within
+        the board can be taken from the board template.
+        """
+        add_chip = self._machine.add_chip
+        for eth in ethernet_chips:
+            board_xys = self._template.board_xys(self._machine, *eth)
+            for index, xy in enumerate(board_xys):
+                configured = configured_chips.get(xy)
+                if configured is None or configured[0] != eth:
+                    continue
+                destinations = self._template.link_destinations(
+                    self._machine, board_xys, index)
+                if xy == eth:
+                    x, y = xy
+                    new_chip = self._create_chip(
+                        xy, configured_chips, destinations,
+                        f"127.0.{x}.{y}")
+                elif self._machine.is_lazy:
+                    self._add_lazy_chip(xy, configured_chips, destinations)
+                    continue
+                else:
+                    new_chip = self._create_chip(
+                        xy, configured_chips, destinations)
+                add_chip(new_chip)
+
     @property
     def machine(self) -> Machine:
         """
@@ -137,30 +175,47 @@ class _VirtualMachine(object):
         return self._machine
 
     def _create_chip(self, xy: XY, configured_chips: Dict[XY, Tuple[XY, int]],
+                     destinations: List[XY],
                      ip_address: Optional[str] = None) -> Chip:
-        chip_links = self._calculate_links(xy, configured_chips)
+        chip_links = self._calculate_links(
+            xy, configured_chips, destinations)
         chip_router = Router(chip_links, self._n_router_entries)
 
         ((eth_x, eth_y), n_cores) = configured_chips[xy]
 
         down_cores = self._unused_cores.get(xy, None)
         x, y = xy
-        sdram = MachineDataView.get_machine_version().max_sdram_per_chip
         return Chip(
-            x, y, n_cores, chip_router, sdram, eth_x, eth_y,
+            x, y, n_cores, chip_router, self._sdram, eth_x, eth_y,
             ip_address, down_cores=down_cores)
 
+    def _add_lazy_chip(
+            self, xy: XY, configured_chips: Dict[XY, Tuple[XY, int]],
+            destinations: List[XY]):
+        x, y = xy
+        link_mask = 0
+        for link_id, link_x_y in enumerate(destinations):
+            if (x, y, link_id) not in self._unused_links:
+                if link_x_y in configured_chips:
+                    link_mask |= 1 << link_id
+        ((eth_x, eth_y), n_cores) = configured_chips[xy]
+        self._machine.add_lazy_chip(
+            x, y, n_cores, link_mask, eth_x, eth_y, self._sdram,
+            self._n_router_entries,
+            down_cores=self._unused_cores.get(xy, None))
+
     def _calculate_links(
-            self, xy: XY, configured_chips: Dict[XY, Tuple[XY, int]]
-            ) -> List[Link]:
+            self, xy: XY, configured_chips: Dict[XY, Tuple[XY, int]],
+            destinations: List[XY]) -> List[Link]:
         """
         Calculate the links needed for a machine structure
+
+        :param destinations: The (x, y) reached over each link ID
         """
         x, y = xy
         links = list()
-        for link_id in range(6):
+        for link_id, link_x_y in enumerate(destinations):
             if (x, y, link_id) not in self._unused_links:
-                link_x_y = self._machine.xy_over_link(x, y, link_id)
                 if link_x_y in configured_chips:
                     links.append(
                         Link(source_x=x, source_y=y,
@@ -0,0 +1,111 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import Chip, Router, virtual_machine
+from spinn_machine.config_setup import unittest_setup
+
+
+class TestBoardIndex(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def _check_boards(self, machine):
+        for ethernet in machine.ethernet_connected_chips:
+            eth_x, eth_y = ethernet.x, ethernet.y
+            potential = list(machine.get_xys_by_ethernet(eth_x, eth_y))
+            existing = [xy for xy in potential if xy in machine]
+            self.assertEqual(
+                set(existing),
+                set(machine.get_existing_xys_by_ethernet(eth_x, eth_y)))
+            self.assertEqual(
+                set(potential) - set(existing),
+                set(machine.get_down_xys_by_ethernet(eth_x, eth_y)))
+            chips = [machine[xy] for xy in existing]
+            self.assertEqual(
+                len(chips), machine.get_n_chips_by_ethernet(eth_x, eth_y))
+            self.assertEqual(
+                sum(chip.n_processors for chip in chips),
+                machine.get_cores_count_by_ethernet(eth_x, eth_y))
+            self.assertEqual(
+                sum(chip.sdram for chip in chips),
+                machine.get_sdram_by_ethernet(eth_x, eth_y))
+
+    def test_virtual(self):
+        set_config("Machine", "down_chips", "1,1:7,7:8,1:8,10:1,8")
+        set_config("Machine", "down_cores", "3,3,4-6")
+        for kwargs in [{}, {"dense": True}, {"lazy": True}]:
+            machine = virtual_machine(12, 12, **kwargs)
+            self._check_boards(machine)
+            self.assertEqual(
+                46, machine.get_n_chips_by_ethernet(0, 0))
+            self.assertEqual(
+                {(1, 1), (7, 7)},
+                set(machine.get_down_xys_by_ethernet(0, 0)))
+
+    def test_remove_chip(self):
+        machine = virtual_machine(12, 12)
+        n_cores = machine.get_cores_count_by_ethernet(4, 8)
+        chip = machine.remove_chip(5, 9)
+        self.assertEqual(47, machine.get_n_chips_by_ethernet(4, 8))
+        self.assertEqual(n_cores - chip.n_processors,
+                         machine.get_cores_count_by_ethernet(4, 8))
+        self.assertEqual([(5, 9)], list(
+            machine.get_down_xys_by_ethernet(4, 8)))
+        self._check_boards(machine)
+
+    def test_remove_while_iterating(self):
+        machine = virtual_machine(8, 8)
+        for x, y in machine.get_existing_xys_by_ethernet(0, 0):
+            if (x, y) != (0, 0):
+                machine.remove_chip(x, y)
+        self.assertEqual([(0, 0)], list(
+            machine.get_existing_xys_by_ethernet(0, 0)))
+        down = machine.get_down_xys_by_ethernet(0, 0)
+        self.assertEqual(47, len(down))
+        for x, y in down:
+            self.assertNotIn((x, y), machine)
+        # What is returned is a copy, so changing it does not change the
+        # machine
+        self.assertIsInstance(down, tuple)
+        self.assertEqual(47, len(machine.get_down_xys_by_ethernet(0, 0)))
+        self._check_boards(machine)
+
+    def test_unknown_board(self):
+        machine = virtual_machine(8, 8)
+        self.assertEqual([], list(machine.get_existing_xys_by_ethernet(8, 0)))
+        self.assertEqual(48, len(list(
+            machine.get_down_xys_by_ethernet(8, 0))))
+        self.assertEqual(0, machine.get_n_chips_by_ethernet(8, 0))
+        self.assertEqual(0, machine.get_sdram_by_ethernet(8, 0))
+
+    def test_unused_xy(self):
+        set_config("Machine", "down_chips", "2,0")
+        machine = virtual_machine(8, 8)
+        # Down chips on a board are not unused
+        self.assertEqual((0, 4), machine.get_unused_xy())
+        self.assertEqual((0, 4), machine.get_unused_xy())
+        chip = machine[1, 0]
+        machine.add_chip(Chip(
+            0, 4, 18, Router([], 1000), chip.sdram, 0, 0))
+        self.assertEqual((0, 5), machine.get_unused_xy())
+        machine.remove_chip(0, 4)
+        self.assertEqual((0, 4), machine.get_unused_xy())
+
+
+if __name__ == '__main__':
+    unittest.main()
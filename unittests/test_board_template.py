@@ -0,0 +1,101 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import virtual_machine
+from spinn_machine.board_template import BoardTemplate
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.data import MachineDataView
+from spinn_machine.data.machine_data_writer import MachineDataWriter
+from spinn_machine.json_machine import machine_from_json, to_json
+
+
+class TestBoardTemplate(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def test_template(self):
+        chip_core_map = MachineDataView.get_machine_version().chip_core_map
+        template = BoardTemplate.for_chip_core_map(chip_core_map)
+        self.assertIs(template, BoardTemplate.for_chip_core_map(
+            dict(chip_core_map)))
+        self.assertEqual(48, len(template))
+        self.assertEqual(list(chip_core_map), template.local_xys)
+        self.assertEqual(list(chip_core_map.values()), template.n_cores)
+        self.assertEqual(0, template.local_index(0, 0))
+        self.assertIsNone(template.local_index(7, 0))
+
+    def test_link_destinations(self):
+        for width, height in [(12, 12), (12, 16), (16, 12), (16, 16)]:
+            machine = virtual_machine(width, height)
+            template = BoardTemplate.for_chip_core_map(
+                MachineDataView.get_machine_version().chip_core_map)
+            for eth in machine.ethernet_connected_chips:
+                board_xys = template.board_xys(machine, eth.x, eth.y)
+                for index, (x, y) in enumerate(board_xys):
+                    self.assertEqual(
+                        [machine.xy_over_link(x, y, link_id)
+                         for link_id in range(6)],
+                        template.link_destinations(machine, board_xys, index))
+
+    def _check_links(self, machine):
+        for chip in machine.chips:
+            for link_id in range(6):
+                link = chip.router.get_link(link_id)
+                xy = machine.xy_over_link(chip.x, chip.y, link_id)
+                if link is None:
+                    self.assertNotIn(xy, machine)
+                else:
+                    self.assertEqual(
+                        xy, (link.destination_x, link.destination_y))
+
+    def test_virtual_machine_links(self):
+        for width, height in [(8, 8), (12, 12), (12, 16), (16, 12),
+                              (16, 16)]:
+            self._check_links(virtual_machine(width, height))
+
+    def test_4_chip_links(self):
+        set_config("Machine", "version", 2)
+        machine = virtual_machine(2, 2)
+        self.assertEqual(4, machine.n_chips)
+        self.assertEqual(16, sum(len(chip.router) for chip in machine.chips))
+
+    def test_down_links_and_chips(self):
+        set_config("Machine", "down_links", "3,3,0:7,7,1")
+        set_config("Machine", "down_chips", "4,4")
+        machine = virtual_machine(12, 12)
+        self.assertFalse(machine.is_link_at(3, 3, 0))
+        self.assertFalse(machine.is_link_at(7, 7, 1))
+        self.assertFalse(machine.is_link_at(3, 3, 1))
+        self.assertTrue(machine.is_link_at(3, 3, 2))
+
+    def test_json_round_trip(self):
+        set_config("Machine", "down_links", "3,3,0:11,11,1")
+        machine = virtual_machine(12, 12)
+        MachineDataWriter.mock().set_machine(machine)
+        json_machine = machine_from_json(to_json())
+        for chip in machine.chips:
+            other = json_machine[chip.x, chip.y]
+            self.assertEqual(
+                [(link.source_link_id, link.destination_x,
+                  link.destination_y) for link in chip.router.links],
+                [(link.source_link_id, link.destination_x,
+                  link.destination_y) for link in other.router.links])
+
+
+if __name__ == '__main__':
+    unittest.main()
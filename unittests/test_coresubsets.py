@@ -99,3 +99,61 @@ def test_values():
     css = CoreSubsets([cs1, cs2, cs3, cs4, cs5])
 
     assert len(css.values()) == 2
+
+
+def test_len():
+    unittest_setup()
+    css = CoreSubsets([CoreSubset(0, 0, [1, 2]), CoreSubset(1, 0, [])])
+    assert len(css) == 2
+    assert css.n_chips == 1
+    css.add_processor(0, 0, 2)
+    assert len(css) == 2
+    css.add_core_subset(CoreSubset(0, 0, [2, 3, 4]))
+    assert len(css) == 4
+    css.add_core_subsets([CoreSubset(2, 2, [1, 1]), CoreSubset(0, 0, [5])])
+    assert len(css) == 6
+    assert css.get_n_cores_for_chip(0, 0) == 5
+    assert css.get_n_cores_for_chip(2, 2) == 1
+    assert css.get_n_cores_for_chip(3, 3) == 0
+    assert css.n_chips == 2
+    other = CoreSubsets([CoreSubset(0, 0, [4, 5, 6]), CoreSubset(2, 2, [2])])
+    css2 = css.intersect(other)
+    assert len(css2) == 2
+    assert css2.n_chips == 1
+    assert len(css2) == sum(len(subset) for subset in css2)
+    # Subsets got from the group can be added to directly
+    css.get_core_subset_for_chip(2, 2).add_processor(3)
+    css[0, 0].add_processor(9)
+    assert len(css) == 8
+
+
+def test_from_xyp_arrays():
+    unittest_setup()
+    xs = [1, 0, 1, 0, 1, 2]
+    ys = [0, 0, 0, 0, 0, 1]
+    ps = [3, 1, 2, 1, 3, 7]
+    css = CoreSubsets.from_xyp_arrays(xs, ys, ps)
+    expected = CoreSubsets()
+    for x, y, p in zip(xs, ys, ps):
+        expected.add_processor(x, y, p)
+    assert len(css) == len(expected) == 4
+    assert repr(css) == repr(expected) == "(1, 0)(0, 0)(2, 1)"
+    assert list(css) == list(expected)
+    assert list(css[1, 0].processor_ids) == [3, 2]
+    assert len(CoreSubsets.from_xyp_arrays([], [], [])) == 0
+    # Coordinates that do not fit in 32 bits are still different chips
+    css = CoreSubsets.from_xyp_arrays(
+        [0, 1, 0, 2 ** 33], [-1, -2 ** 32 - 1, 2, 0], [1, 2, 3, 4])
+    assert list(css.core_subsets) == [
+        CoreSubset(0, -1, [1]), CoreSubset(1, -2 ** 32 - 1, [2]),
+        CoreSubset(0, 2, [3]), CoreSubset(2 ** 33, 0, [4])]
+
+
+def test_from_chip_cores_map():
+    unittest_setup()
+    css = CoreSubsets.from_chip_cores_map(
+        {(0, 0): range(1, 18), (1, 0): [], (2, 0): [4, 4, 5]})
+    assert len(css) == 19
+    assert css.n_chips == 2
+    assert not css.is_chip(1, 0)
+    assert list(css[2, 0].processor_ids) == [4, 5]
@@ -0,0 +1,141 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import unittest
+from spinn_machine import CoreSubset, CoreSubsets, CoreSubsetsBitmap
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
+
+
+class TestCoreSubsetsBitmap(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    @staticmethod
+    def _xyps(core_subsets):
+        return {(subset.x, subset.y, p) for subset in core_subsets
+                for p in subset.processor_ids}
+
+    def _random(self, rand, max_core):
+        core_subsets = CoreSubsets()
+        for _ in range(rand.randint(0, 60)):
+            core_subsets.add_processor(
+                rand.randint(0, 5), rand.randint(0, 5),
+                rand.randint(0, max_core))
+        return core_subsets
+
+    def test_conversion(self):
+        core_subsets = CoreSubsets([
+            CoreSubset(1, 0, [3, 1, 2]), CoreSubset(0, 2, [17]),
+            CoreSubset(300, 7, [0, 100])])
+        bitmap = CoreSubsetsBitmap.from_core_subsets(core_subsets)
+        self.assertEqual(6, len(bitmap))
+        self.assertEqual(3, bitmap.n_chips)
+        self.assertEqual([(0, 2), (1, 0), (300, 7)],
+                         list(bitmap.chip_coordinates))
+        self.assertEqual([1, 3, 2], bitmap.chip_counts().tolist())
+        self.assertEqual([CoreSubset(0, 2, [17]), CoreSubset(1, 0, [1, 2, 3]),
+                          CoreSubset(300, 7, [0, 100])], list(bitmap))
+        back = bitmap.to_core_subsets()
+        self.assertIsInstance(back, CoreSubsets)
+        self.assertEqual(self._xyps(core_subsets), self._xyps(back))
+        xs, ys, ps = bitmap.to_xyp_arrays()
+        self.assertEqual([0, 1, 1, 1, 300, 300], xs.tolist())
+        self.assertEqual([2, 0, 0, 0, 7, 7], ys.tolist())
+        self.assertEqual([17, 1, 2, 3, 0, 100], ps.tolist())
+
+    def test_contains(self):
+        bitmap = CoreSubsetsBitmap.from_xyp_arrays(
+            [0, 0, 2], [1, 1, 3], [1, 70, 5])
+        self.assertIn((0, 1), bitmap)
+        self.assertIn((0, 1, 70), bitmap)
+        self.assertIn((2, 3, 5), bitmap)
+        self.assertNotIn((0, 1, 2), bitmap)
+        self.assertNotIn((0, 1, 200), bitmap)
+        self.assertNotIn((1, 0), bitmap)
+        self.assertNotIn((3, 3, 5), bitmap)
+        self.assertEqual(
+            [True, True, False, False, False, True],
+            bitmap.contains_cores(
+                [0, 0, 0, 1, 0, 2], [1, 1, 1, 0, 1, 3],
+                [1, 70, 2, 1, 500, 5]).tolist())
+        self.assertEqual(
+            [False], CoreSubsetsBitmap.empty().contains_cores(
+                [0], [0], [0]).tolist())
+
+    def test_empty(self):
+        empty = CoreSubsetsBitmap.from_xyp_arrays([], [], [])
+        self.assertEqual(0, len(empty))
+        self.assertEqual([], list(empty))
+        self.assertEqual(empty, CoreSubsetsBitmap.from_core_subsets([]))
+        self.assertNotIn((0, 0), empty)
+        with self.assertRaises(ValueError):
+            CoreSubsetsBitmap.from_xyp_arrays([0], [0], [-1])
+
+    def test_bad_coordinates(self):
+        for xs, ys in [([0, 1], [-1, 0]), ([-1, 0], [0, 0]),
+                       ([0, 1], [0, 1 << 32]), ([1 << 31, 0], [0, 0])]:
+            with self.assertRaises(SpinnMachineInvalidParameterException):
+                CoreSubsetsBitmap.from_xyp_arrays(xs, ys, [1, 2])
+        bitmap = CoreSubsetsBitmap.from_xyp_arrays(
+            [0, 1], [(1 << 31) - 1, 0], [1, 2])
+        self.assertEqual([(0, (1 << 31) - 1), (1, 0)],
+                         list(bitmap.chip_coordinates))
+        # Negative y must not borrow from x when looking up
+        self.assertNotIn((1, -1), bitmap)
+        self.assertNotIn((1, -1, 1), bitmap)
+        self.assertNotIn((-1, 0), bitmap)
+        self.assertEqual(
+            [False, False, True],
+            bitmap.contains_cores([1, -1, 1], [-1, 0, 0], [1, 2, 2]).tolist())
+
+    def test_set_algebra(self):
+        rand = random.Random(42)
+        for _ in range(100):
+            first = self._random(rand, 20)
+            second = self._random(rand, rand.choice([17, 150]))
+            a_xyps = self._xyps(first)
+            b_xyps = self._xyps(second)
+            a_bits = CoreSubsetsBitmap.from_core_subsets(first)
+            b_bits = CoreSubsetsBitmap.from_core_subsets(second)
+            for result, expected in [
+                    (a_bits | b_bits, a_xyps | b_xyps),
+                    (a_bits & b_bits, a_xyps & b_xyps),
+                    (a_bits - b_bits, a_xyps - b_xyps),
+                    (b_bits - a_bits, b_xyps - a_xyps)]:
+                self.assertEqual(expected, self._xyps(result))
+                self.assertEqual(len(expected), len(result))
+                self.assertEqual(
+                    {(x, y) for x, y, _ in expected},
+                    set(result.chip_coordinates))
+            self.assertEqual(
+                self._xyps(first.intersect(second)),
+                self._xyps(a_bits.intersect(b_bits)))
+
+    def test_eq_hash(self):
+        narrow = CoreSubsetsBitmap.from_xyp_arrays([0, 1], [0, 0], [1, 2])
+        wide = CoreSubsetsBitmap.from_xyp_arrays(
+            [0, 1, 1], [0, 0, 0], [1, 2, 100])
+        # Taking away the high core leaves an unused word
+        trimmed = wide - CoreSubsetsBitmap.from_xyp_arrays([1], [0], [100])
+        self.assertEqual(narrow, trimmed)
+        self.assertEqual(hash(narrow), hash(trimmed))
+        self.assertNotEqual(narrow, wide)
+        self.assertNotEqual(narrow, CoreSubsets())
+
+
+if __name__ == '__main__':
+    unittest.main()
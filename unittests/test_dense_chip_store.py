@@ -0,0 +1,123 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import Chip, Router, virtual_machine
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.dense_chip_store import DenseChipStore
+from spinn_machine.exceptions import SpinnMachineAlreadyExistsException
+
+
+class TestDenseChipStore(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def _chip(self, x, y):
+        return Chip(x, y, 18, Router([], 1023), 100, 0, 0)
+
+    def test_mapping(self):
+        store = DenseChipStore(4, 3)
+        self.assertEqual(0, len(store))
+        chip = self._chip(2, 1)
+        store[chip] = chip
+        self.assertEqual(1, len(store))
+        self.assertIn((2, 1), store)
+        self.assertNotIn((1, 2), store)
+        self.assertNotIn("bacon", store)
+        self.assertEqual(chip, store[2, 1])
+        self.assertEqual(chip, store.chip_at(2, 1))
+        self.assertIsNone(store.chip_at(1, 2))
+        self.assertIsNone(store.get((1, 2)))
+        self.assertTrue(store.has_chip(2, 1))
+        self.assertFalse(store.has_chip(1, 2))
+        self.assertEqual(6, store.slot(2, 1))
+        self.assertEqual(-1, store.slot(4, 1))
+        self.assertEqual(1, store.existence_bitmap[6])
+        with self.assertRaises(KeyError):
+            store[1, 2]
+        del store[2, 1]
+        self.assertEqual(0, len(store))
+        self.assertFalse(store.has_chip(2, 1))
+        with self.assertRaises(KeyError):
+            del store[2, 1]
+
+    def test_overflow(self):
+        store = DenseChipStore(4, 3)
+        inside = self._chip(0, 0)
+        outside = self._chip(-1, 7)
+        store[inside] = inside
+        store[outside] = outside
+        self.assertEqual(2, len(store))
+        self.assertIn((-1, 7), store)
+        self.assertEqual(outside, store.chip_at(-1, 7))
+        self.assertEqual([(0, 0), (-1, 7)], list(store))
+        self.assertEqual([inside, outside], list(store.values()))
+        self.assertEqual([((0, 0), inside), ((-1, 7), outside)],
+                         list(store.items()))
+
+    def _compare(self, width, height):
+        plain = virtual_machine(width, height)
+        dense = virtual_machine(width, height, dense=True)
+        self.assertFalse(plain.is_dense)
+        self.assertTrue(dense.is_dense)
+        self.assertEqual(plain.wrap, dense.wrap)
+        self.assertEqual(plain.n_chips, dense.n_chips)
+        self.assertEqual(set(plain.chip_coordinates),
+                         set(dense.chip_coordinates))
+        self.assertEqual(plain.get_cores_count(), dense.get_cores_count())
+        self.assertEqual(plain.get_links_count(), dense.get_links_count())
+        for x in range(-1, width + 1):
+            for y in range(-1, height + 1):
+                self.assertEqual(
+                    plain.is_chip_at(x, y), dense.is_chip_at(x, y))
+                self.assertEqual((x, y) in plain, (x, y) in dense)
+                self.assertEqual(
+                    plain.get_chip_at(x, y), dense.get_chip_at(x, y))
+                for link in range(6):
+                    self.assertEqual(plain.is_link_at(x, y, link),
+                                     dense.is_link_at(x, y, link))
+        for ethernet in plain.ethernet_connected_chips:
+            self.assertEqual(
+                list(plain.get_existing_xys_by_ethernet(*ethernet)),
+                list(dense.get_existing_xys_by_ethernet(*ethernet)))
+            self.assertEqual(
+                list(plain.get_down_xys_by_ethernet(*ethernet)),
+                list(dense.get_down_xys_by_ethernet(*ethernet)))
+        self.assertEqual(
+            sorted(plain.one_way_links()), sorted(dense.one_way_links()))
+        self.assertEqual(plain.get_unused_xy(), dense.get_unused_xy())
+
+    def test_full_wrap(self):
+        self._compare(12, 12)
+
+    def test_horizontal_wrap(self):
+        self._compare(12, 16)
+
+    def test_vertical_wrap(self):
+        self._compare(16, 12)
+
+    def test_no_wrap(self):
+        self._compare(16, 16)
+
+    def test_add_existing_chip(self):
+        machine = virtual_machine(8, 8, dense=True)
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            machine.add_chip(self._chip(2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+import numpy
+from spinn_utilities.config_holder import set_config
+from spinn_machine import virtual_machine
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.distance_matrix import clear_distance_matrix_cache
+
+
+class TestDistanceMatrix(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+        clear_distance_matrix_cache()
+
+    def _check(self, width, height):
+        machine = virtual_machine(width, height, validate=False)
+        matrix = machine.distance_matrix()
+        xys = machine.distance_matrix_xys()
+        self.assertEqual((width * height, width * height), matrix.shape)
+        self.assertEqual((width * height, 2), xys.shape)
+        for i, source in enumerate(xys):
+            for j, target in enumerate(xys):
+                self.assertEqual(
+                    machine.get_vector_length(tuple(source), tuple(target)),
+                    matrix[i, j])
+
+    def test_full_wrap(self):
+        self._check(12, 12)
+
+    def test_horizontal_wrap(self):
+        self._check(12, 16)
+
+    def test_vertical_wrap(self):
+        self._check(16, 12)
+
+    def test_no_wrap(self):
+        self._check(16, 16)
+
+    def test_existing_only(self):
+        machine = virtual_machine(8, 8)
+        matrix = machine.distance_matrix(existing_only=True)
+        xys = machine.distance_matrix_xys(existing_only=True)
+        self.assertEqual((48, 48), matrix.shape)
+        self.assertEqual(
+            set(machine.chip_coordinates), set(map(tuple, xys)))
+        for i, source in enumerate(xys):
+            for j, target in enumerate(xys):
+                self.assertEqual(
+                    machine.get_vector_length(tuple(source), tuple(target)),
+                    matrix[i, j])
+
+    def test_memoised(self):
+        machine = virtual_machine(12, 12)
+        matrix = machine.distance_matrix()
+        other = virtual_machine(12, 12, validate=False)
+        self.assertIs(matrix, other.distance_matrix())
+        with self.assertRaises(ValueError):
+            matrix[0, 1] = 99
+        self.assertEqual(1, other.distance_matrix()[0, 1])
+
+    def test_cache_dir(self):
+        machine = virtual_machine(12, 24)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            matrix = machine.distance_matrix(cache_dir=cache_dir)
+            files = os.listdir(cache_dir)
+            self.assertEqual(1, len(files))
+            self.assertTrue(files[0].endswith(".npy"))
+            clear_distance_matrix_cache()
+            reloaded = machine.distance_matrix(cache_dir=cache_dir)
+            self.assertIsInstance(reloaded, numpy.memmap)
+            self.assertTrue(numpy.array_equal(matrix, reloaded))
+            del matrix, reloaded
+            clear_distance_matrix_cache()
+
+    def test_cache_dir_after_memo(self):
+        machine = virtual_machine(12, 12)
+        clear_distance_matrix_cache()
+        matrix = machine.distance_matrix()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.assertIs(
+                matrix, machine.distance_matrix(cache_dir=cache_dir))
+            files = os.listdir(cache_dir)
+            self.assertEqual(1, len(files))
+            clear_distance_matrix_cache()
+            reloaded = machine.distance_matrix(cache_dir=cache_dir)
+            self.assertIsInstance(reloaded, numpy.memmap)
+            self.assertTrue(numpy.array_equal(matrix, reloaded))
+            del reloaded
+            clear_distance_matrix_cache()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+import numpy
+from spinn_machine import (
+    FrozenMulticastRoutingTable, MulticastRoutingEntry, MulticastRoutingTable)
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.exceptions import SpinnMachineException
+
+
+def _table():
+    return MulticastRoutingTable(3, 4, [
+        MulticastRoutingEntry(
+            0x100, 0xFFFFFF00, spinnaker_route=11306, defaultable=True),
+        MulticastRoutingEntry(0x200, 0xFFFFFF00, spinnaker_route=1),
+        MulticastRoutingEntry(0, 0, spinnaker_route=1 << 23)])
+
+
+class TestFrozenMulticastRoutingTable(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_to_bytes(self):
+        data = _table().to_bytes()
+        self.assertEqual(36, len(data))
+        self.assertEqual(
+            (0x100, 0xFFFFFF00, 11306), struct.unpack_from("<III", data))
+        self.assertEqual(
+            (0, 0, 1 << 23), struct.unpack_from("<III", data, 24))
+        self.assertEqual(b"", MulticastRoutingTable(0, 0).to_bytes())
+
+    def test_read_back(self):
+        table = _table()
+        data = table.to_bytes()
+        frozen = FrozenMulticastRoutingTable(3, 4, data)
+        self.assertEqual((3, 4), (frozen.x, frozen.y))
+        self.assertIs(data, frozen.data)
+        self.assertEqual(3, len(frozen))
+        self.assertEqual(3, frozen.number_of_entries)
+        self.assertEqual(0, frozen.number_of_defaultable_entries)
+        for array, original in zip(frozen.arrays, table.arrays):
+            self.assertEqual(original.tolist(), array.tolist())
+            self.assertFalse(array.flags.writeable)
+        self.assertEqual(data, frozen.to_bytes())
+        self.assertEqual([0, 1, 2], frozen.lookup([0x1FF, 0x2AA, 5]).tolist())
+        self.assertEqual(frozenset([4, 5, 7]),
+                         frozen.get_entry_for_key(0x123).processor_ids)
+        self.assertEqual(1 << 23, frozen.get_entry_for_key(5).spinnaker_route)
+        self.assertEqual(
+            1, frozen.get_entry_by_key_mask(0x200, 0xFFFFFF00).spinnaker_route)
+        self.assertIsNone(frozen.get_entry_by_key_mask(0x300, 0xFFFFFF00))
+        self.assertEqual(
+            [entry.spinnaker_route for entry in table],
+            [entry.spinnaker_route for entry in frozen])
+        self.assertEqual([(0, 2), (1, 2)], frozen.find_conflicts())
+
+    def test_no_copy(self):
+        data = _table().to_bytes()
+        frozen = FrozenMulticastRoutingTable(0, 0, memoryview(data)[12:])
+        self.assertEqual(2, len(frozen))
+        self.assertTrue(numpy.shares_memory(
+            frozen.arrays[0], numpy.frombuffer(data, numpy.uint8)))
+        with self.assertRaises(ValueError):
+            frozen.arrays[2][0] = 1
+
+    def test_writable(self):
+        data = bytearray(_table().to_bytes())
+        with self.assertRaises(SpinnMachineException):
+            FrozenMulticastRoutingTable(0, 0, data)
+        with self.assertRaises(SpinnMachineException):
+            FrozenMulticastRoutingTable(0, 0, memoryview(data))
+        frozen = FrozenMulticastRoutingTable(0, 0, bytes(data))
+        data[1] = 5
+        self.assertEqual(0x100, frozen.arrays[0][0])
+
+    def test_immutable(self):
+        frozen = FrozenMulticastRoutingTable(0, 0, _table().to_bytes())
+        entry = MulticastRoutingEntry(0x400, 0xFFFFFF00, spinnaker_route=1)
+        with self.assertRaises(RuntimeError):
+            frozen.add_multicast_routing_entry(entry)
+        with self.assertRaises(RuntimeError):
+            frozen.add_multicast_routing_entries([entry])
+
+    def test_bad_length(self):
+        with self.assertRaises(SpinnMachineException):
+            FrozenMulticastRoutingTable(0, 0, bytes(13))
+        self.assertEqual(0, len(FrozenMulticastRoutingTable(0, 0, b"")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
 import unittest
-from spinn_machine import FrozenCoreSubsets, CoreSubset
+from spinn_machine import CoreSubsets, FrozenCoreSubsets, CoreSubset
 from spinn_machine.config_setup import unittest_setup
+from spinn_machine.frozen_core_subsets import _interned
 
 
 class TestFrozenCoreSubsets(unittest.TestCase):
@@ -37,3 +39,65 @@ class TestFrozenCoreSubsets(unittest.TestCase):
             css.add_core_subsets([cs4, cs5])
         with self.assertRaises(RuntimeError):
             css.add_processor(1, 2, 3)
+
+    def test_queries(self):
+        unittest_setup()
+        css = FrozenCoreSubsets([
+            CoreSubset(1, 0, [3, 1]), CoreSubset(0, 0, []),
+            CoreSubset(1, 0, [1, 2])])
+        self.assertEqual(3, len(css))
+        self.assertEqual(1, css.n_chips)
+        self.assertTrue(css.is_chip(1, 0))
+        self.assertFalse(css.is_chip(0, 0))
+        self.assertTrue(css.is_core(1, 0, 2))
+        self.assertFalse(css.is_core(1, 0, 4))
+        self.assertEqual([3, 1, 2], list(css[1, 0].processor_ids))
+        self.assertEqual(3, css.get_n_cores_for_chip(1, 0))
+        self.assertEqual(0, len(css.get_core_subset_for_chip(2, 2)))
+        self.assertEqual([CoreSubset(1, 0, [1, 2, 3])], list(css))
+        # Changing a subset got out does not change the frozen one
+        css[1, 0].add_processor(7)
+        self.assertFalse(css.is_core(1, 0, 7))
+        other = CoreSubsets([CoreSubset(1, 0, [2, 3, 4])])
+        self.assertEqual(2, len(css.intersect(other)))
+        # The subsets the inherited methods use are only made once
+        self.assertIs(css._core_subsets, css._core_subsets)
+        frozen = FrozenCoreSubsets.from_xyp_arrays(
+            [1, 1, 1, 1], [0, 0, 0, 0], [2, 1, 3, 1])
+        self.assertIsInstance(frozen, FrozenCoreSubsets)
+        self.assertEqual([2, 1, 3], list(frozen[1, 0].processor_ids))
+        self.assertEqual(0, FrozenCoreSubsets.from_chip_cores_map(
+            {(1, 1): []}).n_chips)
+
+    def test_hash(self):
+        unittest_setup()
+        css1 = FrozenCoreSubsets([
+            CoreSubset(0, 0, [1, 2]), CoreSubset(1, 0, [0])])
+        css2 = FrozenCoreSubsets([
+            CoreSubset(1, 0, [0]), CoreSubset(0, 0, [2, 1])])
+        css3 = FrozenCoreSubsets([CoreSubset(0, 0, [1, 2])])
+        self.assertEqual(css1, css2)
+        self.assertEqual(hash(css1), hash(css2))
+        self.assertNotEqual(css1, css3)
+        self.assertEqual(2, len({css1, css2, css3}))
+        self.assertNotEqual(css3, CoreSubsets([CoreSubset(0, 0, [1, 2])]))
+
+    def test_interned(self):
+        unittest_setup()
+        monitors = [CoreSubset(x, y, [0]) for x in range(4) for y in range(4)]
+        first = FrozenCoreSubsets.interned(monitors)
+        second = FrozenCoreSubsets.interned(reversed(monitors))
+        self.assertIs(first, second)
+        self.assertIs(first, FrozenCoreSubsets.interned(
+            FrozenCoreSubsets(monitors)))
+        other = FrozenCoreSubsets.interned(monitors[1:])
+        self.assertIsNot(first, other)
+        # Once no longer used the instance is dropped
+        key = first._key()
+        self.assertIn(key, _interned)
+        del first, second
+        gc.collect()
+        self.assertNotIn(key, _interned)
+        third = FrozenCoreSubsets(monitors)
+        self.assertIs(third, FrozenCoreSubsets.interned(third))
+        self.assertIs(third, FrozenCoreSubsets.interned(monitors))
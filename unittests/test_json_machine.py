@@ -12,13 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+import json
 from tempfile import mktemp
 import unittest
+from unittest import mock
 from spinn_utilities.config_holder import set_config
 from spinn_machine import virtual_machine
 from spinn_machine.data.machine_data_writer import MachineDataWriter
 from spinn_machine.config_setup import unittest_setup
-from spinn_machine.json_machine import (machine_from_json, to_json_path)
+from spinn_machine.json_machine import (
+    machine_from_json, machine_from_json_stream, to_json, to_json_path)
 
 
 class TestJsonMachine(unittest.TestCase):
@@ -89,6 +93,71 @@ class TestJsonMachine(unittest.TestCase):
         vchip48 = jm[4, 8]
         self.assertEqual(vchip48.tag_ids, chip48.tag_ids)
 
+    def _compare(self, vm, jm):
+        self.assertEqual(
+            str(vm).replace("Virtual", ""), str(jm).replace("Json", ""))
+        for vchip in vm.chips:
+            jchip = jm[vchip.x, vchip.y]
+            self.assertEqual(str(vchip), str(jchip))
+            self.assertEqual(vchip.sdram, jchip.sdram)
+            self.assertEqual(
+                repr(list(vchip.router.links)),
+                repr(list(jchip.router.links)))
+
+    def test_stream(self):
+        set_config("Machine", "down_links", "3,3,0:5,5,2")
+        vm = virtual_machine(width=12, height=12)
+        vm[2, 2]._sdram = 50000000
+        MachineDataWriter.mock().set_machine(vm)
+        jpath = mktemp("json")
+        to_json_path(jpath)
+        # A tiny chunk makes values cross the chunk boundaries
+        with mock.patch(
+                "spinn_machine.json_machine._JsonStream._CHUNK", 7):
+            self._compare(vm, machine_from_json_stream(jpath))
+        self._compare(vm, machine_from_json_stream(jpath, lazy=True))
+
+    def test_lazy_default_tags(self):
+        vm = virtual_machine(width=12, height=12)
+        MachineDataWriter.mock().set_machine(vm)
+        jpath = mktemp("json")
+        to_json_path(jpath)
+        machine = machine_from_json_stream(jpath, lazy=True)
+        self.assertTrue(machine.is_lazy)
+        # Standard chips keep nothing beyond their packed fields
+        self.assertEqual({}, machine._lazy._extras)
+        self.assertEqual(list(vm[1, 1].tag_ids),
+                         list(machine[1, 1].tag_ids))
+
+    def test_stream_gzip(self):
+        vm = virtual_machine(width=8, height=8)
+        MachineDataWriter.mock().set_machine(vm)
+        jpath = mktemp("json.gz")
+        with gzip.open(jpath, "wt", encoding="utf-8") as j_file:
+            json.dump(to_json(), j_file)
+        self._compare(vm, machine_from_json(jpath))
+
+    def test_stream_chips_first(self):
+        vm = virtual_machine(width=8, height=8)
+        MachineDataWriter.mock().set_machine(vm)
+        j_machine = to_json()
+        reordered = {"chips": j_machine.pop("chips")}
+        reordered.update(j_machine)
+        jpath = mktemp("json")
+        with open(jpath, "w", encoding="utf-8") as j_file:
+            json.dump(reordered, j_file)
+        self._compare(vm, machine_from_json_stream(jpath))
+
+    def test_stream_truncated(self):
+        vm = virtual_machine(width=8, height=8)
+        MachineDataWriter.mock().set_machine(vm)
+        text = json.dumps(to_json())
+        jpath = mktemp("json")
+        with open(jpath, "w", encoding="utf-8") as j_file:
+            j_file.write(text[:len(text) // 2])
+        with self.assertRaises(ValueError):
+            machine_from_json_stream(jpath)
+
 
 if __name__ == '__main__':
     unittest.main()
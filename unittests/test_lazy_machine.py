@@ -0,0 +1,141 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import virtual_machine
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.data.machine_data_writer import MachineDataWriter
+from spinn_machine.exceptions import (
+    SpinnMachineAlreadyExistsException, SpinnMachineException)
+from spinn_machine.json_machine import machine_from_json, to_json
+
+
+class TestLazyMachine(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def _compare(self, eager, lazy):
+        self.assertEqual(eager.n_chips, lazy.n_chips)
+        self.assertEqual(eager.get_cores_count(), lazy.get_cores_count())
+        self.assertEqual(eager.get_links_count(), lazy.get_links_count())
+        self.assertEqual(eager.total_available_user_cores,
+                         lazy.total_available_user_cores)
+        self.assertEqual(eager.summary_string(), lazy.summary_string())
+        self.assertEqual(set(eager.chip_coordinates),
+                         set(lazy.chip_coordinates))
+        for chip in eager.chips:
+            other = lazy[chip.x, chip.y]
+            self.assertEqual(str(chip), str(other))
+            self.assertEqual(chip.sdram, other.sdram)
+            self.assertEqual(list(chip.tag_ids), list(other.tag_ids))
+            self.assertEqual(
+                chip.placable_processors_ids, other.placable_processors_ids)
+            self.assertEqual(
+                [(link.source_link_id, link.destination_x,
+                  link.destination_y) for link in chip.router.links],
+                [(link.source_link_id, link.destination_x,
+                  link.destination_y) for link in other.router.links])
+
+    def test_virtual_aggregates_without_chips(self):
+        machine = virtual_machine(24, 24, validate=False, lazy=True)
+        self.assertTrue(machine.is_lazy)
+        self.assertTrue(machine.is_dense)
+        store = machine._lazy
+        # Only the Ethernet chips exist as objects
+        self.assertEqual(12, store.n_materialised)
+        self.assertEqual(48 * 12, machine.n_chips)
+        self.assertEqual(machine.n_chips, len(list(machine.chip_coordinates)))
+        self.assertTrue(machine.is_chip_at(3, 5))
+        self.assertFalse(machine.is_chip_at(24, 0))
+        self.assertTrue(machine.is_link_at(3, 5, 0))
+        machine.get_cores_count()
+        machine.total_available_user_cores
+        self.assertEqual(12, store.n_materialised)
+        self.assertFalse(store.is_materialised(3, 5))
+        chip = machine.get_chip_at(3, 5)
+        self.assertTrue(store.is_materialised(3, 5))
+        self.assertIs(chip, machine[3, 5])
+        self.assertTrue(chip.router.is_compact)
+        self.assertEqual(13, store.n_materialised)
+
+    def test_virtual_matches_eager(self):
+        set_config("Machine", "down_cores", "1,1,5:3,4,3-6")
+        set_config("Machine", "down_links", "2,2,0:5,6,1")
+        set_config("Machine", "down_chips", "4,4")
+        eager = virtual_machine(12, 12)
+        lazy = virtual_machine(12, 12, lazy=True)
+        self._compare(eager, lazy)
+        self.assertFalse(lazy.is_link_at(2, 2, 0))
+        self.assertFalse(lazy.is_link_at(3, 4, 0))
+        self.assertEqual(
+            sorted(eager.one_way_links()), sorted(lazy.one_way_links()))
+
+    def test_json_matches_eager(self):
+        eager = virtual_machine(12, 12)
+        eager[3, 3]._sdram = 1000
+        MachineDataWriter.mock().set_machine(eager)
+        j_machine = to_json()
+        lazy = machine_from_json(j_machine, lazy=True)
+        self.assertTrue(lazy.is_lazy)
+        self._compare(machine_from_json(j_machine), lazy)
+        self.assertEqual(1000, lazy[3, 3].sdram)
+
+    def test_add_lazy_chip(self):
+        machine = virtual_machine(8, 8, lazy=True)
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            machine.add_lazy_chip(1, 1, 18, 0, 0, 0, 1000, 1000)
+        with self.assertRaises(SpinnMachineException):
+            machine.add_lazy_chip(8, 1, 18, 0, 0, 0, 1000, 1000)
+        eager = virtual_machine(8, 8)
+        with self.assertRaises(SpinnMachineException):
+            eager.add_lazy_chip(7, 0, 18, 0, 0, 0, 1000, 1000)
+
+    def test_add_lazy_chips(self):
+        machine = virtual_machine(8, 8, lazy=True)
+        n_chips = machine.n_chips
+        n_cores = machine.get_cores_count()
+        n_links = machine.get_links_count()
+        machine.add_lazy_chips(
+            [5, 6], [0, 0], [18, 16], [0b1, 0b11], [0, 0], [0, 0],
+            [1000, 1000], [1000, 1000])
+        self.assertEqual(n_chips + 2, machine.n_chips)
+        self.assertEqual(n_cores + 34, machine.get_cores_count())
+        self.assertEqual(n_links + 1.5, machine.get_links_count())
+        self.assertFalse(machine._lazy.is_materialised(6, 0))
+        self.assertTrue(machine.is_link_at(6, 0, 1))
+        chip = machine[6, 0]
+        self.assertEqual(16, chip.n_processors)
+        self.assertEqual(1000, chip.sdram)
+        self.assertEqual([0, 1], [
+            link.source_link_id for link in chip.router.links])
+
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            machine.add_lazy_chips(
+                [7, 1], [0, 1], [18, 18], [0, 0], [0, 0], [0, 0],
+                [1000, 1000], [1000, 1000])
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            machine.add_lazy_chips(
+                [7, 7], [0, 0], [18, 18], [0, 0], [0, 0], [0, 0],
+                [1000, 1000], [1000, 1000])
+        with self.assertRaises(SpinnMachineException):
+            machine.add_lazy_chips(
+                [8], [0], [18], [0], [0], [0], [1000], [1000])
+        self.assertEqual(n_chips + 2, machine.n_chips)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import virtual_machine
+from spinn_machine.config_setup import unittest_setup
+
+CHECKS = [
+    "one_way_links", "unreachable_outgoing_chips",
+    "unreachable_incoming_chips", "unreachable_outgoing_local_chips",
+    "unreachable_incoming_local_chips"]
+
+
+class TestLinkArray(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def _damage(self, machine, seed):
+        rnd = random.Random(seed)
+        for (x, y) in rnd.sample(sorted(machine.chip_coordinates), 4):
+            if (x, y) != (0, 0):
+                machine.remove_chip(x, y)
+        xys = sorted(machine.chip_coordinates)
+        for _ in range(15):
+            x, y = rnd.choice(xys)
+            link = rnd.randrange(6)
+            if machine.is_link_at(x, y, link):
+                machine.remove_link(x, y, link)
+
+    def _check_parity(self, machine):
+        link_array = machine.link_array()
+        for check in CHECKS:
+            self.assertEqual(
+                sorted(getattr(machine, check)()),
+                sorted(getattr(link_array, check)()), check)
+
+    def test_parity(self):
+        # Sizes giving NoWrap, Wrapped, HorWrap and VerWrap machines
+        for width, height in [(8, 8), (12, 12), (12, 16), (16, 12)]:
+            for seed in range(5):
+                machine = virtual_machine(width, height)
+                self._damage(machine, seed)
+                self._check_parity(machine)
+
+    def test_parity_dense_and_lazy(self):
+        for kwargs in [{"dense": True}, {"lazy": True}]:
+            machine = virtual_machine(12, 12, **kwargs)
+            self._damage(machine, 3)
+            self._check_parity(machine)
+
+    def test_undamaged(self):
+        link_array = virtual_machine(12, 12).link_array()
+        self.assertEqual((12, 12, 6), link_array.links.shape)
+        self.assertEqual(144, link_array.exists.sum())
+        for check in CHECKS:
+            self.assertEqual([], getattr(link_array, check)())
+        link_array = virtual_machine(8, 8).link_array()
+        # Links off the edge of an unwrapped board do not exist
+        self.assertFalse(link_array.links[0, 0, 3])
+        self.assertEqual(48, link_array.exists.sum())
+
+    def test_wrap_around(self):
+        machine = virtual_machine(12, 12)
+        # Leave (0, 6) only the links that cross the wrap
+        for link in [0, 1, 2, 5]:
+            machine.remove_link(0, 6, link)
+            dest_x, dest_y = machine.xy_over_link(0, 6, link)
+            machine.remove_link(dest_x, dest_y, (link + 3) % 6)
+        link_array = machine.link_array()
+        self.assertTrue(link_array.links[6, 0, 3])
+        self.assertEqual([], link_array.unreachable_incoming_chips())
+        self.assertEqual([], link_array.one_way_links())
+        # The Machine version does not look across the wrap
+        self.assertEqual([(0, 6)], machine.unreachable_incoming_chips())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -382,6 +382,88 @@ class SpinnMachineTestCase(unittest.TestCase):
         with self.assertRaises(SpinnMachineException):
             machine.validate()
 
+    def _compare_machines(self, expected, machine):
+        self.assertEqual(expected.n_chips, machine.n_chips)
+        self.assertEqual(expected.summary_string(), machine.summary_string())
+        self.assertEqual(
+            sorted(expected.chip_coordinates),
+            sorted(machine.chip_coordinates))
+        for chip in expected.chips:
+            self.assertEqual(
+                sorted(link.source_link_id for link in chip.router.links),
+                sorted(link.source_link_id
+                       for link in machine[chip].router.links))
+        self.assertEqual(
+            [chip.ip_address for chip in expected.ethernet_connected_chips],
+            [chip.ip_address for chip in machine.ethernet_connected_chips])
+        self.assertEqual(
+            sorted(map(str, dict(expected.spinnaker_links))),
+            sorted(map(str, dict(machine.spinnaker_links))))
+        self.assertEqual(
+            sorted(map(str, expected._fpga_links)),
+            sorted(map(str, machine._fpga_links)))
+
+    def test_remove_chip(self):
+        machine = virtual_machine(12, 12)
+        chip = machine.remove_chip(3, 4)
+        self.assertEqual((3, 4), (chip.x, chip.y))
+        self.assertFalse(machine.is_chip_at(3, 4))
+        self.assertEqual([], list(machine.one_way_links()))
+        set_config("Machine", "down_chips", "3,4")
+        self._compare_machines(virtual_machine(12, 12), machine)
+        with self.assertRaises(SpinnMachineException):
+            machine.remove_chip(3, 4)
+
+    def test_remove_fpga_chip(self):
+        machine = virtual_machine(12, 12)
+        # (7, 3) on the first board is connected to FPGA links
+        self.assertIsNotNone(
+            machine.get_fpga_link_with_id(0, 0, chip_coords=(7, 3)))
+        machine.remove_chip(7, 3)
+        set_config("Machine", "down_chips", "7,3")
+        self._compare_machines(virtual_machine(12, 12), machine)
+
+    def test_remove_ethernet_chip(self):
+        machine = virtual_machine(12, 12)
+        n_fpga = len(machine._fpga_links)
+        machine.remove_chip(4, 8)
+        self.assertEqual(2, len(machine.ethernet_connected_chips))
+        self.assertNotIn(
+            "127.0.4.8", [key[0] for key in machine._fpga_links])
+        self.assertLess(len(machine._fpga_links), n_fpga)
+        for link_data in machine._fpga_links.values():
+            self.assertNotEqual("127.0.4.8", link_data.board_address)
+        for _, link_data in machine.spinnaker_links:
+            self.assertNotEqual("127.0.4.8", link_data.board_address)
+        self.assertIsNotNone(machine.boot_chip)
+        machine.remove_chip(0, 0)
+        with self.assertRaises(SpinnMachineException):
+            machine.validate()
+
+    def test_remove_link(self):
+        machine = virtual_machine(12, 12)
+        self.assertEqual([], list(dict(machine.spinnaker_links)))
+        link = machine.remove_link(0, 0, 4)
+        self.assertEqual((0, 0, 4), (
+            link.source_x, link.source_y, link.source_link_id))
+        self.assertEqual([(11, 11, 1, 4)], list(machine.one_way_links()))
+        set_config("Machine", "down_links", "0,0,4")
+        self._compare_machines(virtual_machine(12, 12), machine)
+        with self.assertRaises(SpinnMachineException):
+            machine.remove_link(0, 0, 4)
+        with self.assertRaises(SpinnMachineException):
+            machine.remove_link(12, 0, 1)
+
+    def test_remove_lazy(self):
+        machine = virtual_machine(12, 12, lazy=True)
+        machine.remove_chip(3, 4)
+        machine.remove_link(0, 0, 4)
+        self.assertFalse(machine.is_chip_at(3, 4))
+        self.assertFalse(machine.is_link_at(0, 0, 4))
+        set_config("Machine", "down_chips", "3,4")
+        set_config("Machine", "down_links", "0,0,4")
+        self._compare_machines(virtual_machine(12, 12), machine)
+
 
 if __name__ == '__main__':
     unittest.main()
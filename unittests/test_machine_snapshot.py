@@ -0,0 +1,111 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from tempfile import mktemp
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import virtual_machine
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.data.machine_data_writer import MachineDataWriter
+from spinn_machine.exceptions import SpinnMachineException
+from spinn_machine.machine_snapshot import (
+    machine_from_snapshot, to_snapshot_path)
+
+
+class TestMachineSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def _compare(self, vm, sm):
+        self.assertEqual(
+            str(vm).replace("Virtual", ""), str(sm).replace("Snapshot", ""))
+        for vchip in vm.chips:
+            schip = sm[vchip.x, vchip.y]
+            self.assertEqual(str(vchip), str(schip))
+            self.assertEqual(vchip.sdram, schip.sdram)
+            self.assertEqual(vchip.ip_address, schip.ip_address)
+            self.assertEqual(list(vchip.tag_ids), list(schip.tag_ids))
+            self.assertEqual(vchip.parent_link, schip.parent_link)
+            self.assertEqual(
+                (vchip.nearest_ethernet_x, vchip.nearest_ethernet_y),
+                (schip.nearest_ethernet_x, schip.nearest_ethernet_y))
+            self.assertEqual(
+                vchip.placable_processors_ids, schip.placable_processors_ids)
+            self.assertEqual(
+                vchip.router.n_available_multicast_entries,
+                schip.router.n_available_multicast_entries)
+            self.assertEqual(
+                repr(list(vchip.router.links)),
+                repr(list(schip.router.links)))
+            for p in range(20):
+                self.assertEqual(vchip.get_physical_core_id(p),
+                                 schip.get_physical_core_id(p))
+        self.assertEqual(
+            [key for key, _ in vm.spinnaker_links],
+            [key for key, _ in sm.spinnaker_links])
+
+    def test_round_trip(self):
+        set_config("Machine", "down_cores", "1,1,5:3,4,3-6")
+        set_config("Machine", "down_links", "2,2,0:5,6,1")
+        set_config("Machine", "down_chips", "4,4")
+        vm = virtual_machine(12, 12)
+        vm[3, 3]._sdram = 50000000
+        vm[3, 3]._tag_ids = [2, 3]
+        vm[3, 3].router._n_available_multicast_entries = 100
+        vm[5, 5]._v_to_p_map = bytes([4, 1, 2, 0xFF, 3])
+        vm[5, 5]._parent_link = 3
+        spath = mktemp("snap")
+        to_snapshot_path(spath, vm)
+        self._compare(vm, machine_from_snapshot(spath))
+        self._compare(vm, machine_from_snapshot(spath, dense=True))
+        lazy = machine_from_snapshot(spath, lazy=True)
+        self.assertTrue(lazy.is_lazy)
+        self._compare(vm, lazy)
+
+    def test_current_machine(self):
+        vm = virtual_machine(8, 8)
+        MachineDataWriter.mock().set_machine(vm)
+        spath = mktemp("snap")
+        to_snapshot_path(spath)
+        sm = machine_from_snapshot(spath)
+        self._compare(vm, sm)
+        self.assertEqual(vm.summary_string(), sm.summary_string())
+
+    def test_bad_files(self):
+        spath = mktemp("snap")
+        with open(spath, "wb") as s_file:
+            s_file.write(b"not a snapshot at all, no really it is not")
+        with self.assertRaises(SpinnMachineException):
+            machine_from_snapshot(spath)
+        vm = virtual_machine(8, 8)
+        vm[1, 1]._tag_ids = [20]
+        with self.assertRaises(SpinnMachineException):
+            to_snapshot_path(spath, vm)
+
+    def test_truncated_files(self):
+        spath = mktemp("snap")
+        to_snapshot_path(spath, virtual_machine(8, 8))
+        with open(spath, "rb") as s_file:
+            data = s_file.read()
+        for length in (0, 20, 40, len(data) - 1):
+            with open(spath, "wb") as s_file:
+                s_file.write(data[:length])
+            with self.assertRaises(SpinnMachineException):
+                machine_from_snapshot(spath)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -198,6 +198,29 @@ class TestMulticastRoutingEntry(unittest.TestCase):
         with self.assertRaises(SpinnMachineInvalidParameterException):
             a_multicast.merge(b_multicast)
 
+    def test_from_arrays(self):
+        entries = MulticastRoutingEntry.from_arrays(
+            [0x100, 0x200], [0xF00, 0xF00], [11306, 1], [True, False])
+        self.assertEqual(2, len(entries))
+        self.assertEqual(MulticastRoutingEntry(
+            0x100, 0xF00, processor_ids=[4, 5, 7], link_ids=[1, 3, 5],
+            defaultable=True), entries[0])
+        self.assertEqual(frozenset([4, 5, 7]), entries[0].processor_ids)
+        self.assertEqual(frozenset([1, 3, 5]), entries[0].link_ids)
+        self.assertFalse(entries[1].defaultable)
+        self.assertEqual(frozenset([0]), entries[1].link_ids)
+        self.assertEqual(str(MulticastRoutingEntry(
+            0x200, 0xF00, spinnaker_route=1)), str(entries[1]))
+        self.assertEqual(
+            entries[0], pickle.loads(pickle.dumps(entries[0])))
+        entries = MulticastRoutingEntry.from_arrays([1], [1], [2])
+        self.assertFalse(entries[0].defaultable)
+        self.assertEqual([], MulticastRoutingEntry.from_arrays([], [], []))
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            MulticastRoutingEntry.from_arrays([1, 3], [1, 1], [0, 0])
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            MulticastRoutingEntry.from_arrays([1, 3], [1], [0, 0])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,152 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import unittest
+import numpy
+from spinn_utilities.config_holder import set_config
+from spinn_machine import (
+    MulticastRoutingEntry, MulticastRoutingTable, MulticastRoutingTables,
+    Router, virtual_machine)
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.exceptions import (
+    SpinnMachineAlreadyExistsException, SpinnMachineException)
+
+
+def _entry(key, mask, route=1, defaultable=False):
+    return MulticastRoutingEntry(
+        key, mask, spinnaker_route=route, defaultable=defaultable)
+
+
+class TestMulticastRoutingTable(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def test_add(self):
+        table = MulticastRoutingTable(1, 2, [_entry(0, 0xF0)])
+        self.assertEqual((1, 2), (table.x, table.y))
+        table.add_multicast_routing_entry(_entry(0x10, 0xF0, 2, True))
+        table.add_multicast_routing_entries(
+            [_entry(0x20, 0xF0), _entry(0x20, 0xFF)])
+        self.assertEqual(4, len(table))
+        self.assertEqual(4, table.number_of_entries)
+        self.assertEqual(1, table.number_of_defaultable_entries)
+        self.assertEqual(
+            2, table.get_entry_by_key_mask(0x10, 0xF0).spinnaker_route)
+        self.assertIsNone(table.get_entry_by_key_mask(0x10, 0xFF))
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            table.add_multicast_routing_entry(_entry(0x10, 0xF0))
+        # A batch with a repeat is not added at all
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            table.add_multicast_routing_entries(
+                [_entry(0x30, 0xF0), _entry(0x30, 0xF0)])
+        self.assertEqual(4, len(table))
+        self.assertEqual([0, 0x10, 0x20, 0x20], table.arrays[0].tolist())
+        self.assertEqual([0xF0, 0xF0, 0xF0, 0xFF], table.arrays[1].tolist())
+        self.assertEqual([1, 2, 1, 1], table.arrays[2].tolist())
+        self.assertEqual(list(table), list(table.multicast_routing_entries))
+
+    def test_lookup(self):
+        table = MulticastRoutingTable(0, 0, [
+            _entry(0x100, 0xFFFFFF00), _entry(0x200, 0xFFFFFF00, 2),
+            _entry(0, 0), _entry(0x300, 0xFFFFFF00)])
+        self.assertEqual([0, 1, 2, 2], table.lookup(
+            [0x1AB, 0x200, 0x300, 0x400]).tolist())
+        self.assertEqual((2, 2), table.lookup(
+            numpy.zeros((2, 2), dtype=numpy.uint32)).shape)
+        self.assertIs(table.multicast_routing_entries[1],
+                      table.get_entry_for_key(0x2FF))
+        self.assertEqual(
+            [-1], MulticastRoutingTable(0, 0).lookup([5]).tolist())
+
+        rand = random.Random(3)
+        entries = {}
+        while len(entries) < 300:
+            mask = (0xFFFFFFFF << rand.randint(0, 12)) & 0xFFFFFFFF
+            key = rand.getrandbits(16) & mask
+            entries[key, mask] = _entry(key, mask, rand.getrandbits(24))
+        table = MulticastRoutingTable(0, 0, entries.values())
+        keys = [rand.getrandbits(16) for _ in range(2000)]
+        found = table.lookup(keys).tolist()
+        for key, index in zip(keys, found):
+            entry = table.get_entry_for_key(key)
+            if entry is None:
+                self.assertEqual(-1, index)
+            else:
+                self.assertIs(entry, table.multicast_routing_entries[index])
+
+    def test_find_conflicts(self):
+        table = MulticastRoutingTable(0, 0, [
+            _entry(0x100, 0xFFFFFF00), _entry(0x200, 0xFFFFFF00),
+            _entry(0x210, 0xFFFFFFF0), _entry(0, 0xFFFF0000),
+            _entry(0x10000, 0xFFFF0000)])
+        self.assertEqual([(0, 3), (1, 2), (1, 3), (2, 3)],
+                         sorted(table.find_conflicts()))
+        self.assertEqual([], MulticastRoutingTable(0, 0).find_conflicts())
+
+    def test_capacity(self):
+        router = Router([], 2)
+        table = MulticastRoutingTable(
+            0, 0, [_entry(0, 0xF0), _entry(0x10, 0xF0)])
+        self.assertTrue(table.fits(router))
+        table.check_capacity(router)
+        table.add_multicast_routing_entry(_entry(0x20, 0xF0))
+        self.assertFalse(table.fits(router))
+        with self.assertRaises(SpinnMachineException):
+            table.check_capacity(router)
+
+    def test_from_arrays(self):
+        keys = numpy.arange(100, dtype=numpy.uint32) << 8
+        masks = numpy.full(100, 0xFFFFFF00, dtype=numpy.uint32)
+        routes = numpy.arange(100, dtype=numpy.uint32)
+        table = MulticastRoutingTable.from_arrays(2, 3, keys, masks, routes)
+        self.assertEqual((2, 3), (table.x, table.y))
+        self.assertEqual(100, len(table))
+        self.assertEqual(0, table.number_of_defaultable_entries)
+        self.assertEqual(_entry(0x500, 0xFFFFFF00, 5),
+                         table.get_entry_by_key_mask(0x500, 0xFFFFFF00))
+        self.assertEqual(keys.tolist(), table.arrays[0].tolist())
+        self.assertEqual(routes.tolist(), table.arrays[2].tolist())
+        self.assertFalse(table.arrays[0].flags.writeable)
+        self.assertEqual([5, -1], table.lookup([0x5FF, 0x10000]).tolist())
+        table.add_multicast_routing_entry(_entry(0x10000, 0xFFFF0000))
+        self.assertEqual(101, len(table.arrays[0]))
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            MulticastRoutingTable.from_arrays(
+                0, 0, [0, 0], [0xF0, 0xF0], [1, 2])
+
+    def test_tables(self):
+        machine = virtual_machine(8, 8)
+        tables = MulticastRoutingTables([
+            MulticastRoutingTable(0, 0, [_entry(0, 0xF0)]),
+            MulticastRoutingTable(1, 0)])
+        self.assertEqual(2, len(tables))
+        self.assertIn((1, 0), tables)
+        self.assertEqual(1, tables.max_number_of_entries)
+        self.assertIs(tables[0, 0], tables.get_routing_table_for_chip(0, 0))
+        self.assertIsNone(tables.get_routing_table_for_chip(2, 0))
+        self.assertEqual([(0, 0), (1, 0)],
+                         [(table.x, table.y) for table in tables])
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            tables.add_routing_table(MulticastRoutingTable(1, 0))
+        tables.check_capacity(machine)
+        tables.add_routing_table(MulticastRoutingTable(8, 8))
+        with self.assertRaises(SpinnMachineException):
+            tables.check_capacity(machine)
+
+
+if __name__ == '__main__':
+    unittest.main()
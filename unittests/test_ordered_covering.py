@@ -0,0 +1,157 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import unittest
+import numpy
+from spinn_utilities.config_holder import set_config
+from spinn_machine import (
+    MulticastRoutingEntry, MulticastRoutingTable, MulticastRoutingTables,
+    virtual_machine)
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.exceptions import SpinnMachineException
+from spinn_machine.ordered_covering import (
+    minimise_routing_tables, minimise_table)
+from benchmarks.benchmark_ordered_covering import random_table
+
+
+def _entry(key, mask, route, defaultable=False):
+    return MulticastRoutingEntry(
+        key, mask, spinnaker_route=route, defaultable=defaultable)
+
+
+class TestOrderedCovering(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def _check_routes(self, original, minimised, rand):
+        keys, masks, routes = original.arrays
+        test_keys = []
+        for key, mask in zip(keys.tolist(), masks.tolist()):
+            test_keys.append(key)
+            test_keys.append(key | (rand.getrandbits(32) & ~mask))
+        before = original.lookup(test_keys)
+        after = minimised.lookup(test_keys)
+        self.assertTrue((after >= 0).all())
+        self.assertEqual(routes[before].tolist(),
+                         minimised.arrays[2][after].tolist())
+
+    def test_merge(self):
+        original = MulticastRoutingTable(0, 0, [
+            _entry(0b0000, 0b1111, 1), _entry(0b0001, 0b1111, 1),
+            _entry(0b0010, 0b1111, 1), _entry(0b0011, 0b1111, 1),
+            _entry(0b0100, 0b1111, 2)])
+        minimised = minimise_table(original)
+        self.assertEqual(2, len(minimised))
+        self.assertEqual(
+            [(0b0100, 0b1111, 2), (0b0000, 0b1100, 1)],
+            [(entry.routing_entry_key, entry.mask, entry.spinnaker_route)
+             for entry in minimised])
+        self._check_routes(original, minimised, random.Random(1))
+
+    def test_down_check(self):
+        # Merging 0000 and 0011 would make an entry that takes 0001
+        original = MulticastRoutingTable(0, 0, [
+            _entry(0b0000, 0b1111, 1), _entry(0b0011, 0b1111, 1),
+            _entry(0b0000, 0b1000, 2)])
+        minimised = minimise_table(original)
+        self.assertEqual(3, len(minimised))
+        self._check_routes(original, minimised, random.Random(1))
+
+    def test_up_check(self):
+        # The general entry must stay below 0100 which takes a key of 01XX
+        original = MulticastRoutingTable(0, 0, [
+            _entry(0b0100, 0b1111, 2), _entry(0b0000, 0b1100, 1),
+            _entry(0b1000, 0b1100, 1)])
+        minimised = minimise_table(original)
+        self.assertEqual(2, len(minimised))
+        self._check_routes(original, minimised, random.Random(1))
+
+    def test_random(self):
+        rand = random.Random(12)
+        for _ in range(20):
+            original = random_table(rand, rand.randint(1, 300), 4)
+            minimised = minimise_table(original)
+            self.assertLessEqual(len(minimised), len(original))
+            self._check_routes(original, minimised, rand)
+        self.assertEqual(0, len(minimise_table(MulticastRoutingTable(0, 0))))
+
+    def test_known_sizes(self):
+        # The sizes the ordered covering of rig gets for the same tables
+        for n_entries, n_minimised in ((500, 42), (2000, 185)):
+            original = random_table(random.Random(0), n_entries, 8)
+            minimised = minimise_table(original)
+            self.assertEqual(n_minimised, len(minimised))
+            self._check_routes(original, minimised, random.Random(1))
+
+    def test_target_and_time(self):
+        rand = random.Random(3)
+        original = random_table(rand, 500, 8)
+        partial = minimise_table(original, target_length=400)
+        self.assertLessEqual(len(partial), 400)
+        self.assertGreater(len(partial), len(minimise_table(original)))
+        self._check_routes(original, partial, rand)
+        with self.assertRaises(SpinnMachineException):
+            minimise_table(original, target_length=1)
+        with self.assertRaises(SpinnMachineException):
+            minimise_table(original, target_length=10, time_limit=0)
+        self.assertEqual(
+            len(original), len(minimise_table(original, time_limit=0)))
+
+    def test_remove_default_routes(self):
+        original = MulticastRoutingTable(0, 0, [
+            _entry(0x1100, 0xFFFFFF00, 1 << 3, True),
+            _entry(0x200, 0xFFFFFF00, 1 << 4, True),
+            _entry(0, 0xFFFFF000, 1 << 5)])
+        minimised = minimise_table(original, remove_default_routes=True)
+        # The second can not go as the third would then take its keys
+        self.assertEqual(
+            [0x200, 0],
+            [entry.routing_entry_key for entry in minimised])
+        self.assertEqual(
+            3, len(minimise_table(original, remove_default_routes=False)))
+        self.assertEqual(-1, minimised.lookup([0x1101])[0])
+
+    def test_routing_tables(self):
+        machine = virtual_machine(8, 8)
+        rand = random.Random(4)
+        small = random_table(rand, 10, 2, 1, 0)
+        big = random_table(rand, 1100, 3, 0, 0)
+        tables = MulticastRoutingTables([big, small])
+        minimised = minimise_routing_tables(tables, machine)
+        self.assertIs(small, minimised[1, 0])
+        self.assertLessEqual(
+            len(minimised[0, 0]),
+            machine[0, 0].router.n_available_multicast_entries)
+        # Only squeezed until it fits
+        self.assertGreater(len(minimised[0, 0]), 3)
+        self._check_routes(big, minimised[0, 0], rand)
+        tables.add_routing_table(MulticastRoutingTable(9, 9))
+        with self.assertRaises(SpinnMachineException):
+            minimise_routing_tables(tables, machine)
+
+    def test_generality_order(self):
+        rand = random.Random(5)
+        minimised = minimise_table(random_table(rand, 200, 3))
+        masks = minimised.arrays[1]
+        generality = [32 - bin(mask).count("1") for mask in masks.tolist()]
+        self.assertEqual(sorted(generality), generality)
+        self.assertTrue(numpy.all(
+            (minimised.arrays[0] & masks) == minimised.arrays[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
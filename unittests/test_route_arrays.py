@@ -0,0 +1,133 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import unittest
+import numpy
+from spinn_machine import MulticastRoutingEntry, Router
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
+from spinn_machine.route_arrays import (
+    decode_routes, encode_routes, entries_to_arrays, flags_to_routes,
+    route_to_ids, routes_to_flags)
+
+
+class TestRouteArrays(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        rand = random.Random(7)
+        self.entries = []
+        for key in range(200):
+            processor_ids = rand.sample(
+                range(Router.MAX_CORES_PER_ROUTER), rand.randrange(4))
+            link_ids = rand.sample(
+                range(Router.MAX_LINKS_PER_ROUTER), rand.randrange(3))
+            self.entries.append(MulticastRoutingEntry(
+                key << 8, 0xFFFFFF00, processor_ids=processor_ids,
+                link_ids=link_ids))
+
+    def test_constants(self):
+        self.assertEqual(6, Router.MAX_LINKS_PER_ROUTER)
+        self.assertEqual(18, Router.MAX_CORES_PER_ROUTER)
+
+    def test_route_to_ids(self):
+        for entry in self.entries:
+            self.assertEqual(
+                (entry.processor_ids, entry.link_ids),
+                route_to_ids(entry.spinnaker_route))
+        self.assertEqual(
+            (frozenset(range(18)), frozenset(range(6))),
+            route_to_ids(0xFFFFFF))
+        self.assertEqual(([4, 5, 7], [1, 3, 5]),
+                         Router.convert_spinnaker_route_to_routing_ids(11306))
+
+    def test_entries_to_arrays(self):
+        keys, masks, routes = entries_to_arrays(self.entries)
+        self.assertEqual(numpy.uint32, routes.dtype)
+        self.assertEqual(
+            [entry.routing_entry_key for entry in self.entries],
+            keys.tolist())
+        self.assertEqual([0xFFFFFF00] * 200, masks.tolist())
+        self.assertEqual(
+            [entry.spinnaker_route for entry in self.entries],
+            routes.tolist())
+        keys, _, _ = entries_to_arrays([])
+        self.assertEqual(0, len(keys))
+
+    def test_bitsets(self):
+        _, _, routes = entries_to_arrays(self.entries)
+        processor_bits, link_bits = decode_routes(routes)
+        for entry, processors, links in zip(
+                self.entries, processor_bits.tolist(), link_bits.tolist()):
+            self.assertEqual(
+                sum(1 << p for p in entry.processor_ids), processors)
+            self.assertEqual(sum(1 << link for link in entry.link_ids), links)
+        self.assertEqual(
+            routes.tolist(),
+            encode_routes(processor_bits, link_bits).tolist())
+
+    def test_bad_bitsets(self):
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            encode_routes([1 << 18], [0])
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            encode_routes([0], [1 << 6])
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            encode_routes([-1], [0])
+
+    def test_flags(self):
+        _, _, routes = entries_to_arrays(self.entries)
+        processor_flags, link_flags = routes_to_flags(routes)
+        self.assertEqual((200, 18), processor_flags.shape)
+        self.assertEqual((200, 6), link_flags.shape)
+        for entry, processors, links in zip(
+                self.entries, processor_flags, link_flags):
+            self.assertEqual(
+                entry.processor_ids, frozenset(numpy.flatnonzero(processors)))
+            self.assertEqual(
+                entry.link_ids, frozenset(numpy.flatnonzero(links)))
+        self.assertEqual(
+            routes.tolist(),
+            flags_to_routes(processor_flags, link_flags).tolist())
+        self.assertEqual(
+            [1 << 6 | 1 << 1], flags_to_routes([[1]], [[0, 1]]).tolist())
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            flags_to_routes(numpy.zeros((1, 19)), numpy.zeros((1, 6)))
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            flags_to_routes(numpy.zeros((1, 18)), numpy.zeros((1, 7)))
+
+    def test_flags_shapes(self):
+        for processor_flags, link_flags in (
+                ([], []), (numpy.zeros((0, 18)), numpy.zeros((0, 6))),
+                (numpy.zeros(0), [])):
+            routes = flags_to_routes(processor_flags, link_flags)
+            self.assertEqual((0, ), routes.shape)
+            self.assertEqual(numpy.uint32, routes.dtype)
+        processor_flags, link_flags = routes_to_flags([])
+        self.assertEqual([], flags_to_routes(
+            processor_flags, link_flags).tolist())
+        # One row of flags is one route
+        self.assertEqual(
+            [1 << 7 | 1 << 2], flags_to_routes([0, 1], [0, 0, 1]).tolist())
+        # Routes with no processor flags
+        self.assertEqual(
+            [1, 1], flags_to_routes(numpy.zeros((2, 0)), [[1], [1]]).tolist())
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            flags_to_routes(numpy.zeros((2, 18)), numpy.zeros((3, 6)))
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            flags_to_routes(numpy.zeros((1, 1, 18)), numpy.zeros((1, 6)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,10 +13,12 @@
 # limitations under the License.
 
 import unittest
-from spinn_machine import Router, Link, MulticastRoutingEntry
+from spinn_machine import (
+    CompactRouter, Router, Link, MulticastRoutingEntry)
 from spinn_machine.config_setup import unittest_setup
 from spinn_machine.exceptions import (
-    SpinnMachineAlreadyExistsException, SpinnMachineInvalidParameterException)
+    SpinnMachineAlreadyExistsException, SpinnMachineException,
+    SpinnMachineInvalidParameterException)
 
 
 class TestingRouter(unittest.TestCase):
@@ -64,6 +66,69 @@ class TestingRouter(unittest.TestCase):
             "[Link: source_x=1, source_y=0, source_link_id=3, "
             "destination_x=0, destination_y=1]]]")
 
+    def test_compact_router(self):
+        def xy_over_link(x, y, link):
+            return (x + link, y + 10)
+
+        r = CompactRouter(3, 4, 0b101001, 1024, xy_over_link)
+        self.assertTrue(r.is_compact)
+        self.assertEqual(3, len(r))
+        self.assertEqual(0b101001, r.link_mask)
+        self.assertEqual(
+            [True, False, False, True, False, True],
+            [r.is_link(i) for i in range(6)])
+        self.assertFalse(r.is_link(6))
+        self.assertFalse(r.is_link(-1))
+        self.assertIsNone(r.get_link(1))
+        self.assertIsNone(r.get_destination(1))
+        self.assertEqual((6, 14), r.get_destination(3))
+        link = r.get_link(3)
+        self.assertEqual(
+            (3, 4, 3, 6, 14),
+            (link.source_x, link.source_y, link.source_link_id,
+             link.destination_x, link.destination_y))
+        self.assertEqual([0, 3, 5], [link_id for link_id, _ in r])
+        self.assertEqual([0, 3, 5], [li.source_link_id for li in r.links])
+        self.assertIn("destination_x=8, destination_y=14", str(r))
+
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            r.add_link(Link(3, 4, 5, 0, 0))
+        r.add_link(Link(3, 4, 1, 0, 0))
+        self.assertFalse(r.is_compact)
+        self.assertEqual(4, len(r))
+        self.assertEqual(0b101011, r.link_mask)
+        self.assertEqual((6, 14), r.get_destination(3))
+        self.assertEqual((0, 0), r.get_destination(1))
+
+    def test_slots(self):
+        # Ordinary routers do not carry the fields of the compact form
+        self.assertEqual(("_links", "_n_available_multicast_entries"),
+                         Router.__slots__)
+        r = Router([Link(0, 0, 0, 1, 1)], 1024)
+        self.assertFalse(r.is_compact)
+        self.assertFalse(hasattr(r, "_link_mask"))
+        self.assertEqual(0b1, r.link_mask)
+
+    def test_remove_link(self):
+        def xy_over_link(x, y, link):
+            return (x + link, y + 10)
+
+        r = CompactRouter(3, 4, 0b101001, 1024, xy_over_link)
+        link = r.remove_link(3)
+        self.assertEqual((3, 6, 14), (
+            link.source_link_id, link.destination_x, link.destination_y))
+        self.assertTrue(r.is_compact)
+        self.assertEqual(0b100001, r.link_mask)
+        self.assertEqual(2, len(r))
+        with self.assertRaises(SpinnMachineException):
+            r.remove_link(3)
+
+        r = Router([Link(0, 0, 0, 1, 0), Link(0, 0, 2, 0, 1)], 1024)
+        self.assertEqual(2, r.remove_link(2).source_link_id)
+        self.assertEqual([0], [link_id for link_id, _ in r])
+        with self.assertRaises(SpinnMachineException):
+            r.remove_link(7)
+
     def test_creating_new_router_with_duplicate_links(self):
         links = list()
         (e, ne, n, w, sw, s) = range(6)
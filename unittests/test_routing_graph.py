@@ -0,0 +1,131 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import virtual_machine
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.exceptions import SpinnMachineException
+from spinn_machine.routing_graph import RoutingGraph
+
+
+class TestRoutingGraph(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def _follow(self, machine, source, path):
+        xy = source
+        for (x, y, link) in path:
+            self.assertEqual(xy, (x, y))
+            self.assertTrue(machine.is_link_at(x, y, link))
+            xy = machine.xy_over_link(x, y, link)
+        return xy
+
+    def test_perfect_machine_matches_vectors(self):
+        machine = virtual_machine(12, 12)
+        graph = RoutingGraph(machine)
+        self.assertEqual(machine.n_chips, len(graph))
+        for source in [(0, 0), (5, 7), (11, 3)]:
+            hops = graph.hops_from(source)
+            self.assertEqual(machine.n_chips, len(hops))
+            for target, hop in hops.items():
+                self.assertEqual(
+                    machine.get_vector_length(source, target), hop)
+
+    def test_shortest_path(self):
+        machine = virtual_machine(8, 8)
+        graph = RoutingGraph(machine)
+        path = graph.shortest_path((0, 0), (7, 7))
+        self.assertEqual(7, len(path))
+        self.assertEqual((7, 7), self._follow(machine, (0, 0), path))
+        self.assertEqual([], graph.shortest_path((3, 3), (3, 3)))
+        with self.assertRaises(SpinnMachineException):
+            graph.shortest_path((0, 0), (0, 7))
+
+    def test_avoids_dead_chips(self):
+        set_config("Machine", "down_chips", "1,1:2,2:3,3")
+        machine = virtual_machine(8, 8)
+        graph = RoutingGraph(machine)
+        hops = graph.hops_from((0, 0))
+        self.assertNotIn((1, 1), hops)
+        # The diagonal is dead so it can not be used
+        self.assertEqual(5, hops[4, 4])
+        path = graph.shortest_path((0, 0), (4, 4))
+        self.assertEqual(5, len(path))
+        self.assertEqual((4, 4), self._follow(machine, (0, 0), path))
+
+    def test_avoids_dead_links(self):
+        set_config("Machine", "down_links", "0,0,1:0,0,0")
+        machine = virtual_machine(8, 8)
+        graph = RoutingGraph(machine)
+        path = graph.shortest_path((0, 0), (1, 1))
+        self.assertEqual(2, len(path))
+        self.assertEqual((0, 0, 2), path[0])
+        # Coming back can still use the working opposite links
+        self.assertEqual(1, len(graph.shortest_path((1, 1), (0, 0))))
+
+    def test_multi_source(self):
+        machine = virtual_machine(8, 8)
+        graph = RoutingGraph(machine)
+        hops = graph.hops_from_any([(0, 0), (7, 7)])
+        self.assertEqual(0, hops[0, 0])
+        self.assertEqual(0, hops[7, 7])
+        self.assertEqual(1, hops[6, 6])
+        paths = graph.shortest_paths_from([(0, 0), (7, 7)], [(1, 0), (6, 7)])
+        self.assertEqual([(0, 0, 0)], paths[1, 0])
+        self.assertEqual([(7, 7, 3)], paths[6, 7])
+
+    def test_shortest_path_tree(self):
+        machine = virtual_machine(12, 12)
+        graph = RoutingGraph(machine)
+        source = (2, 2)
+        destinations = [(5, 5), (5, 6), (0, 9), (11, 11), (2, 2)]
+        tree = graph.shortest_path_tree(source, destinations)
+        hops = graph.hops_from(source)
+        # Walk the tree recording the depth at which each chip is reached
+        depth = {source: 0}
+        todo = [source]
+        while todo:
+            xy = todo.pop()
+            for link in tree.get(xy, ()):
+                self.assertTrue(machine.is_link_at(xy[0], xy[1], link))
+                next_xy = machine.xy_over_link(xy[0], xy[1], link)
+                self.assertNotIn(next_xy, depth)
+                depth[next_xy] = depth[xy] + 1
+                todo.append(next_xy)
+        for destination in destinations:
+            self.assertEqual(hops[destination], depth[destination])
+        # Shared prefixes make the tree smaller than the sum of the paths
+        n_links = sum(len(links) for links in tree.values())
+        self.assertLess(n_links, sum(hops[d] for d in destinations))
+
+    def test_unreachable(self):
+        set_config("Machine", "down_links",
+                   "3,3,0:3,3,1:3,3,2:3,3,3:3,3,4:3,3,5")
+        machine = virtual_machine(8, 8, validate=False)
+        graph = RoutingGraph(machine)
+        self.assertEqual({(3, 3): 0}, graph.hops_from((3, 3)))
+        self.assertIsNone(graph.shortest_path((3, 3), (0, 0)))
+        self.assertIsNone(
+            graph.shortest_paths_from([(3, 3)], [(0, 0)])[0, 0])
+        with self.assertRaises(SpinnMachineException):
+            graph.shortest_path_tree((3, 3), [(0, 0)])
+        # Incoming links still work
+        self.assertEqual(1, len(graph.shortest_path((3, 2), (3, 3))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from spinn_machine import (
+    FrozenMulticastRoutingTable, MulticastRoutingEntry, MulticastRoutingTable,
+    MulticastRoutingTables)
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.routing_table_diff import (
+    diff_routing_table, diff_routing_tables)
+
+
+def _entry(key, route=1, defaultable=False):
+    return MulticastRoutingEntry(
+        key << 8, 0xFFFFFF00, spinnaker_route=route, defaultable=defaultable)
+
+
+class TestRoutingTableDiff(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_unchanged(self):
+        old = MulticastRoutingTable(1, 2, [_entry(key) for key in range(10)])
+        new = MulticastRoutingTable(1, 2, [_entry(key) for key in range(10)])
+        diff = diff_routing_table(old, new)
+        self.assertTrue(diff.is_unchanged)
+        self.assertEqual((1, 2), (diff.x, diff.y))
+        self.assertTrue(diff_routing_table(
+            MulticastRoutingTable(0, 0), MulticastRoutingTable(0, 0)
+            ).is_unchanged)
+
+    def test_changes(self):
+        old = MulticastRoutingTable(0, 0, [
+            _entry(0), _entry(1), _entry(2, route=2), _entry(3), _entry(4)])
+        new = MulticastRoutingTable(0, 0, [
+            _entry(5), _entry(4, defaultable=True), _entry(0),
+            _entry(2, route=4), _entry(6)])
+        diff = diff_routing_table(old, new)
+        self.assertFalse(diff.is_unchanged)
+        self.assertEqual([_entry(5), _entry(6)], list(diff.added))
+        self.assertEqual([_entry(1), _entry(3)], list(diff.removed))
+        self.assertEqual(
+            [(_entry(2, route=2), _entry(2, route=4))], list(diff.changed))
+        self.assertTrue(diff.reordered)
+        diff = diff_routing_table(old, new, compare_defaultable=True)
+        self.assertEqual(
+            [(_entry(4), _entry(4, defaultable=True)),
+             (_entry(2, route=2), _entry(2, route=4))],
+            list(diff.changed))
+
+    def test_defaultable(self):
+        old = MulticastRoutingTable(0, 0, [_entry(0), _entry(1)])
+        new = MulticastRoutingTable(
+            0, 0, [_entry(0, defaultable=True), _entry(1)])
+        self.assertTrue(diff_routing_table(old, new).is_unchanged)
+        diff = diff_routing_table(old, new, compare_defaultable=True)
+        self.assertEqual(
+            [(_entry(0), _entry(0, defaultable=True))], list(diff.changed))
+
+    def test_reordered(self):
+        old = MulticastRoutingTable(0, 0, [_entry(0), _entry(1)])
+        diff = diff_routing_table(
+            old, MulticastRoutingTable(0, 0, [_entry(1), _entry(0)]))
+        self.assertTrue(diff.reordered)
+        self.assertFalse(diff.is_unchanged)
+        self.assertEqual([], list(diff.changed))
+        diff = diff_routing_table(
+            old, MulticastRoutingTable(0, 0, [_entry(0), _entry(2)]))
+        self.assertFalse(diff.reordered)
+
+    def test_frozen(self):
+        old = MulticastRoutingTable(0, 0, [_entry(key) for key in range(5)])
+        frozen = FrozenMulticastRoutingTable(0, 0, old.to_bytes())
+        self.assertTrue(diff_routing_table(old, frozen).is_unchanged)
+        old.add_multicast_routing_entry(_entry(5, defaultable=True))
+        diff = diff_routing_table(old, frozen)
+        self.assertEqual([_entry(5, defaultable=True)], list(diff.removed))
+        # Defaultable is lost when written as bytes, which is not a change
+        frozen = FrozenMulticastRoutingTable(0, 0, old.to_bytes())
+        self.assertTrue(diff_routing_table(old, frozen).is_unchanged)
+        self.assertTrue(diff_routing_tables(
+            MulticastRoutingTables([old]),
+            MulticastRoutingTables([frozen])).is_unchanged)
+
+    def test_repeated(self):
+        # Tables made from bytes are not checked for repeats
+        first = MulticastRoutingTable(0, 0, [_entry(0), _entry(1)])
+        second = MulticastRoutingTable(0, 0, [_entry(0, route=2)])
+        repeated = FrozenMulticastRoutingTable(
+            0, 0, first.to_bytes() + second.to_bytes())
+        single = FrozenMulticastRoutingTable(0, 0, first.to_bytes())
+        self.assertTrue(diff_routing_table(repeated, repeated).is_unchanged)
+        diff = diff_routing_table(repeated, single)
+        self.assertEqual([_entry(0, route=2)], list(diff.removed))
+        self.assertEqual([], list(diff.changed))
+        self.assertFalse(diff.reordered)
+        diff = diff_routing_table(single, repeated)
+        self.assertEqual([_entry(0, route=2)], list(diff.added))
+        self.assertEqual([], list(diff.changed))
+        diff = diff_routing_table(repeated, FrozenMulticastRoutingTable(
+            0, 0, second.to_bytes() + first.to_bytes()))
+        self.assertEqual(
+            [(_entry(0), _entry(0, route=2)), (_entry(0, route=2), _entry(0))],
+            list(diff.changed))
+
+    def test_tables(self):
+        old = MulticastRoutingTables([
+            MulticastRoutingTable(0, 0, [_entry(0)]),
+            MulticastRoutingTable(0, 1, [_entry(1)]),
+            MulticastRoutingTable(1, 0, [_entry(2)]),
+            MulticastRoutingTable(2, 2)])
+        new = MulticastRoutingTables([
+            MulticastRoutingTable(0, 0, [_entry(0)]),
+            MulticastRoutingTable(0, 1, [_entry(1, route=2)]),
+            MulticastRoutingTable(1, 1, [_entry(3)])])
+        diffs = diff_routing_tables(old, new)
+        self.assertFalse(diffs.is_unchanged)
+        self.assertEqual([(0, 0), (2, 2)], list(diffs.unchanged_chips))
+        self.assertEqual({(0, 1), (1, 1), (1, 0)}, set(diffs.changed_chips))
+        self.assertIsNone(diffs.get_diff_for_chip(0, 0))
+        self.assertEqual(
+            [_entry(3)], list(diffs.get_diff_for_chip(1, 1).added))
+        self.assertEqual(
+            [_entry(2)], list(diffs.get_diff_for_chip(1, 0).removed))
+        self.assertEqual(1, len(diffs.get_diff_for_chip(0, 1).changed))
+        self.assertEqual(3, len(list(diffs.diffs)))
+        self.assertTrue(diff_routing_tables(old, old).is_unchanged)
+        self.assertIn("changed=3", repr(diffs))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from tempfile import mktemp
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import (
+    FrozenMulticastRoutingTable, MulticastRoutingEntry, MulticastRoutingTable,
+    MulticastRoutingTables, virtual_machine)
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.exceptions import SpinnMachineException
+from spinn_machine.routing_table_diff import diff_routing_tables
+from spinn_machine.routing_table_store import (
+    RoutingTableStore, to_routing_table_store_path)
+
+
+def _tables():
+    tables = MulticastRoutingTables()
+    for x, y in [(3, 1), (0, 0), (1, 2), (0, 3)]:
+        tables.add_routing_table(MulticastRoutingTable.from_arrays(
+            x, y, [key << 8 for key in range(x * 10 + y)],
+            [0xFFFFFF00] * (x * 10 + y),
+            [x * 100 + key for key in range(x * 10 + y)]))
+    return tables
+
+
+class TestRoutingTableStore(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def test_round_trip(self):
+        tables = _tables()
+        spath = mktemp("tables")
+        to_routing_table_store_path(spath, tables)
+        store = RoutingTableStore(spath)
+        self.assertEqual(4, len(store))
+        self.assertEqual([(0, 0), (0, 3), (1, 2), (3, 1)], list(store.chips))
+        self.assertEqual(31, store.max_number_of_entries)
+        self.assertEqual(12, store.get_number_of_entries(1, 2))
+        self.assertEqual(0, store.get_number_of_entries(2, 2))
+        self.assertIn((3, 1), store)
+        self.assertNotIn((1, 3), store)
+        self.assertIsNone(store.get_routing_table_for_chip(1, 3))
+        with self.assertRaises(KeyError):
+            store[1, 3]
+        for table in tables:
+            stored = store[table.x, table.y]
+            self.assertIsInstance(stored, FrozenMulticastRoutingTable)
+            self.assertEqual((table.x, table.y), (stored.x, stored.y))
+            self.assertEqual(list(table), list(stored))
+            self.assertEqual(table.to_bytes(), stored.to_bytes())
+        self.assertEqual(0, len(store[0, 0]))
+        self.assertEqual(
+            [(0, 0), (0, 3), (1, 2), (3, 1)],
+            [(table.x, table.y) for table in store.routing_tables])
+        self.assertTrue(diff_routing_tables(tables, store).is_unchanged)
+        store.check_capacity(virtual_machine(8, 8))
+        with self.assertRaises(RuntimeError):
+            store.add_routing_table(MulticastRoutingTable(5, 5))
+        store.close()
+
+    def test_close(self):
+        spath = mktemp("tables")
+        to_routing_table_store_path(spath, _tables())
+        with RoutingTableStore(spath) as store:
+            table = store[1, 2]
+        # The table can still be used after the store is closed
+        self.assertEqual(
+            101, table.get_entry_for_key(0x1FF).spinnaker_route)
+        self.assertEqual(12, len(table))
+        with self.assertRaises(SpinnMachineException):
+            store[1, 2]
+        store.close()
+        # An error in the block is not hidden by closing
+        with self.assertRaises(KeyError):
+            with RoutingTableStore(spath) as store:
+                table = store[1, 2]
+                store[7, 7]
+
+    def test_empty(self):
+        spath = mktemp("tables")
+        to_routing_table_store_path(spath, [])
+        with RoutingTableStore(spath) as store:
+            self.assertEqual(0, len(store))
+            self.assertEqual(0, store.max_number_of_entries)
+            self.assertEqual([], list(store))
+
+    def test_bad_files(self):
+        spath = mktemp("tables")
+        with open(spath, "wb") as s_file:
+            s_file.write(b"not a routing table store at all")
+        with self.assertRaises(SpinnMachineException):
+            RoutingTableStore(spath)
+        with open(spath, "wb") as s_file:
+            s_file.write(b"short")
+        with self.assertRaises(SpinnMachineException):
+            RoutingTableStore(spath)
+        to_routing_table_store_path(spath, _tables())
+        with open(spath, "rb") as s_file:
+            data = s_file.read()
+        for length in (20, 40, len(data) - 1):
+            with open(spath, "wb") as s_file:
+                s_file.write(data[:length])
+            with self.assertRaises(SpinnMachineException):
+                RoutingTableStore(spath)
+        entry = MulticastRoutingEntry(0, 0, spinnaker_route=1)
+        with self.assertRaises(SpinnMachineException):
+            to_routing_table_store_path(spath, [
+                MulticastRoutingTable(0, 0, [entry]),
+                MulticastRoutingTable(0, 0, [entry])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import unittest
+import numpy
 from spinn_machine import SpiNNakerTriadGeometry
 from spinn_machine.config_setup import unittest_setup
 
@@ -71,6 +72,36 @@ class TestingGeometry(unittest.TestCase):
         self.assertIn((0, 12), g.get_potential_ethernet_chips(20, 20))
         self.assertEqual(3, len(g.get_potential_ethernet_chips(16, 12)))
 
+    def test_batch(self):
+        g = SpiNNakerTriadGeometry.get_spinn5_geometry()
+        xys = numpy.array(
+            [(x, y) for x in range(-3, 40) for y in range(-2, 30)])
+        for root_x, root_y in [(0, 0), (4, 8), (5, 1)]:
+            local = g.get_local_chip_coordinate_batch(xys, root_x, root_y)
+            self.assertEqual(xys.shape, local.shape)
+            self.assertEqual(
+                [g.get_local_chip_coordinate(x, y, root_x, root_y)
+                 for x, y in xys.tolist()],
+                [tuple(xy) for xy in local.tolist()])
+            ethernets = g.get_ethernet_chip_coordinates_batch(
+                xys, 36, 24, root_x, root_y)
+            self.assertEqual(
+                [g.get_ethernet_chip_coordinates(
+                    x, y, 36, 24, root_x, root_y) for x, y in xys.tolist()],
+                [tuple(xy) for xy in ethernets.tolist()])
+
+    def test_batch_shapes(self):
+        g = SpiNNakerTriadGeometry.get_spinn5_geometry()
+        self.assertEqual([4, 4], g.get_local_chip_coordinate_batch(
+            (8, 12)).tolist())
+        grid = numpy.stack(numpy.meshgrid(
+            numpy.arange(12), numpy.arange(12)), axis=-1)
+        ethernets = g.get_ethernet_chip_coordinates_batch(grid, 12, 12)
+        self.assertEqual((12, 12, 2), ethernets.shape)
+        self.assertEqual(
+            {(0, 0), (4, 8), (8, 4)},
+            {tuple(xy) for xy in ethernets.reshape(-1, 2).tolist()})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -13,13 +13,15 @@
 # limitations under the License.
 
 import unittest
+import numpy
 from spinn_utilities.config_holder import set_config
 from spinn_machine.config_setup import unittest_setup
 from spinn_machine import Chip, Link, Router, virtual_machine
 from spinn_machine.exceptions import (
     SpinnMachineException, SpinnMachineAlreadyExistsException)
 from spinn_machine.ignores import IgnoreChip, IgnoreCore, IgnoreLink
-from spinn_machine.machine_factory import machine_repair
+from spinn_machine.machine_factory import (
+    machine_repair, machine_repair_components)
 from spinn_machine.version.version_5 import CHIPS_PER_BOARD
 from .geometry import (to_xyz, shortest_mesh_path_length,
                        shortest_torus_path_length, minimise_xyz)
@@ -857,6 +859,52 @@ class TestVirtualMachine(unittest.TestCase):
                 min2 = machine._minimize_vector(x, y)
                 self.assertEqual(min1, min2)
 
+    def test_minimize_vectors(self):
+        set_config("Machine", "version", 3)
+        machine = virtual_machine(2, 2, validate=False)
+        xs, ys = numpy.meshgrid(numpy.arange(-3, 3), numpy.arange(-3, 3))
+        vectors = machine._minimize_vectors(xs.ravel(), ys.ravel())
+        lengths = machine._minimized_lengths(xs.ravel(), ys.ravel())
+        for x, y, vector, length in zip(
+                xs.ravel(), ys.ravel(), vectors, lengths):
+            self.assertEqual(minimise_xyz((x, y, 0)), tuple(vector))
+            self.assertEqual(max(vector) - min(vector), length)
+
+    def _check_batch_vectors(self, width, height):
+        set_config("Machine", "version", 5)
+        machine = virtual_machine(width, height, validate=False)
+        xys = list(machine.chip_coordinates)
+        sources = numpy.array([s for s in xys for _ in xys])
+        targets = numpy.array([t for _ in xys for t in xys])
+        lengths = machine.get_vector_lengths(sources, targets)
+        vectors = machine.get_vectors(sources, targets)
+        self.assertEqual((len(xys) * len(xys), ), lengths.shape)
+        self.assertEqual((len(xys) * len(xys), 3), vectors.shape)
+        for source, target, length, vector in zip(
+                sources, targets, lengths, vectors):
+            source = tuple(source)
+            target = tuple(target)
+            self.assertEqual(
+                machine.get_vector_length(source, target), length)
+            self.assertEqual(
+                machine.get_vector(source, target), tuple(vector))
+        # A single source broadcast against many targets
+        self.assertEqual(
+            [machine.get_vector_length(xys[3], t) for t in xys],
+            list(machine.get_vector_lengths(xys[3], xys)))
+
+    def test_nowrap_batch_vectors(self):
+        self._check_batch_vectors(16, 16)
+
+    def test_fullwrap_batch_vectors(self):
+        self._check_batch_vectors(12, 24)
+
+    def test_horizontal_wrap_batch_vectors(self):
+        self._check_batch_vectors(12, 16)
+
+    def test_vertical_wrap_batch_vectors(self):
+        self._check_batch_vectors(16, 12)
+
     def test_unreachable_incoming_chips(self):
         set_config("Machine", "version", 5)
         machine = virtual_machine(8, 8)
@@ -955,6 +1003,95 @@ class TestVirtualMachine(unittest.TestCase):
         self.assertIsNotNone(new_machine)
         self.assertFalse(new_machine.is_link_at(2, 2, 1))
 
+    def test_repair_components_group(self):
+        set_config("Machine", "version", 5)
+        machine = virtual_machine(8, 8)
+        # Cut a pair of chips off from the rest in both directions
+        group = {(3, 3), (4, 3)}
+        for (x, y) in group:
+            for link in list(machine[x, y].router.links):
+                dest = (link.destination_x, link.destination_y)
+                if dest not in group:
+                    back = (link.source_link_id + 3) % 6
+                    del machine[x, y].router._links[link.source_link_id]
+                    del machine[dest].router._links[back]
+        set_config("Machine", "repair_machine", True)
+        # Each chip can reach the other so the local check keeps them
+        self.assertTrue(machine_repair(machine).is_chip_at(3, 3))
+        set_config("Machine", "repair_machine", False)
+        with self.assertRaises(SpinnMachineException):
+            machine_repair_components(machine)
+        set_config("Machine", "repair_machine", True)
+        repaired = machine_repair_components(machine)
+        self.assertEqual(machine.n_chips - 2, repaired.n_chips)
+        self.assertFalse(repaired.is_chip_at(3, 3))
+        self.assertFalse(repaired.is_chip_at(4, 3))
+        self.assertEqual([], list(repaired.one_way_links()))
+
+    def test_repair_components_one_way_links(self):
+        set_config("Machine", "version", 5)
+        machine = virtual_machine(12, 12)
+        down_links = [
+            (7, 7, 0), (7, 3, 1), (6, 7, 2), (4, 7, 3), (8, 6, 4), (8, 4, 5)]
+        for (x, y, link) in down_links:
+            del machine._chips[x, y].router._links[link]
+        set_config("Machine", "repair_machine", False)
+        with self.assertRaises(SpinnMachineException):
+            machine_repair_components(machine)
+        set_config("Machine", "repair_machine", True)
+        repaired = machine_repair_components(machine)
+        self.assertEqual(machine.n_chips, repaired.n_chips)
+        self.assertEqual([], list(repaired.one_way_links()))
+        for (x, y, link) in down_links:
+            dest_x, dest_y = machine.xy_over_link(x, y, link)
+            self.assertFalse(
+                repaired.is_link_at(dest_x, dest_y, (link + 3) % 6))
+
+    def test_repair_components_parents(self):
+        set_config("Machine", "version", 5)
+        machine = virtual_machine(8, 8)
+        # (2, 2) has a parent that has gone and (3, 3) has it as a parent
+        machine[2, 2]._parent_link = 4
+        machine[3, 3]._parent_link = 4
+        machine[5, 5]._parent_link = 3
+        del machine._chips[1, 1]
+        set_config("Machine", "repair_machine", False)
+        with self.assertRaises(SpinnMachineException):
+            machine_repair_components(machine, [(1, 1)])
+        set_config("Machine", "repair_machine", True)
+        repaired = machine_repair_components(machine, [(1, 1)])
+        self.assertFalse(repaired.is_chip_at(2, 2))
+        self.assertFalse(repaired.is_chip_at(3, 3))
+        self.assertTrue(repaired.is_chip_at(5, 5))
+        self.assertFalse(repaired.is_link_at(4, 4, 4))
+
+    def test_repair_components_in_place(self):
+        set_config("Machine", "version", 5)
+        set_config("Machine", "repair_machine", True)
+        set_config("Machine", "down_chips", "1,1")
+        machine = virtual_machine(12, 12)
+        machine[2, 2]._parent_link = 4
+        machine.remove_link(5, 5, 0)
+        repaired = machine_repair_components(machine)
+        self.assertTrue(machine.is_chip_at(2, 2))
+        self.assertIs(
+            machine, machine_repair_components(machine, in_place=True))
+        self.assertEqual(repaired.n_chips, machine.n_chips)
+        self.assertEqual(repaired.summary_string(), machine.summary_string())
+        self.assertFalse(machine.is_chip_at(2, 2))
+        self.assertFalse(machine.is_link_at(6, 5, 3))
+        self.assertEqual([], list(machine.one_way_links()))
+
+    def test_repair_components_unchanged(self):
+        set_config("Machine", "version", 5)
+        machine = virtual_machine(8, 8)
+        self.assertIs(machine, machine_repair_components(machine))
+        del machine._chips[(3, 3)]
+        set_config("Machine", "repair_machine", False)
+        repaired = machine_repair_components(machine, [(3, 3)])
+        self.assertFalse(repaired.is_link_at(2, 2, 1))
+        self.assertEqual(machine.n_chips, repaired.n_chips)
+
     def test_ignores(self):
         set_config("Machine", "version", 5)
         set_config("Machine", "down_chips", "2,2:4,4:6,6,ignored_ip")
@@ -1086,6 +1223,20 @@ class TestVirtualMachine(unittest.TestCase):
         n_cores = sum(chip.n_processors for chip in machine.chips)
         self.assertEqual(n_cores, 4 * 18)
 
+    def test_processor_ids_shared(self):
+        set_config("Machine", "version", 5)
+        set_config("Machine", "down_cores", "1,1,5")
+        machine = virtual_machine(8, 8)
+        chip_a = machine[0, 0]
+        chip_b = machine[2, 3]
+        self.assertEqual(chip_a.n_processors, chip_b.n_processors)
+        self.assertIs(chip_a.placable_processors_ids,
+                      chip_b.placable_processors_ids)
+        self.assertIs(chip_a.scamp_processors_ids,
+                      chip_b.scamp_processors_ids)
+        self.assertNotIn(5, machine[1, 1].placable_processors_ids)
+        self.assertIn(5, chip_a.placable_processors_ids)
+
 
 if __name__ == '__main__':
     unittest.main()